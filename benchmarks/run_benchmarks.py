@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════
+                    FASTR BENCHMARKS
+═══════════════════════════════════════════════════════════════════════
+
+Times the hot stages of the slide tools on a synthetic corpus (see
+benchmarks/synthetic.py) so performance work can be measured.
+
+Run and print timings:
+    python3 benchmarks/run_benchmarks.py
+
+Save a baseline:
+    python3 benchmarks/run_benchmarks.py --save benchmarks/baseline.json
+
+Compare against a baseline (exit code 1 if any stage regressed by more
+than the threshold):
+    python3 benchmarks/run_benchmarks.py --compare benchmarks/baseline.json --threshold 0.25
+
+Corpus size:
+    --markers N      slide markers in the methodology file
+    --topics M       core_content topics
+    --variables K    country_data variables
+    --overrides O    workshop asset overrides
+
+Baselines are only comparable on the same machine with the same sizes.
+═══════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import shlex
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOLS_DIR = os.path.join(REPO_ROOT, 'tools')
+PLUGINS_DIR = os.path.join(REPO_ROOT, 'methodology', 'plugins')
+
+sys.path.insert(0, TOOLS_DIR)
+sys.path.insert(0, PLUGINS_DIR)
+
+from synthetic import make_corpus
+
+BASELINE_VERSION = 1
+
+# Stages faster than this are too noisy to fail a comparison on
+DEFAULT_MIN_SECONDS = 0.001
+
+
+def load_tool(filename, name):
+    """Import a tools/NN_*.py script as a module"""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(TOOLS_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def time_stage(func, repeat, setup=None):
+    """
+    Run func() `repeat` times after one warm-up call.
+
+    setup() (if given) runs before every call and is not timed.
+    Returns {'min', 'median', 'repeat'} in seconds.
+    """
+    times = []
+    for i in range(repeat + 1):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if i:
+            times.append(elapsed)
+    return {'min': min(times), 'median': statistics.median(times), 'repeat': repeat}
+
+
+def quiet(func):
+    """Wrap func so its console output is discarded"""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func()
+    return run
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# STAGES
+# ═══════════════════════════════════════════════════════════════════════
+
+def run_benchmarks(corpus, repeat):
+    """Time every stage against a generated corpus; returns {stage: timing}"""
+    extract = load_tool('00_extract_slides.py', 'extract_slides')
+    build = load_tool('02_build_deck.py', 'build_deck')
+    convert = load_tool('03_convert_pptx.py', 'convert_pptx')
+    from slide_markers import strip_slide_blocks
+
+    base_dir = corpus['base_dir']
+    workshop_id = corpus['workshop_id']
+    results = {}
+
+    def record(name, func, setup=None):
+        results[name] = time_stage(func, repeat, setup)
+        print(f"   {name:<40} {results[name]['min'] * 1000:10.2f} ms")
+
+    # 00: marker parsing
+    with open(corpus['methodology_file'], 'r', encoding='utf-8') as f:
+        methodology = f.read()
+    record('extract.find_slide_markers', lambda: extract.find_slide_markers(methodology))
+
+    # 02: variable substitution, cold (template cache cleared) and warm
+    with contextlib.redirect_stdout(io.StringIO()):
+        config = build.load_workshop_config(workshop_id, base_dir)
+        build.load_modules(base_dir)
+    core_files = []
+    for root, _, names in os.walk(os.path.join(base_dir, 'core_content')):
+        core_files.extend(os.path.join(root, name) for name in sorted(names) if name.endswith('.md'))
+    core_text = ''.join(open(path, encoding='utf-8').read() for path in sorted(core_files))
+
+    record('build.substitute_variables (cold)',
+           lambda: build.substitute_variables(core_text, config),
+           setup=build.compile_template.cache_clear)
+    record('build.substitute_variables (warm)',
+           lambda: build.substitute_variables(core_text, config))
+
+    # 02: asset overrides, with the asset index built once as in a build
+    asset_index = build.build_asset_index(base_dir, workshop_id)
+    workshop_assets = build.list_workshop_assets(workshop_id, base_dir, asset_index)
+    record('build.build_asset_index', lambda: build.build_asset_index(base_dir, workshop_id))
+    record('build.resolve_asset_overrides',
+           lambda: build.resolve_asset_overrides(core_text, workshop_id, base_dir, workshop_assets))
+
+    # 02: schedule
+    sessions = [item for item in config['deck_order']
+                if not item.endswith('.md') and item != 'agenda']
+    record('build.generate_schedule',
+           lambda: build.generate_schedule(sessions, corpus['days'], config))
+
+    # 02: whole deck, without and with the transform cache, and up to date
+    def build_deck(use_cache=False, incremental=False):
+        return quiet(lambda: build.build_workshop_deck(
+            workshop_id, base_dir, skip_confirmation=True, override_days=corpus['days'],
+            use_cache=use_cache, incremental=incremental))
+
+    record('build.build_workshop_deck', build_deck())
+    record('build.build_workshop_deck (cached)', build_deck(use_cache=True))
+    record('build.build_workshop_deck (up to date)', build_deck(incremental=True))
+
+    # 03: PowerPoint pre-processing of the built deck
+    deck_path = os.path.join(base_dir, 'outputs', f"{workshop_id}_deck.md")
+    with open(deck_path, 'r', encoding='utf-8') as f:
+        deck = convert.strip_marp_frontmatter(f.read())
+    record('convert.convert_slide_breaks', lambda: convert.convert_slide_breaks(deck))
+    record('convert.fix_image_paths', quiet(lambda: convert.fix_image_paths(deck, base_dir)))
+
+    # 04: PDF rendering with the stand-in renderer, every chunk rendered and
+    # every chunk from the cache
+    render = load_tool('04_render_pdf.py', 'render_pdf')
+    stub = ' '.join(shlex.quote(arg) for arg in (sys.executable, os.path.join(BENCH_DIR, 'stub_renderer.py')))
+    pdf_cache_dir = os.path.join(base_dir, '.fastr_cache', 'pdf')
+    render_pdf = quiet(lambda: render.render_deck_pdf(deck_path, base_dir, renderer=f"{stub} {{input}} {{output}}"))
+    record('render.render_deck_pdf (cold)', render_pdf,
+           setup=lambda: shutil.rmtree(pdf_cache_dir, ignore_errors=True))
+    record('render.render_deck_pdf (cached)', render_pdf)
+
+    # MkDocs plugin (needs mkdocs) and the parser it wraps
+    record('slide_markers.strip_slide_blocks', lambda: strip_slide_blocks(methodology))
+    try:
+        from strip_slides import StripSlidesPlugin
+    except ImportError:
+        print(f"   {'strip_slides.on_page_markdown':<40}    skipped (mkdocs not installed)")
+    else:
+        plugin = StripSlidesPlugin()
+        page = type('Page', (), {'file': type('File', (), {'src_path': 'synthetic.md'})()})()
+        record('strip_slides.on_page_markdown',
+               lambda: plugin.on_page_markdown(methodology, page, None, None))
+
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# BASELINES
+# ═══════════════════════════════════════════════════════════════════════
+
+def compare(results, baseline, threshold, min_seconds=DEFAULT_MIN_SECONDS):
+    """
+    Print a comparison table; returns the names of regressed stages.
+
+    A stage regresses if its best time is more than `threshold` (a
+    fraction) slower than the baseline's and the baseline is above
+    min_seconds. Stages missing on either side are reported, not failed.
+    """
+    regressions = []
+    print(f"\n   {'Stage':<40} {'Baseline':>10} {'Now':>10} {'Change':>8}")
+    print(f"   {'-' * 40} {'-' * 10} {'-' * 10} {'-' * 8}")
+
+    for name in sorted(set(results) | set(baseline['stages'])):
+        if name not in results or name not in baseline['stages']:
+            where = "baseline" if name not in results else "this run"
+            print(f"   {name:<40} {'(only in ' + where + ')':>30}")
+            continue
+        before = baseline['stages'][name]['min']
+        now = results[name]['min']
+        change = (now - before) / before if before else 0.0
+        flag = ""
+        if change > threshold and before >= min_seconds:
+            regressions.append(name)
+            flag = "  ❌"
+        print(f"   {name:<40} {before * 1000:8.2f}ms {now * 1000:8.2f}ms {change:+7.0%}{flag}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the FASTR slide tools on a synthetic corpus",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--markers', type=int, default=500, help='Slide markers in the methodology file')
+    parser.add_argument('--topics', type=int, default=120, help='core_content topics')
+    parser.add_argument('--variables', type=int, default=200, help='country_data variables')
+    parser.add_argument('--overrides', type=int, default=300, help='Workshop asset overrides')
+    parser.add_argument('--days', type=int, default=5, choices=[1, 2, 3, 4, 5], help='Workshop days')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per stage (best is kept)')
+    parser.add_argument('--save', metavar='PATH', help='Write results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='Compare against a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed slowdown before a stage counts as regressed (default: 0.25 = 25%%)')
+    parser.add_argument('--keep', metavar='DIR', help='Generate the corpus in DIR and keep it')
+    args = parser.parse_args()
+
+    params = {key: getattr(args, key) for key in ('markers', 'topics', 'variables', 'overrides', 'days')}
+
+    print("\n" + "═" * 70)
+    print("              FASTR BENCHMARKS")
+    print("═" * 70)
+    print(f"\n📂 Corpus: {args.markers} markers, {args.topics} topics, "
+          f"{args.variables} variables, {args.overrides} overrides, {args.days} days\n")
+
+    with contextlib.ExitStack() as stack:
+        base_dir = args.keep or stack.enter_context(tempfile.TemporaryDirectory(prefix='fastr-bench-'))
+        os.makedirs(base_dir, exist_ok=True)
+        corpus = make_corpus(base_dir, **params)
+        results = run_benchmarks(corpus, args.repeat)
+
+    report = {
+        'version': BASELINE_VERSION,
+        'params': params,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'stages': results,
+    }
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\n✅ Baseline saved: {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('params') != params:
+            print(f"\n⚠️  Baseline was recorded with different sizes: {baseline.get('params')}")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} stage(s) regressed by more than {args.threshold:.0%}: "
+                  f"{', '.join(regressions)}\n")
+            sys.exit(1)
+        print(f"\n✅ No stage regressed by more than {args.threshold:.0%}\n")
+
+
+if __name__ == "__main__":
+    main()
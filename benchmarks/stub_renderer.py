@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+A stand-in for `marp --pdf`, for benchmarks and tests without Node.js.
+
+    python3 benchmarks/stub_renderer.py INPUT.md OUTPUT.pdf
+
+Writes a PDF with one 1280x720 px page per slide of INPUT.md, showing the
+slide's first heading, as Marp would lay the pages out. Use it with
+tools/04_render_pdf.py:
+
+    python3 tools/04_render_pdf.py outputs/deck.md \\
+        --renderer 'python3 benchmarks/stub_renderer.py {input} {output}'
+
+STUB_RENDER_DELAY (seconds per slide, default 0) slows it down to stand in
+for a real render.
+"""
+
+import os
+import re
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'tools'))
+
+from deck_chunks import split_frontmatter, split_slides
+
+HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.*)$', re.M)
+PAGE_WIDTH, PAGE_HEIGHT = 960, 540  # points: 1280x720 px at 96 dpi
+
+
+def slide_titles(markdown):
+    """First heading of every slide ('' for slides without one)"""
+    _, body = split_frontmatter(markdown)
+    titles = []
+    for slide in split_slides(body):
+        match = HEADING_PATTERN.search(slide)
+        titles.append(match.group(1).strip() if match else '')
+    return titles
+
+
+def pdf_text(text):
+    """A PDF literal string for text (Latin-1, other characters as '?')"""
+    text = text.encode('latin-1', 'replace').decode('latin-1')
+    return '(' + text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') + ')'
+
+
+def write_pdf(titles, output_path):
+    """A PDF with one page per title"""
+    count = len(titles)
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [%s] /Count %d >>' % (' '.join(f'{4 + 2 * i} 0 R' for i in range(count)), count),
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for i, title in enumerate(titles):
+        content = f'BT /F1 28 Tf 60 460 Td {pdf_text(title)} Tj ET'
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>')
+        objects.append(f'<< /Length {len(content)} >>\nstream\n{content}\nendstream')
+
+    data = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for num, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += f'{num} 0 obj\n{body}\nendobj\n'.encode('latin-1')
+    xref = len(data)
+    data += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    data += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode()
+    data += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    with open(output_path, 'wb') as f:
+        f.write(data)
+
+
+def main():
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(2)
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        titles = slide_titles(f.read())
+    time.sleep(float(os.environ.get('STUB_RENDER_DELAY', 0)) * len(titles))
+    write_pdf(titles, sys.argv[2])
+
+
+if __name__ == '__main__':
+    main()
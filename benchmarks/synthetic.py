@@ -0,0 +1,193 @@
+"""
+Synthetic inputs for the FASTR benchmarks.
+
+Generates a throwaway repository layout that the tools can run against:
+
+    methodology/synthetic.md        N slide marker blocks between doc text
+    core_content/mX_.../*.md        M topics spread over modules 0-7, each
+                                    with slides, tables, {{variables}} and
+                                    overridable ../assets/ images
+    core_content/slide_index.json
+    templates/                      copied from the real repository
+    workshops/<id>/workshop.yaml    K country_data variables, a multi-day
+                                    agenda and deck_order covering every module
+    workshops/<id>/assets/...       O asset overrides
+
+Output is deterministic for a given seed.
+"""
+
+import os
+import random
+import shutil
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'tools'))
+
+from slide_index import scan_core_content, write_index
+
+NUM_MODULES = 8
+WORKSHOP_ID = 'bench-workshop'
+
+WORDS = ("data quality facility reporting completeness outlier service volume "
+         "coverage indicator district analysis adjustment national subnational "
+         "monthly survey population estimate trend disruption").split()
+
+
+def _sentence(rng, words=12):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _slide(rng, title, variables, images):
+    """One slide: heading, bullets, a small table and optional image/variables"""
+    lines = [f"# {title}", ""]
+    for _ in range(4):
+        line = f"- {_sentence(rng, 8)}"
+        if variables and rng.random() < 0.5:
+            line += f" ({{{{{rng.choice(variables)}}}}})"
+        lines.append(line)
+    lines += ["", "| Indicator | Value |", "|-----------|-------|"]
+    for _ in range(3):
+        value = f"{{{{{rng.choice(variables)}}}}}" if variables else str(rng.randint(1, 99))
+        lines.append(f"| {rng.choice(WORDS).title()} | {value} |")
+    for image in images:
+        lines += ["", f"![{rng.choice(WORDS)}]({image})"]
+    return '\n'.join(lines) + '\n'
+
+
+def image_path(index):
+    """Reference to a default asset that a workshop may override"""
+    return f"../assets/fastr-outputs/output_{index:04d}.png"
+
+
+def write_methodology(base_dir, markers, seed=0):
+    """Write methodology/synthetic.md with `markers` slide blocks"""
+    rng = random.Random(seed)
+    methodology_dir = os.path.join(base_dir, 'methodology')
+    os.makedirs(methodology_dir, exist_ok=True)
+    path = os.path.join(methodology_dir, 'synthetic.md')
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("# Synthetic methodology\n\n")
+        for i in range(markers):
+            module, topic = i % NUM_MODULES, i // NUM_MODULES + 1
+            f.write(f"## Section {i}\n\n{_sentence(rng, 40)}\n\n")
+            f.write(f"<!-- SLIDE:m{module}_{topic} -->\n")
+            f.write(_slide(rng, f"Slide {i}", [], []))
+            f.write("<!-- /SLIDE -->\n\n")
+            f.write(f"{_sentence(rng, 30)}\n\n")
+    return path
+
+
+def write_core_content(base_dir, topics, variables, images_per_topic=3, slides_per_topic=6, seed=0):
+    """
+    Write `topics` topic files spread over modules 0-7 plus the slide index.
+
+    Returns the number of distinct images referenced.
+    """
+    rng = random.Random(seed)
+    core_dir = os.path.join(base_dir, 'core_content')
+    image_count = 0
+
+    for i in range(topics):
+        module, topic = i % NUM_MODULES, i // NUM_MODULES + 1
+        folder = os.path.join(core_dir, f"m{module}_synthetic_module_{module}")
+        os.makedirs(folder, exist_ok=True)
+
+        slides = []
+        for s in range(slides_per_topic):
+            images = []
+            if s < images_per_topic:
+                images.append(image_path(image_count))
+                image_count += 1
+            slides.append(_slide(rng, f"Topic {module}.{topic} slide {s + 1}", variables, images))
+
+        content = "---\nmarp: true\ntheme: fastr\n---\n\n" + "\n---\n\n".join(slides)
+        with open(os.path.join(folder, f"m{module}_{topic}_synthetic_topic_{topic}.md"),
+                  'w', encoding='utf-8') as f:
+            f.write(content)
+
+    write_index(base_dir, scan_core_content(base_dir))
+    return image_count
+
+
+def write_workshop(base_dir, variables, overrides, days=5, workshop_id=WORKSHOP_ID):
+    """Write workshops/<id>/ with workshop.yaml, custom slides and asset overrides"""
+    workshop_dir = os.path.join(base_dir, 'workshops', workshop_id)
+    os.makedirs(workshop_dir, exist_ok=True)
+
+    # Asset overrides for the first `overrides` default images
+    assets_dir = os.path.join(workshop_dir, 'assets', 'fastr-outputs')
+    os.makedirs(assets_dir, exist_ok=True)
+    for i in range(overrides):
+        with open(os.path.join(assets_dir, f"output_{i:04d}.png"), 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n')
+
+    for name in ('01_objectives.md', '99_next-steps.md'):
+        with open(os.path.join(workshop_dir, name), 'w', encoding='utf-8') as f:
+            f.write(f"# {name}\n\n- Workshop in {{{{COUNTRY}}}}\n- Reporting: {{{{{variables[0]}}}}}\n")
+
+    lines = [
+        "workshop:",
+        f"  id: {workshop_id}",
+        "  name: FASTR Workshop - Benchmark",
+        "  country: Benchland",
+        "  location: Bench City",
+        "  date: January 1-5, 2026",
+        "  facilitators: TBD",
+        "",
+        "schedule:",
+        f"  days: {days}",
+        '  start_time: "9:00 AM"',
+        '  tea_time: "10:30 AM"',
+        '  lunch_time: "12:30 PM"',
+        '  afternoon_tea: "3:30 PM"',
+        "  agenda:",
+    ]
+    for day in range(1, days + 1):
+        lines.append(f"    day{day}:")
+        for time, session, kind in (("9:00 AM - 10:30 AM", f"Module {day - 1}", None),
+                                    ("10:30 AM - 10:45 AM", "Tea Break", 'break'),
+                                    ("10:45 AM - 12:30 PM", "Practical Exercises", None),
+                                    ("12:30 PM - 1:30 PM", "Lunch", 'break'),
+                                    ("1:30 PM - 5:00 PM", "Group Work", None)):
+            lines.append(f'      - time: "{time}"')
+            lines.append(f"        session: {session}")
+            if kind:
+                lines.append(f"        type: {kind}")
+
+    lines += ["", "content:", "  deck_order:", "    - agenda", "    - 01_objectives.md"]
+    lines += [f"    - m{module}" for module in range(NUM_MODULES)]
+    lines += ["    - 99_next-steps.md", "", "country_data:"]
+    lines += [f'  {name}: "value {i}"' for i, name in enumerate(variables)]
+
+    with open(os.path.join(workshop_dir, 'workshop.yaml'), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    return workshop_dir
+
+
+def make_corpus(base_dir, markers=500, topics=120, variables=200, overrides=300, days=5, seed=0):
+    """
+    Generate a complete synthetic repository under base_dir.
+
+    Returns a dict describing what was generated.
+    """
+    variable_names = [f"var_{i}" for i in range(variables)]
+
+    shutil.copytree(os.path.join(REPO_ROOT, 'templates'), os.path.join(base_dir, 'templates'),
+                    dirs_exist_ok=True)
+    os.makedirs(os.path.join(base_dir, 'outputs'), exist_ok=True)
+    os.makedirs(os.path.join(base_dir, 'resources'), exist_ok=True)
+
+    methodology_file = write_methodology(base_dir, markers, seed)
+    image_count = write_core_content(base_dir, topics, variable_names, seed=seed)
+    write_workshop(base_dir, variable_names, min(overrides, image_count), days)
+
+    return {
+        'base_dir': base_dir,
+        'workshop_id': WORKSHOP_ID,
+        'methodology_file': methodology_file,
+        'variables': variable_names,
+        'images': image_count,
+        'days': days,
+    }
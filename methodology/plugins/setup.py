@@ -4,7 +4,7 @@ setup(
     name='mkdocs-strip-slides',
     version='0.1.0',
     description='MkDocs plugin to strip slide content from methodology docs',
-    py_modules=['strip_slides'],
+    py_modules=['strip_slides', 'slide_markers'],
     install_requires=['mkdocs>=1.0'],
     entry_points={
         'mkdocs.plugins': [
@@ -0,0 +1,141 @@
+"""
+Streaming parser for slide markers in methodology docs.
+
+Slide content is wrapped in marker comments:
+
+    <!-- SLIDE:m4_1 -->
+    # Slide Title
+    ...
+    <!-- /SLIDE -->
+
+This module is shared by tools/00_extract_slides.py (which extracts the
+blocks into core_content/) and the strip-slides MkDocs plugin (which hides
+them from the documentation site). Input is consumed one line at a time in a
+single pass, so cost is linear in the size of the file and whole files never
+need to be held in memory.
+"""
+
+import re
+from collections import namedtuple
+
+# Matches either an opening <!-- SLIDE:id --> or a closing <!-- /SLIDE -->
+# marker. Only ever applied to a single line.
+MARKER_PATTERN = re.compile(r'<!--\s*(?:SLIDE:(\w+)|/SLIDE)\s*-->')
+
+# A slide block: marker ID, content between the markers (stripped), and the
+# 1-based line numbers of the opening and closing markers.
+SlideBlock = namedtuple('SlideBlock', ['slide_id', 'content', 'start_line', 'end_line'])
+
+
+class SlideMarkerError(ValueError):
+    """Raised for nested, unmatched or unterminated slide markers."""
+
+    def __init__(self, message, line=None, source=None):
+        self.line = line
+        self.source = source
+        location = ""
+        if source:
+            location = f"{source}:"
+        if line is not None:
+            location += f"{line}: "
+        elif location:
+            location += " "
+        super().__init__(location + message)
+
+
+def _iter_lines(text_or_lines):
+    """Accept either a string or an iterable of lines (e.g. an open file)."""
+    if isinstance(text_or_lines, str):
+        return iter(text_or_lines.splitlines(keepends=True))
+    return iter(text_or_lines)
+
+
+def _iter_segments(lines, source=None):
+    """
+    Split input into text segments tagged as inside or outside a slide block.
+
+    Yields (kind, value, line_no) tuples where kind is one of:
+        'outside' - text outside any slide block
+        'inside'  - text inside the current slide block
+        'open'    - opening marker; value is the slide ID
+        'close'   - closing marker; value is the slide ID being closed
+
+    Raises SlideMarkerError for nested, unmatched or unterminated markers.
+    """
+    open_id = None
+    open_line = None
+    line_no = 0
+
+    for line_no, line in enumerate(_iter_lines(lines), 1):
+        kind = 'inside' if open_id else 'outside'
+
+        # Fast path: most lines contain no comment at all
+        if '<!--' not in line:
+            yield (kind, line, line_no)
+            continue
+
+        pos = 0
+        for match in MARKER_PATTERN.finditer(line):
+            if match.start() > pos:
+                yield (kind, line[pos:match.start()], line_no)
+            pos = match.end()
+
+            slide_id = match.group(1)
+            if slide_id is not None:
+                if open_id:
+                    raise SlideMarkerError(
+                        f"nested SLIDE:{slide_id} marker inside SLIDE:{open_id} "
+                        f"(opened at line {open_line})",
+                        line=line_no, source=source)
+                open_id, open_line = slide_id, line_no
+                yield ('open', slide_id, line_no)
+                kind = 'inside'
+            else:
+                if not open_id:
+                    raise SlideMarkerError(
+                        "closing /SLIDE marker without a matching SLIDE marker",
+                        line=line_no, source=source)
+                yield ('close', open_id, line_no)
+                open_id, open_line = None, None
+                kind = 'outside'
+
+        if pos < len(line):
+            yield (kind, line[pos:], line_no)
+
+    if open_id:
+        raise SlideMarkerError(
+            f"SLIDE:{open_id} opened at line {open_line} is never closed "
+            f"(reached end of file at line {line_no})",
+            line=open_line, source=source)
+
+
+def iter_slide_blocks(lines, source=None):
+    """
+    Lazily yield SlideBlock tuples from a string or iterable of lines.
+
+    Content between markers is stripped of leading/trailing whitespace but
+    internal formatting is preserved. `source` is only used in error messages.
+    """
+    parts = None
+    start_line = None
+
+    for kind, value, line_no in _iter_segments(lines, source):
+        if kind == 'open':
+            parts = []
+            start_line = line_no
+        elif kind == 'inside':
+            parts.append(value)
+        elif kind == 'close':
+            yield SlideBlock(value, ''.join(parts).strip(), start_line, line_no)
+            parts = None
+
+
+def strip_slide_blocks(lines, source=None):
+    """
+    Return the input with every slide block (markers included) removed.
+
+    Runs of three or more newlines left behind are collapsed to two.
+    """
+    kept = [value for kind, value, _ in _iter_segments(lines, source)
+            if kind == 'outside']
+    return re.sub(r'\n{3,}', '\n\n', ''.join(kept))
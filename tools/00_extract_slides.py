@@ -8,6 +8,7 @@ Step 0: Extract slide content from methodology documentation.
 
 USAGE:
     python3 tools/00_extract_slides.py
+    python3 tools/00_extract_slides.py --watch    (re-extract on every save)
 
 This script:
 1. Scans methodology/*.md files for <!-- SLIDE:xxx --> markers
@@ -16,6 +17,20 @@ This script:
 
 Run this ONCE when setting up, or whenever methodology docs change.
 
+Extraction also writes core_content/slide_index.json, the slide index read
+by the workshop wizard and deck builder (see tools/slide_index.py).
+
+Re-runs are incremental: a manifest of content hashes
+(core_content/.extract_manifest.json) records every source file and every
+extracted slide. Unchanged methodology files are skipped and unchanged slide
+files are not rewritten, so their modification times are preserved.
+Within a changed file, marker blocks whose content is unchanged are not
+re-extracted either. Use --force to re-extract everything.
+
+With --watch the tool keeps running and re-extracts whenever a file in
+methodology/ is saved. Run `02_build_deck.py --watch` alongside it to
+rebuild the affected deck sections as well.
+
 MARKER FORMAT:
     <!-- SLIDE:m4_1 -->
     # Slide Title
@@ -30,9 +45,15 @@ The marker ID (e.g., m4_1) determines:
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
+import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -41,17 +62,25 @@ from pathlib import Path
 
 def ensure_venv():
     """Re-execute with venv Python if not already in venv."""
-    if sys.prefix != sys.base_prefix:
+    if sys.prefix != sys.base_prefix or os.environ.get('FASTR_VENV_REEXEC'):
         return
     script_dir = Path(__file__).resolve().parent
     project_root = script_dir.parent
     for venv_name in ['.venv', 'venv']:
         venv_python = project_root / venv_name / 'bin' / 'python3'
         if venv_python.exists():
+            os.environ['FASTR_VENV_REEXEC'] = '1'
             os.execv(str(venv_python), [str(venv_python)] + sys.argv)
 
 ensure_venv()
 
+# The slide marker parser is shared with the strip-slides MkDocs plugin
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'methodology' / 'plugins'))
+from slide_markers import SlideMarkerError, iter_slide_blocks
+from slide_index import analyze_slide_content, build_index, write_index
+from tracing import TRACER, add_tracing_arguments, run_instrumented, span, worker_init, worker_settings
+from file_watcher import DEFAULT_DEBOUNCE, add_watch_arguments, watch
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -136,6 +165,13 @@ paginate: true
 
 """
 
+# Manifest of source and output hashes used for incremental re-extraction.
+# Bump MANIFEST_VERSION whenever the transform (frontmatter, image path
+# fixing) or the per-slide statistics change, so existing manifests are
+# discarded and everything is re-extracted once.
+MANIFEST_FILENAME = '.extract_manifest.json'
+MANIFEST_VERSION = 3
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # EXTRACTION FUNCTIONS
@@ -146,17 +182,9 @@ def find_slide_markers(content):
     Find all <!-- SLIDE:xxx --> ... <!-- /SLIDE --> blocks in content.
 
     Returns list of (slide_id, content) tuples.
+    Raises SlideMarkerError for nested, unmatched or unterminated markers.
     """
-    pattern = r'<!--\s*SLIDE:(\w+)\s*-->(.*?)<!--\s*/SLIDE\s*-->'
-    matches = re.findall(pattern, content, re.DOTALL)
-
-    results = []
-    for slide_id, slide_content in matches:
-        # Clean up the content (remove leading/trailing whitespace but preserve internal formatting)
-        cleaned = slide_content.strip()
-        results.append((slide_id, cleaned))
-
-    return results
+    return [(block.slide_id, block.content) for block in iter_slide_blocks(content)]
 
 
 def parse_slide_id(slide_id):
@@ -241,11 +269,341 @@ def fix_image_paths(content, source_file):
     return re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', replace_image, content)
 
 
-def extract_slides(base_dir):
+def content_hash(text):
+    """Return the SHA-256 hex digest of a string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def get_manifest_path(base_dir):
+    """Location of the extraction manifest."""
+    return os.path.join(base_dir, 'core_content', MANIFEST_FILENAME)
+
+
+def load_manifest(base_dir):
+    """
+    Load the extraction manifest.
+
+    Returns an empty manifest if none exists, it cannot be parsed, or it was
+    written by an older version of the transform.
+    """
+    empty = {'version': MANIFEST_VERSION, 'sources': {}, 'outputs': {}}
+    try:
+        with open(get_manifest_path(base_dir), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return empty
+
+    if manifest.get('version') != MANIFEST_VERSION:
+        return empty
+
+    manifest.setdefault('sources', {})
+    manifest.setdefault('outputs', {})
+    return manifest
+
+
+def save_manifest(base_dir, manifest):
+    """Write the extraction manifest atomically."""
+    manifest_path = get_manifest_path(base_dir)
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(temp_path, manifest_path)
+
+
+def source_is_unchanged(source_entry, source_hash, base_dir):
+    """
+    Check whether a methodology file can be skipped.
+
+    The source hash must match the manifest, and every slide file previously
+    extracted from it must still exist on disk.
+    """
+    if not source_entry or source_entry.get('hash') != source_hash:
+        return False
+    for rel_path in source_entry.get('outputs', []):
+        if not os.path.exists(os.path.join(base_dir, rel_path)):
+            return False
+    return True
+
+
+def write_if_changed(output_path, final_content, previous_hash):
+    """
+    Write an extracted slide file unless its content is unchanged.
+
+    Returns True if the file was written.
+    """
+    new_hash = content_hash(final_content)
+    if new_hash == previous_hash and os.path.exists(output_path):
+        return False
+
+    # Manifest may be missing or stale: compare against what is on disk
+    if os.path.exists(output_path):
+        with open(output_path, 'r', encoding='utf-8') as f:
+            if f.read() == final_content:
+                return False
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(final_content)
+    return True
+
+
+def transform_source(md_path, base_dir, expected_hash=None, known_blocks=None):
+    """
+    Parse and transform one methodology file without writing anything.
+
+    Safe to run in a worker process: all console output is captured and
+    returned so the collector can print it in a deterministic order.
+    If the file's hash equals expected_hash it is not parsed at all.
+    known_blocks (slide ID -> manifest entry, see known_blocks_for) lets
+    marker blocks whose content is unchanged skip the transform: only the
+    slide IDs whose blocks changed are re-extracted.
+
+    Returns a dict with:
+        filename  - methodology file name
+        hash      - content hash of the source
+        unchanged - True if the hash matched expected_hash
+        slides    - list of transformed slides (rel_path is None for slide
+                    IDs that could not be mapped to an output file;
+                    content is None for reused, unchanged blocks)
+        error     - slide marker error message, or None
+    """
+    md_file = Path(md_path)
+    with span(f"extract {md_file.name}", category='extract'):
+        return _transform_source(md_file, base_dir, expected_hash, known_blocks or {})
+
+
+def _transform_source(md_file, base_dir, expected_hash, known_blocks):
+    with open(md_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    result = {
+        'filename': md_file.name,
+        'hash': content_hash(content),
+        'unchanged': False,
+        'slides': [],
+        'error': None,
+    }
+
+    if result['hash'] == expected_hash:
+        result['unchanged'] = True
+        return result
+
+    # Quick check before streaming through the file
+    if 'SLIDE' not in content:
+        return result
+
+    try:
+        for block in iter_slide_blocks(io.StringIO(content), source=md_file.name):
+            block_hash = content_hash(block.content)
+            known = known_blocks.get(block.slide_id)
+            if (known and known['block_hash'] == block_hash
+                    and os.path.exists(os.path.join(base_dir, known['rel_path']))):
+                result['slides'].append({
+                    'slide_id': block.slide_id,
+                    'rel_path': known['rel_path'],
+                    'lines': [block.start_line, block.end_line],
+                    'log': '',
+                    'content': None,
+                    'block_hash': block_hash,
+                    'hash': known['hash'],
+                    'stats': known['stats'],
+                })
+                continue
+
+            log = io.StringIO()
+            with contextlib.redirect_stdout(log):
+                output_path = get_output_path(block.slide_id, base_dir)
+
+            slide = {
+                'slide_id': block.slide_id,
+                'rel_path': None,
+                'lines': [block.start_line, block.end_line],
+                'log': log.getvalue(),
+            }
+            result['slides'].append(slide)
+
+            if not output_path:
+                continue
+
+            # Fix image paths and add Marp frontmatter
+            fixed_content = fix_image_paths(block.content, md_file)
+            final_content = MARP_FRONTMATTER + fixed_content + "\n"
+
+            slide['rel_path'] = os.path.relpath(output_path, base_dir).replace(os.sep, '/')
+            slide['content'] = final_content
+            slide['block_hash'] = block_hash
+            slide['hash'] = content_hash(final_content)
+            slide['stats'] = analyze_slide_content(final_content)
+    except SlideMarkerError as e:
+        result['error'] = str(e)
+
+    return result
+
+
+def known_blocks_for(manifest, filename):
+    """Manifest entries (by slide ID) of the slides last extracted from a source"""
+    known = {}
+    for rel_path in manifest['sources'].get(filename, {}).get('outputs', []):
+        entry = manifest['outputs'].get(rel_path)
+        if entry and entry.get('block_hash'):
+            known[entry['slide_id']] = dict(entry, rel_path=rel_path)
+    return known
+
+
+def run_transforms(md_files, base_dir, manifest, jobs=1):
+    """
+    Run transform_source() over every methodology file.
+
+    With jobs > 1 the files are parsed in a process pool. Results are always
+    yielded in the order of md_files, so output is deterministic.
+    """
+    args = [(str(md_file), base_dir, manifest['sources'].get(md_file.name, {}).get('hash'),
+             known_blocks_for(manifest, md_file.name))
+            for md_file in md_files]
+
+    if jobs <= 1 or len(args) <= 1:
+        for arg in args:
+            yield transform_source(*arg)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(args)), initializer=worker_init,
+                             initargs=worker_settings()) as pool:
+        for result in pool.map(_transform_in_worker, *zip(*args)):
+            TRACER.merge(result.pop('trace'))
+            yield result
+
+
+def _transform_in_worker(md_path, base_dir, expected_hash, known_blocks):
+    """transform_source() for a pool worker: also returns the worker's trace events and memory rows"""
+    result = transform_source(md_path, base_dir, expected_hash, known_blocks)
+    result['trace'] = TRACER.drain()
+    return result
+
+
+def register_unchanged_ids(manifest, filename, seen_ids):
+    """Record the slide IDs of an unchanged source in seen_ids (ID -> "file:line")"""
+    for rel_path in manifest['sources'][filename].get('outputs', []):
+        entry = manifest['outputs'].get(rel_path, {})
+        line = entry.get('lines', [0])[0]
+        seen_ids.setdefault(entry.get('slide_id'), f"{filename}:{line}")
+
+
+def collect_source(result, base_dir, manifest, new_manifest, seen_ids, files=None):
+    """
+    Write the slides of one transformed source and record them in the manifest.
+
+    This is the single writer for core_content/. seen_ids maps each slide ID
+    to the "file:line" where it was first defined, so duplicates across files
+    are reported instead of silently overwriting each other; it must already
+    hold the IDs of every unchanged source (register_unchanged_ids()). If
+    files is a dict, the content of every slide extracted in this run is
+    added to it (absolute path -> content).
+
+    Returns (extracted_count, written_count, ok).
+    """
+    filename = result['filename']
+
+    # Unchanged source: carry its entries forward
+    if result['unchanged']:
+        source_entry = manifest['sources'][filename]
+        new_manifest['sources'][filename] = source_entry
+        for rel_path in source_entry.get('outputs', []):
+            new_manifest['outputs'][rel_path] = manifest['outputs'].get(rel_path, {})
+        return len(source_entry.get('outputs', [])), 0, True
+
+    extracted = 0
+    written_count = 0
+    ok = True
+    source_outputs = []
+
+    if result['slides'] or result['error']:
+        print(f"📄 {filename}")
+
+    for slide in result['slides']:
+        print(slide['log'], end='')
+        if not slide['rel_path']:
+            continue
+
+        slide_id = slide['slide_id']
+        location = f"{filename}:{slide['lines'][0]}"
+        if slide_id in seen_ids:
+            print(f"   ❌ Duplicate slide ID {slide_id} at {location} "
+                  f"(already defined at {seen_ids[slide_id]})")
+            ok = False
+            continue
+        seen_ids[slide_id] = location
+
+        rel_path = slide['rel_path']
+        output_path = os.path.join(base_dir, rel_path)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        # Write to file (only if content changed; reused blocks are unchanged)
+        written = False
+        if slide['content'] is not None:
+            previous = manifest['outputs'].get(rel_path, {})
+            written = write_if_changed(output_path, slide['content'], previous.get('hash'))
+            if files is not None:
+                files[os.path.abspath(output_path)] = slide['content']
+
+        source_outputs.append(rel_path)
+        new_manifest['outputs'][rel_path] = {
+            'slide_id': slide_id,
+            'source': filename,
+            'lines': slide['lines'],
+            'block_hash': slide['block_hash'],
+            'hash': slide['hash'],
+            'stats': slide['stats'],
+        }
+
+        status = "✓" if written else "="
+        suffix = "" if written else " (unchanged)"
+        print(f"   {status} {slide_id} → {os.path.basename(output_path)}{suffix}")
+        extracted += 1
+        if written:
+            written_count += 1
+
+    if result['error']:
+        print(f"   ❌ {result['error']}")
+        ok = False
+
+    # Failed sources stay out of the manifest so they are retried next run
+    if ok:
+        new_manifest['sources'][filename] = {'hash': result['hash'], 'outputs': source_outputs}
+
+    return extracted, written_count, ok
+
+
+def index_from_manifest(manifest):
+    """Build the shared slide index from the extraction manifest."""
+    slides = {}
+    for rel_path, entry in manifest['outputs'].items():
+        record = {
+            'file': rel_path.split('/', 1)[1],  # relative to core_content/
+            'source': entry['source'],
+            'lines': entry['lines'],
+            'hash': entry['hash'],
+        }
+        record.update(entry['stats'])
+        slides[entry['slide_id']] = record
+    return build_index(slides)
+
+
+def extract_slides(base_dir, force=False, jobs=1, collect=None):
     """
     Main extraction function.
 
     Scans methodology/*.md files and extracts slide content.
+    Files whose content hash matches the manifest are skipped; slide files
+    whose content is unchanged are left untouched. Pass force=True to
+    ignore the manifest and re-extract everything.
+
+    With jobs > 1, methodology files are parsed and transformed in parallel;
+    all writes still go through a single collector in this process.
+
+    collect (optional dict) receives the results for the next stage of an
+    in-process pipeline: 'files' (absolute path -> content of each slide
+    extracted in this run) and 'index' (the slide index, if it was built).
     """
     methodology_dir = os.path.join(base_dir, 'methodology')
 
@@ -259,56 +617,90 @@ def extract_slides(base_dir):
     print("═" * 70 + "\n")
 
     # Find all markdown files in methodology
-    md_files = list(Path(methodology_dir).glob('*.md'))
+    md_files = sorted(Path(methodology_dir).glob('*.md'))
 
     if not md_files:
         print("❌ No markdown files found in methodology/")
         return False
 
-    print(f"📂 Scanning {len(md_files)} methodology files...\n")
-
-    total_extracted = 0
-
-    for md_file in sorted(md_files):
-        filename = md_file.name
-
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        slides = find_slide_markers(content)
+    jobs_note = f" with {jobs} workers" if jobs > 1 else ""
+    print(f"📂 Scanning {len(md_files)} methodology files{jobs_note}...\n")
 
-        if not slides:
-            continue
-
-        print(f"📄 {filename}")
+    manifest = {'version': MANIFEST_VERSION, 'sources': {}, 'outputs': {}}
+    if not force:
+        with span("load manifest"):
+            manifest = load_manifest(base_dir)
+    new_manifest = {'version': MANIFEST_VERSION, 'sources': {}, 'outputs': {}}
 
-        for slide_id, slide_content in slides:
-            output_path = get_output_path(slide_id, base_dir)
-
-            if not output_path:
-                continue
+    total_extracted = 0
+    total_written = 0
+    skipped_files = 0
+    had_errors = False
+    seen_ids = {}
+    files = collect.setdefault('files', {}) if collect is not None else None
 
-            # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    results = []
+    for result in run_transforms(md_files, base_dir, manifest, jobs):
+        # Source unchanged but some of its outputs were deleted: redo it here
+        if result['unchanged']:
+            source_entry = manifest['sources'].get(result['filename'])
+            if source_is_unchanged(source_entry, result['hash'], base_dir):
+                skipped_files += 1
+            else:
+                result = transform_source(os.path.join(methodology_dir, result['filename']), base_dir,
+                                          known_blocks=known_blocks_for(manifest, result['filename']))
+        results.append(result)
+
+    # Slide IDs of skipped sources are taken before any changed source is
+    # written, wherever it comes in the file order, so a changed source
+    # cannot overwrite a slide defined in a file that was not re-read
+    for result in results:
+        if result['unchanged']:
+            register_unchanged_ids(manifest, result['filename'], seen_ids)
+
+    for result in results:
+        with span(f"write {result['filename']}", category='write'):
+            extracted, written, ok = collect_source(result, base_dir, manifest, new_manifest, seen_ids,
+                                                    files)
+        total_extracted += extracted
+        total_written += written
+        had_errors = had_errors or not ok
+
+    with span("write manifest and index", category='write'):
+        if new_manifest != manifest:
+            save_manifest(base_dir, new_manifest)
+
+        # Keep the last good index if anything failed
+        index_updated = False
+        if not had_errors:
+            index = index_from_manifest(new_manifest)
+            index_updated = write_index(base_dir, index)
+            if collect is not None:
+                collect['index'] = index
 
-            # Fix image paths
-            fixed_content = fix_image_paths(slide_content, md_file)
+    print("\n" + "─" * 70)
+    if had_errors:
+        print("❌ Extraction errors found - fix the files above and re-run")
+    print(f"✅ Extracted {total_extracted} slide(s), {total_written} file(s) updated")
+    if skipped_files:
+        print(f"   {skipped_files} unchanged methodology file(s) skipped")
+    if index_updated:
+        print("   Slide index updated: core_content/slide_index.json")
+    print("─" * 70 + "\n")
 
-            # Add Marp frontmatter
-            final_content = MARP_FRONTMATTER + fixed_content + "\n"
+    return not had_errors
 
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(final_content)
 
-            print(f"   ✓ {slide_id} → {os.path.basename(output_path)}")
-            total_extracted += 1
+def watch_extraction(base_dir, force=False, jobs=1, poll=False, debounce=DEFAULT_DEBOUNCE):
+    """Extract, then re-extract changed marker blocks whenever methodology/ changes"""
+    methodology_dir = os.path.join(base_dir, 'methodology')
+    first_run = [force]
 
-    print("\n" + "─" * 70)
-    print(f"✅ Extracted {total_extracted} slide(s)")
-    print("─" * 70 + "\n")
+    def extract(changed):
+        extract_slides(base_dir, force=first_run.pop() if first_run else False, jobs=jobs)
 
-    return True
+    watch([methodology_dir], extract, base_dir, poll=poll, debounce=debounce,
+          accept=lambda path: path.endswith('.md') and os.path.dirname(path) == methodology_dir)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -316,11 +708,38 @@ def extract_slides(base_dir):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Extract slide content from methodology documentation"
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Ignore the extraction manifest and re-extract every file'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Parse methodology files in N worker processes (0 = one per CPU)'
+    )
+    add_watch_arguments(parser)
+    add_tracing_arguments(parser)
+    args = parser.parse_args()
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
     # Determine base directory (parent of tools/)
     script_dir = os.path.dirname(os.path.abspath(__file__))
     base_dir = os.path.dirname(script_dir)
 
-    success = extract_slides(base_dir)
+    if args.watch:
+        watch_extraction(base_dir, force=args.force, jobs=jobs, poll=args.poll, debounce=args.debounce)
+        return
+
+    success = run_instrumented(lambda: extract_slides(base_dir, force=args.force, jobs=jobs),
+                               trace_path=args.trace, profile_path=args.profile,
+                               memory_report=args.memory_report)
 
     if success:
         print("💡 Next steps:")
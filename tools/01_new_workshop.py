@@ -8,17 +8,19 @@ Step 1: Create a new workshop folder with everything you need.
 
 USAGE:
     python3 tools/01_new_workshop.py
+    python3 tools/01_new_workshop.py --trace wizard.json   (stage timings)
 
 This wizard will:
 1. Ask for basic workshop info (country, dates, location)
 2. Help you select which modules to include
-3. Auto-assign modules to days based on duration
+3. Auto-assign modules to days, balancing the length of each day
 4. Generate a workshop.yaml config file
 5. Copy custom slide templates
 
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+import argparse
 import os
 import sys
 import re
@@ -32,8 +34,8 @@ from pathlib import Path
 
 def ensure_venv():
     """Re-execute with venv Python if not already in venv."""
-    # Already in a venv?
-    if sys.prefix != sys.base_prefix:
+    # Already in a venv (or already re-executed once)?
+    if sys.prefix != sys.base_prefix or os.environ.get('FASTR_VENV_REEXEC'):
         return
 
     # Find project root (where .venv should be)
@@ -45,6 +47,7 @@ def ensure_venv():
         venv_python = project_root / venv_name / 'bin' / 'python3'
         if venv_python.exists():
             # Re-execute this script with venv Python
+            os.environ['FASTR_VENV_REEXEC'] = '1'
             os.execv(str(venv_python), [str(venv_python)] + sys.argv)
 
     # No venv found, continue with system Python (may fail on imports)
@@ -57,6 +60,11 @@ except ImportError:
     print("Error: PyYAML not installed. Run: pip install pyyaml")
     sys.exit(1)
 
+from durations import DEFAULT_WEIGHTS, estimate_topic_minutes
+from slide_index import load_slide_index
+from timeline import Block, Fixed, format_time, layout_day
+from tracing import add_tracing_arguments, run_instrumented, span
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # MODULE DEFINITIONS - Read dynamically from core_content/
@@ -88,16 +96,26 @@ MODULE_SHORT_NAMES = {
 # Default modules for standard workshop (recommended)
 DEFAULT_MODULES = [0, 2, 4, 5, 6]
 
-# Estimated duration per topic in minutes
+# Minutes for a topic typed in by hand that has no slide statistics
+# (everything else is estimated from the slide index, see durations.py)
 MINUTES_PER_TOPIC = 15
 
-# Modules longer than this will be auto-split across days
-LONG_MODULE_THRESHOLD = 90
+# The wizard and the deck builder support 1 to 5 workshop days
+MAX_DAYS = 5
+
+# Fixed parts of every day (minutes)
+TEA_BREAK_MINUTES = 15
+LUNCH_MINUTES = 60
+WRAP_UP_MINUTES = 15
+DEFAULT_END_OF_DAY = '5:00 PM'
 
 
-def discover_modules(base_dir):
+def discover_modules(base_dir, weights=DEFAULT_WEIGHTS):
     """
-    Scan core_content/ folder to discover available modules and their topics.
+    Read available modules and their topics from the slide index
+    (core_content/slide_index.json, written by 00_extract_slides.py).
+    Topic durations are estimated from the slide statistics in the index
+    (see durations.py).
     Returns a dict of module info keyed by module number.
     """
     core_content_dir = os.path.join(base_dir, "core_content")
@@ -107,51 +125,40 @@ def discover_modules(base_dir):
         print(f"Warning: core_content/ not found at {core_content_dir}")
         return modules
 
-    # Find all module folders (m0_*, m1_*, etc.)
-    for item in sorted(os.listdir(core_content_dir)):
-        item_path = os.path.join(core_content_dir, item)
-        if os.path.isdir(item_path) and item.startswith('m') and '_' in item:
-            # Parse module number from folder name (e.g., "m0_introduction" -> 0)
-            try:
-                mod_num = int(item.split('_')[0][1:])  # Extract number after 'm'
-            except ValueError:
-                continue
+    index = load_slide_index(base_dir)
+    minutes = estimate_topic_minutes(index, weights)
+
+    for key, module in index['modules'].items():
+        mod_num = int(key)
+        folder = module['folder']
+        topic_ids = list(module['topics'])  # e.g., ['m3_1', 'm3_2', ...]
+
+        # Get official name, or derive from folder name if not defined
+        if mod_num in MODULE_NAMES:
+            name = MODULE_NAMES[mod_num]
+        else:
+            # Convert folder name: m0_introduction -> Introduction
+            folder_name = '_'.join(folder.split('_')[1:])
+            name = folder_name.replace('_', ' ').title()
+
+        short = MODULE_SHORT_NAMES.get(mod_num, f'M{mod_num}')
 
-            # Count topics (markdown files in the module folder)
-            topics = []
-            topic_ids = []
-            for f in sorted(os.listdir(item_path)):
-                if f.endswith('.md'):
-                    topics.append(f)
-                    # Extract topic ID from filename (e.g., "m3_1_overview.md" -> "m3_1")
-                    match = re.match(r'^(m\d+_\d+)', f)
-                    if match:
-                        topic_ids.append(match.group(1))
-
-            # Get official name, or derive from folder name if not defined
-            if mod_num in MODULE_NAMES:
-                name = MODULE_NAMES[mod_num]
-            else:
-                # Convert folder name: m0_introduction -> Introduction
-                folder_name = '_'.join(item.split('_')[1:])
-                name = folder_name.replace('_', ' ').title()
-
-            short = MODULE_SHORT_NAMES.get(mod_num, f'M{mod_num}')
-
-            # Estimate duration based on number of topics
-            duration = len(topics) * MINUTES_PER_TOPIC
-            if duration < 15:
-                duration = 15  # Minimum 15 minutes
-
-            modules[mod_num] = {
-                'name': name,
-                'short': short,
-                'duration': duration,
-                'topics': len(topics),
-                'topic_ids': topic_ids,  # e.g., ['m3_1', 'm3_2', ...]
-                'default': mod_num in DEFAULT_MODULES,
-                'folder': item,
-            }
+        # Estimate duration from the content of each topic
+        topic_minutes = {topic_id: minutes[topic_id] for topic_id in topic_ids}
+        duration = sum(topic_minutes.values())
+        if duration < 15:
+            duration = 15  # Minimum 15 minutes
+
+        modules[mod_num] = {
+            'name': name,
+            'short': short,
+            'duration': duration,
+            'topics': len(topic_ids),
+            'topic_ids': topic_ids,
+            'topic_minutes': topic_minutes,
+            'default': mod_num in DEFAULT_MODULES,
+            'folder': folder,
+        }
 
     return modules
 
@@ -212,28 +219,11 @@ def parse_time(time_str):
         return 9 * 60  # Default to 9:00 AM
 
 
-def format_time(minutes):
-    """Format minutes from midnight to time string."""
-    hours = minutes // 60
-    mins = minutes % 60
-    period = 'AM' if hours < 12 else 'PM'
-    if hours == 0:
-        hours = 12
-    elif hours > 12:
-        hours -= 12
-    return f"{hours}:{mins:02d} {period}"
-
-
-def is_long_module(mod_num):
-    """Check if a module exceeds the split threshold."""
-    return MODULES[mod_num]['duration'] > LONG_MODULE_THRESHOLD
-
-
 def expand_module_to_topics(mod_num):
     """
     Expand a module into its individual topics.
     Returns list of (item_id, duration, label) tuples.
-    For long modules: [('m3_1', 15, 'Platform pt.1'), ('m3_2', 15, 'Platform pt.2'), ...]
+    For example: [('m3_1', 10, 'Platform pt.1'), ('m3_2', 15, 'Platform pt.2'), ...]
     """
     mod = MODULES[mod_num]
     topic_ids = mod.get('topic_ids', [])
@@ -241,267 +231,244 @@ def expand_module_to_topics(mod_num):
 
     items = []
     for i, topic_id in enumerate(topic_ids, 1):
-        items.append((topic_id, MINUTES_PER_TOPIC, f"{short_name} pt.{i}"))
+        duration = mod.get('topic_minutes', {}).get(topic_id, MINUTES_PER_TOPIC)
+        items.append((topic_id, duration, f"{short_name} pt.{i}"))
 
     return items
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# DAY ASSIGNMENT (order-preserving linear partition)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def prefix_sums(weights):
+    """[0, w0, w0+w1, ...] so that sum(weights[p:i]) == sums[i] - sums[p]"""
+    sums = [0]
+    for weight in weights:
+        sums.append(sums[-1] + weight)
+    return sums
+
+
+def min_max_partition_costs(weights, max_parts):
+    """
+    Exact linear partition: for k = 1..max_parts, the smallest possible
+    longest part when weights are split, in order, into at most k parts.
+
+    Returns a list where costs[k] is that value (costs[0] is unused).
+
+    Dynamic programming over prefix sums. For a part ending at item i the
+    scan over its start p stops as soon as the part alone is no better
+    than the best found, which keeps it far below O(k * n^2) in practice
+    (a few milliseconds for 5 days of slide-level items).
+    """
+    sums = prefix_sums(weights)
+    n = len(weights)
+    best = sums[:]  # One part: everything up to i
+    costs = [None, best[n]]
+    for _ in range(2, max_parts + 1):
+        current = [0] * (n + 1)
+        for i in range(1, n + 1):
+            value = best[i]  # Last part empty
+            for p in range(i - 1, -1, -1):
+                last = sums[i] - sums[p]
+                if last >= value:
+                    break
+                value = min(value, max(best[p], last))
+            current[i] = value
+        best = current
+        costs.append(best[n])
+    return costs
+
+
+def balanced_partition(weights, num_parts, limit, cut_cost=None):
+    """
+    Split weights, in order, into num_parts parts (some possibly empty)
+    with no part heavier than limit.
+
+    Among those partitions, picks the one with the fewest costly cuts
+    (cut_cost(p) for a part starting at item p, e.g. 1 inside a module),
+    then the most even parts (smallest sum of squared part weights).
+
+    Returns the start index of every part after the first, or None if no
+    partition fits the limit.
+    """
+    sums = prefix_sums(weights)
+    n = len(weights)
+    cut_cost = cut_cost or (lambda p: 0)
+
+    # cost[i] = best (cuts, squares) for items[:i] in the parts so far
+    cost = [(0, sums[i] ** 2) if sums[i] <= limit else None for i in range(n + 1)]
+    starts = []
+    for _ in range(2, num_parts + 1):
+        current = [None] * (n + 1)
+        start = [0] * (n + 1)
+        for i in range(n + 1):
+            for p in range(i, -1, -1):
+                weight = sums[i] - sums[p]
+                if weight > limit:
+                    break
+                if cost[p] is None:
+                    continue
+                cuts = cut_cost(p) if 0 < p < i else 0
+                candidate = (cost[p][0] + cuts, cost[p][1] + weight ** 2)
+                if current[i] is None or candidate < current[i]:
+                    current[i], start[i] = candidate, p
+        cost = current
+        starts.append(start)
+
+    if cost[n] is None:
+        return None
+    boundaries = []
+    i = n
+    for start in reversed(starts):
+        i = start[i]
+        boundaries.append(i)
+    return boundaries[::-1]
+
+
 def auto_assign_modules_to_days(selected_modules, num_days):
     """
-    Auto-assign modules to days based on duration.
-    Maintains module order while balancing time across days.
-    Long modules (>90 min) are automatically split into individual topics.
+    Auto-assign modules to days so the longest day is as short as possible.
+
+    Every module is considered topic by topic, in module order. The exact
+    minimum for the longest day is found first; among the assignments that
+    reach it, modules are kept whole wherever possible and days are made as
+    even as possible. Modules that still end up spanning two days are
+    listed as topics.
 
     Returns:
         days: dict mapping day number to list of items
         split_modules: set of module numbers that were split
+        costs: minutes of content on the longest day for the chosen
+               schedule ('longest_day'), if modules were never split
+               ('whole_modules'), and for each possible number of days
+               ('by_days': {1: ..., 5: ...})
     """
     # Sort modules to maintain logical sequence (0, 1, 2, 3, 4, 5, 6, 7)
     sorted_modules = sorted(selected_modules)
 
-    # Build list of all items (modules or topics) with their durations
-    # Each item: (item_id, duration, mod_num, label)
+    # Topic-level items: (item_id, duration, mod_num, label)
     all_items = []
-    split_modules = set()
-
     for mod_num in sorted_modules:
         mod = MODULES[mod_num]
-        if is_long_module(mod_num) and mod.get('topic_ids'):
-            # Split this module into individual topics
-            split_modules.add(mod_num)
+        if mod.get('topic_ids'):
             for topic_id, duration, label in expand_module_to_topics(mod_num):
                 all_items.append((topic_id, duration, mod_num, label))
         else:
-            # Keep as whole module
             all_items.append((f'm{mod_num}', mod['duration'], mod_num, mod['short']))
 
-    # Calculate target per day
-    total_duration = sum(item[1] for item in all_items)
-    target_per_day = total_duration / num_days
+    weights = [item[1] for item in all_items]
+    by_days = min_max_partition_costs(weights, max(MAX_DAYS, num_days))
+    longest_day = by_days[num_days]
+    whole_modules = min_max_partition_costs(
+        [MODULES[mod_num]['duration'] for mod_num in sorted_modules], num_days)[num_days]
 
-    days = {d: [] for d in range(1, num_days + 1)}
-    day_durations = {d: 0 for d in range(1, num_days + 1)}
+    def inside_module(p):
+        return 1 if all_items[p - 1][2] == all_items[p][2] else 0
 
-    current_day = 1
+    boundaries = balanced_partition(weights, num_days, longest_day, inside_module)
+    bounds = [0] + boundaries + [len(all_items)]
 
-    # Assign items in order, moving to next day when current is full
-    for item_id, duration, mod_num, label in all_items:
-        # If adding this item exceeds target and we have more days, consider next day
-        if (day_durations[current_day] > 0 and
-            day_durations[current_day] + duration > target_per_day * 1.3 and
-            current_day < num_days):
-            current_day += 1
+    module_days = {}
+    for day in range(1, num_days + 1):
+        for item in all_items[bounds[day - 1]:bounds[day]]:
+            module_days.setdefault(item[2], set()).add(day)
+    split_modules = {mod_num for mod_num, on_days in module_days.items() if len(on_days) > 1}
 
-        days[current_day].append({
-            'id': item_id,
-            'duration': duration,
-            'mod_num': mod_num,
-            'label': label,
-        })
-        day_durations[current_day] += duration
+    days = {}
+    for day in range(1, num_days + 1):
+        entries = []
+        for item_id, duration, mod_num, label in all_items[bounds[day - 1]:bounds[day]]:
+            if mod_num in split_modules:
+                entries.append({'id': item_id, 'duration': duration, 'mod_num': mod_num, 'label': label})
+            elif not entries or entries[-1]['mod_num'] != mod_num:
+                # Whole module on this day: keep it as one item
+                mod = MODULES[mod_num]
+                entries.append({'id': f'm{mod_num}', 'duration': mod['duration'],
+                                'mod_num': mod_num, 'label': mod['short']})
+        days[day] = entries
+
+    costs = {
+        'longest_day': longest_day,
+        'whole_modules': whole_modules,
+        'by_days': {d: by_days[d] for d in range(1, MAX_DAYS + 1)},
+    }
+    return days, split_modules, costs
 
-    return days, split_modules
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# DAY TIMELINE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def standard_day_events(tea_time_mins, lunch_time_mins, afternoon_tea_mins, end_of_day_mins):
+    """The fixed parts of every day: tea, lunch, afternoon tea and the wrap-up"""
+    return [
+        Fixed(tea_time_mins, TEA_BREAK_MINUTES, 'Tea Break', 'break'),
+        Fixed(lunch_time_mins, LUNCH_MINUTES, 'Lunch', 'break'),
+        Fixed(afternoon_tea_mins, TEA_BREAK_MINUTES, 'Afternoon Tea', 'break'),
+        Fixed(end_of_day_mins - WRAP_UP_MINUTES, WRAP_UP_MINUTES, 'Day Wrap-up & Q&A'),
+    ]
 
 
-def build_daily_schedule(day_items, start_time_mins, tea_time_mins, lunch_time_mins, afternoon_tea_mins, day_num=1):
+def build_daily_schedule(day_items, start_time_mins, tea_time_mins, lunch_time_mins, afternoon_tea_mins,
+                         day_num=1, end_of_day_mins=None, fixed_events=()):
     """
-    Build a FULL DAY schedule (9 AM - 5 PM) with content, exercises, and breaks.
+    Build a FULL DAY schedule with content, exercises, and breaks.
     Consolidates consecutive topics from the same module into single entries.
 
     Args:
         day_items: list of dicts with 'id', 'duration', 'mod_num', 'label'
         day_num: which day (1, 2, etc.) for labeling
+        end_of_day_mins: end of the day (default 5:00 PM)
+        fixed_events: extra Fixed events for this day (ceremonies, speakers, photo)
+
+    Returns a timeline Layout: .entries is the agenda for workshop.yaml,
+    .problems() lists content that does not fit and clashing events.
+    Leftover time from the start of the day to the morning tea break is
+    left open; later gaps are filled with exercises.
     """
-    END_OF_DAY = 17 * 60  # 5:00 PM in minutes
+    if end_of_day_mins is None:
+        end_of_day_mins = parse_time(DEFAULT_END_OF_DAY)
 
-    # First, consolidate consecutive items from the same module
-    consolidated = []
-    i = 0
-    while i < len(day_items):
-        item = day_items[i]
+    # Consolidate consecutive items from the same module into one block
+    blocks = []
+    for item in day_items:
         mod_num = item['mod_num']
-        total_duration = item['duration']
-
-        # Look ahead for more items from same module
-        j = i + 1
-        while j < len(day_items) and day_items[j]['mod_num'] == mod_num:
-            total_duration += day_items[j]['duration']
-            j += 1
-
-        # Create consolidated entry
-        consolidated.append({
-            'mod_num': mod_num,
-            'duration': total_duration,
-            'name': MODULES[mod_num]['name'],
-        })
-        i = j
-
-    schedule = []
-    current_time = start_time_mins
-    content_idx = 0
-
-    # Morning session until tea
-    while current_time < tea_time_mins and content_idx < len(consolidated):
-        item = consolidated[content_idx]
-        duration = min(item['duration'], tea_time_mins - current_time)
-
-        start_str = format_time(current_time)
-        end_time = current_time + duration
-        end_str = format_time(end_time)
-
-        schedule.append({
-            'time': f"{start_str} - {end_str}",
-            'session': item['name'],
-            'module': f"m{item['mod_num']}",
-            'duration': duration
-        })
-        current_time = end_time
-
-        # If we used the full duration, move to next item
-        if duration >= item['duration']:
-            content_idx += 1
-        else:
-            # Partial - reduce remaining duration
-            consolidated[content_idx]['duration'] -= duration
-
-    # Tea break
-    tea_end = tea_time_mins + 15
-    schedule.append({
-        'time': f"{format_time(tea_time_mins)} - {format_time(tea_end)}",
-        'session': 'Tea Break',
-        'type': 'break',
-        'duration': 15
-    })
-    current_time = tea_end
-
-    # Late morning session until lunch
-    while current_time < lunch_time_mins and content_idx < len(consolidated):
-        item = consolidated[content_idx]
-        duration = min(item['duration'], lunch_time_mins - current_time)
-
-        start_str = format_time(current_time)
-        end_time = current_time + duration
-        end_str = format_time(end_time)
-
-        schedule.append({
-            'time': f"{start_str} - {end_str}",
-            'session': item['name'],
-            'module': f"m{item['mod_num']}",
-            'duration': duration
-        })
-        current_time = end_time
-
-        if duration >= item['duration']:
-            content_idx += 1
-        else:
-            consolidated[content_idx]['duration'] -= duration
-
-    # If time before lunch, add exercises
-    if current_time < lunch_time_mins:
-        schedule.append({
-            'time': f"{format_time(current_time)} - {format_time(lunch_time_mins)}",
-            'session': 'Practical Exercises',
-            'duration': lunch_time_mins - current_time
-        })
-        current_time = lunch_time_mins
-
-    # Lunch
-    lunch_end = lunch_time_mins + 60
-    schedule.append({
-        'time': f"{format_time(lunch_time_mins)} - {format_time(lunch_end)}",
-        'session': 'Lunch',
-        'type': 'break',
-        'duration': 60
-    })
-    current_time = lunch_end
-
-    # Afternoon session until afternoon tea
-    while current_time < afternoon_tea_mins and content_idx < len(consolidated):
-        item = consolidated[content_idx]
-        duration = min(item['duration'], afternoon_tea_mins - current_time)
-
-        start_str = format_time(current_time)
-        end_time = current_time + duration
-        end_str = format_time(end_time)
-
-        schedule.append({
-            'time': f"{start_str} - {end_str}",
-            'session': item['name'],
-            'module': f"m{item['mod_num']}",
-            'duration': duration
-        })
-        current_time = end_time
-
-        if duration >= item['duration']:
-            content_idx += 1
+        if blocks and blocks[-1].module == f"m{mod_num}":
+            blocks[-1] = blocks[-1]._replace(duration=blocks[-1].duration + item['duration'])
         else:
-            consolidated[content_idx]['duration'] -= duration
-
-    # If time before afternoon tea, add exercises
-    if current_time < afternoon_tea_mins:
-        schedule.append({
-            'time': f"{format_time(current_time)} - {format_time(afternoon_tea_mins)}",
-            'session': 'Practical Exercises',
-            'duration': afternoon_tea_mins - current_time
-        })
-        current_time = afternoon_tea_mins
-
-    # Afternoon tea
-    tea_end = afternoon_tea_mins + 15
-    schedule.append({
-        'time': f"{format_time(afternoon_tea_mins)} - {format_time(tea_end)}",
-        'session': 'Afternoon Tea',
-        'type': 'break',
-        'duration': 15
-    })
-    current_time = tea_end
-
-    # Late afternoon until end of day
-    while current_time < END_OF_DAY - 15 and content_idx < len(consolidated):
-        item = consolidated[content_idx]
-        duration = min(item['duration'], END_OF_DAY - 15 - current_time)
-
-        start_str = format_time(current_time)
-        end_time = current_time + duration
-        end_str = format_time(end_time)
-
-        schedule.append({
-            'time': f"{start_str} - {end_str}",
-            'session': item['name'],
-            'module': f"m{item['mod_num']}",
-            'duration': duration
-        })
-        current_time = end_time
-
-        if duration >= item['duration']:
-            content_idx += 1
-        else:
-            consolidated[content_idx]['duration'] -= duration
+            blocks.append(Block(MODULES[mod_num]['name'], item['duration'], True, f"m{mod_num}"))
+
+    events = standard_day_events(tea_time_mins, lunch_time_mins, afternoon_tea_mins, end_of_day_mins)
+    return layout_day(blocks, events + list(fixed_events), start_time_mins, end_of_day_mins,
+                      fill_from=tea_time_mins)
 
-    # Fill remaining time with exercises/group work
-    if current_time < END_OF_DAY - 15:
-        schedule.append({
-            'time': f"{format_time(current_time)} - {format_time(END_OF_DAY - 15)}",
-            'session': 'Group Work & Discussion',
-            'duration': END_OF_DAY - 15 - current_time
-        })
-        current_time = END_OF_DAY - 15
 
-    # Day wrap-up
-    schedule.append({
-        'time': f"{format_time(current_time)} - {format_time(END_OF_DAY)}",
-        'session': 'Day Wrap-up & Q&A',
-        'duration': 15
-    })
+def print_day_fit(day, layout, indent="   "):
+    """Print what keeps a day's schedule from working, if anything"""
+    for problem in layout.problems():
+        print(f"{indent}⚠️  Day {day}: {problem}")
 
-    return schedule
+
+def parse_fixed_event(text, num_days):
+    """
+    Parse 'DAY, TIME, MINUTES, SESSION' (e.g. '1, 12:00 PM, 10, Group Photo').
+    Returns (day, Fixed) or None if the line is not valid.
+    """
+    parts = [part.strip() for part in text.split(',', 3)]
+    if len(parts) != 4 or not parts[0].isdigit() or not parts[2].isdigit() or not parts[3]:
+        return None
+    day = int(parts[0])
+    if not 1 <= day <= num_days:
+        return None
+    return day, Fixed(parse_time(parts[1]), int(parts[2]), parts[3])
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN WIZARD
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def main():
+def run_wizard():
     global MODULES
 
     # Determine base directory
@@ -509,7 +476,8 @@ def main():
     base_dir = os.path.dirname(script_dir)
 
     # Discover available modules from core_content/
-    MODULES = discover_modules(base_dir)
+    with span("discover modules"):
+        MODULES = discover_modules(base_dir)
     if not MODULES:
         print("Error: No modules found in core_content/")
         print("Make sure the core_content/ folder exists with module subfolders.")
@@ -562,7 +530,7 @@ def main():
 
     days_input = get_input("   Number of days", "2")
     try:
-        num_days = max(1, min(5, int(days_input)))
+        num_days = max(1, min(MAX_DAYS, int(days_input)))
     except:
         num_days = 2
 
@@ -570,12 +538,39 @@ def main():
     tea_time = get_input("   Morning tea break", "10:30 AM")
     lunch_time = get_input("   Lunch time", "12:30 PM")
     afternoon_tea = get_input("   Afternoon tea", "3:30 PM")
+    end_time = get_input("   End of day", DEFAULT_END_OF_DAY)
 
     # Parse times
     start_time_mins = parse_time(start_time)
     tea_time_mins = parse_time(tea_time)
     lunch_time_mins = parse_time(lunch_time)
     afternoon_tea_mins = parse_time(afternoon_tea)
+    end_of_day_mins = parse_time(end_time)
+    if end_of_day_mins <= afternoon_tea_mins:
+        end_time = DEFAULT_END_OF_DAY
+        end_of_day_mins = parse_time(end_time)
+        print(f"   End of day must be after afternoon tea - using {end_time}")
+
+    # Sessions at a set time (see OPTIONAL SESSIONS in workshop.yaml)
+    fixed_events = {day: [] for day in range(1, num_days + 1)}
+    add_fixed = input("\n   Add fixed sessions (opening ceremony, guest speaker, group photo)? [y/N]: ")
+    if add_fixed.strip().lower() == 'y':
+        print("   One per line as DAY, TIME, MINUTES, SESSION - e.g. 1, 12:00 PM, 10, Group Photo")
+        print("   (blank line to finish)")
+        while True:
+            line = input("   > ").strip()
+            if not line:
+                break
+            parsed = parse_fixed_event(line, num_days)
+            if parsed is None:
+                print(f"   Not understood - expected DAY (1-{num_days}), TIME, MINUTES, SESSION")
+                continue
+            fixed_events[parsed[0]].append(parsed[1])
+
+    def day_layout(day, items):
+        return build_daily_schedule(items, start_time_mins, tea_time_mins, lunch_time_mins,
+                                    afternoon_tea_mins, day_num=day, end_of_day_mins=end_of_day_mins,
+                                    fixed_events=fixed_events[day])
 
     # ─────────────────────────────────────────────────────────────────────────
     # STEP 3: Content Selection
@@ -623,13 +618,16 @@ def main():
     print("STEP 4: Daily Schedule")
     print("─" * 70 + "\n")
 
-    # Auto-assign modules to days (splits long modules automatically)
-    days_assignment, split_modules = auto_assign_modules_to_days(selected_modules, num_days)
+    # Auto-assign modules to days (balanced; splits modules only where it helps)
+    with span("day assignment"):
+        days_assignment, split_modules, costs = auto_assign_modules_to_days(selected_modules, num_days)
 
-    print("   Suggested schedule (each day is 9:00 AM - 5:00 PM):\n")
+    print(f"   Suggested schedule (each day is {format_time(start_time_mins)} - {format_time(end_of_day_mins)}):\n")
     if split_modules:
         split_names = [f"m{m} ({MODULES[m]['short']})" for m in sorted(split_modules)]
-        print(f"   Note: Long modules auto-split across days: {', '.join(split_names)}\n")
+        print(f"   Note: Modules split across days to balance them: {', '.join(split_names)}")
+        print(f"         (longest day {costs['longest_day']} min of content, "
+              f"{costs['whole_modules']} min if modules were kept whole)\n")
 
     for day, items in days_assignment.items():
         # Get unique module names (consolidate split topics)
@@ -640,7 +638,13 @@ def main():
             if mod_num not in seen_mods:
                 seen_mods.add(mod_num)
                 labels.append(MODULES[mod_num]['short'])
-        print(f"   Day {day}: {', '.join(labels)}")
+        minutes = sum(item['duration'] for item in items)
+        print(f"   Day {day}: {', '.join(labels)} ({minutes} min)")
+        print_day_fit(day, day_layout(day, items), indent="      ")
+
+    alternatives = [f"{d} day{'s' if d > 1 else ''}: {minutes} min"
+                    for d, minutes in costs['by_days'].items() if d != num_days]
+    print(f"\n   Longest day with other day counts - {', '.join(alternatives)}")
 
     adjust = input("\n   Adjust this schedule? [y/N]: ").strip().lower()
 
@@ -672,7 +676,8 @@ def main():
                             if mod_num in MODULES:
                                 new_items.append({
                                     'id': item_str,
-                                    'duration': MINUTES_PER_TOPIC,
+                                    'duration': MODULES[mod_num]['topic_minutes'].get(
+                                        item_str, MINUTES_PER_TOPIC),
                                     'mod_num': mod_num,
                                     'label': item_str,
                                 })
@@ -688,6 +693,7 @@ def main():
                                 })
                 if new_items:
                     days_assignment[day] = new_items
+                    print_day_fit(day, day_layout(day, new_items), indent="      ")
 
     # ─────────────────────────────────────────────────────────────────────────
     # BUILD CONFIG
@@ -698,10 +704,11 @@ def main():
 
     # Build full schedule
     daily_schedules = {}
-    for day, items in days_assignment.items():
-        daily_schedules[f'day{day}'] = build_daily_schedule(
-            items, start_time_mins, tea_time_mins, lunch_time_mins, afternoon_tea_mins
-        )
+    with span("schedule generation"):
+        for day, items in days_assignment.items():
+            layout = day_layout(day, items)
+            print_day_fit(day, layout)
+            daily_schedules[f'day{day}'] = layout.entries
 
     # Build deck_order from all items across all days (preserves split modules)
     deck_order_items = ['agenda']
@@ -727,6 +734,7 @@ def main():
             'tea_time': tea_time,
             'lunch_time': lunch_time,
             'afternoon_tea': afternoon_tea,
+            'end_time': end_time,
             'agenda': daily_schedules,
         },
         'content': {
@@ -791,6 +799,18 @@ schedule:
   tea_time: "{tea_time}"
   lunch_time: "{lunch_time}"
   afternoon_tea: "{afternoon_tea}"
+  end_time: "{end_time}"
+
+  # Session lengths below are estimated from each topic's slides, words,
+  # images and tables (tools/durations.py). To change the estimate for
+  # this workshop, uncomment and edit; the deck builder warns when the
+  # agenda and the estimate disagree.
+  # durations:
+  #   minutes_per_slide: 3.5
+  #   minutes_per_100_words: 5
+  #   scale: 1.0              # e.g. 1.2 = everything takes 20% longer
+  #   topics:
+  #     m4_3: 45              # fixed minutes for one topic
 
   # ─────────────────────────────────────────────────────────────────────
   # OPTIONAL SESSIONS - Uncomment and customize as needed
@@ -999,6 +1019,17 @@ Add your FASTR platform outputs to `media/outputs/` to include them in slides.
     print("\n" + "═" * 70 + "\n")
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Create a new FASTR workshop folder (interactive wizard)"
+    )
+    add_tracing_arguments(parser)
+    args = parser.parse_args()
+
+    run_instrumented(run_wizard, trace_path=args.trace, profile_path=args.profile,
+                     memory_report=args.memory_report)
+
+
 if __name__ == "__main__":
     try:
         main()
@@ -21,6 +21,7 @@ Interactive mode:
 
 Command line:
     python3 tools/02_build_deck.py --workshop 2025-nigeria
+    python3 tools/02_build_deck.py --workshop 2025-nigeria --watch   (rebuild on every save)
 
 ═══════════════════════════════════════════════════════════════════════
                       BEFORE YOU START
@@ -37,10 +38,20 @@ Command line:
 """
 
 import argparse
+import contextlib
+import copy
+import functools
+import io
+import json
 import os
 import sys
+import time
+import traceback
+import types
 import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from urllib.parse import unquote
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # AUTO-DETECT AND USE VENV
@@ -48,13 +59,14 @@ from pathlib import Path
 
 def ensure_venv():
     """Re-execute with venv Python if not already in venv."""
-    if sys.prefix != sys.base_prefix:
+    if sys.prefix != sys.base_prefix or os.environ.get('FASTR_VENV_REEXEC'):
         return
     script_dir = Path(__file__).resolve().parent
     project_root = script_dir.parent
     for venv_name in ['.venv', 'venv']:
         venv_python = project_root / venv_name / 'bin' / 'python3'
         if venv_python.exists():
+            os.environ['FASTR_VENV_REEXEC'] = '1'
             os.execv(str(venv_python), [str(venv_python)] + sys.argv)
 
 ensure_venv()
@@ -67,6 +79,13 @@ except ImportError:
 
 import re
 
+from content_cache import DEFAULT_CACHE_DIR, ContentCache, hash_text, make_key
+from asset_index import AssetIndex, build_asset_index
+from slide_index import get_index_path, load_slide_index, module_topics
+from durations import duration_weights, topic_minutes
+from tracing import TRACER, add_tracing_arguments, run_instrumented, span, worker_init, worker_settings
+from file_watcher import DEFAULT_DEBOUNCE, add_watch_arguments, watch
+
 # ═══════════════════════════════════════════════════════════════════════
 # VALIDATION FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════
@@ -74,42 +93,122 @@ import re
 # Required config fields
 REQUIRED_FIELDS = ['name', 'date', 'location']
 
+# Agenda time for a module may differ this much (fraction) from the estimate
+AGENDA_DURATION_TOLERANCE = 0.25
+
 
-def find_variables_in_file(filepath):
+def find_variables_in_file(filepath, files=None):
     """Find all {{variable}} patterns in a file"""
     variables = set()
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        matches = re.findall(r'\{\{(\w+)\}\}', content)
-        variables.update(matches)
+        content = load_file(filepath, files)
+        if content is not None:
+            # Compiling here means the build reuses the same parsed template
+            variables.update(compile_template(strip_frontmatter(content)).variables)
     except:
         pass
     return variables
 
 
-def find_images_in_file(filepath):
+def find_images_in_file(filepath, files=None):
     """Find all image references in a markdown file"""
     images = []
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
-        pattern = r'!\[[^\]]*\]\((.*?\.(?:png|jpg|jpeg|gif|svg|webp))\)'
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        images.extend(matches)
+        content = load_file(filepath, files)
+        if content is not None:
+            content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
+            images.extend(match.group(2) for match in IMAGE_REF_PATTERN.finditer(content))
     except:
         pass
     return images
 
 
-def validate_workshop(workshop_id, base_dir, config):
+def resolve_custom_slide(item, workshop_dir, base_dir, files=None):
+    """
+    Path of a custom slide: the workshop folder first, then
+    templates/custom_slides/. Returns None if neither exists.
+    """
+    for path in (os.path.join(workshop_dir, item),
+                 os.path.join(base_dir, "templates", "custom_slides", item)):
+        if load_file(path, files) is not None:
+            return path
+    return None
+
+
+def estimate_module_minutes(deck_order, weights, exclude=None):
+    """Estimated teaching minutes per module ('m4': 95) for the topics in deck_order"""
+    exclude = exclude or []
+    estimates = {}
+    for item in deck_order:
+        if not is_module_prefix(item):
+            continue
+        module_num = int(item[1:].split('_')[0])
+        module = MODULES.get(module_num)
+        if not module:
+            continue
+        topic_ids = [item] if '_' in item else [t for t, _ in module['topics'] if t not in exclude]
+        for topic_id in topic_ids:
+            record = module['stats'].get(topic_id)
+            if record is not None:
+                estimates[f"m{module_num}"] = (estimates.get(f"m{module_num}", 0)
+                                               + topic_minutes(topic_id, record, weights))
+    return estimates
+
+
+def check_agenda_durations(config):
+    """
+    Compare the minutes the YAML agenda gives each module with the
+    estimate from its slides. Returns a list of warnings.
+
+    Only agenda entries with a `module:` field count, and only a gap of
+    more than AGENDA_DURATION_TOLERANCE (and at least 15 minutes) is
+    reported, so hand-tuned agendas are not flagged for small differences.
+    """
+    agenda = (config.get('_yaml_schedule') or {}).get('agenda') or {}
+    if not isinstance(agenda, dict):
+        return []
+    weights, warnings = duration_weights(config.get('durations'))
+
+    scheduled = {}
+    for day_items in agenda.values():
+        for entry in day_items or []:
+            module = entry.get('module') if isinstance(entry, dict) else None
+            if not module:
+                continue
+            try:
+                minutes = int(entry.get('duration') or 0)
+            except (TypeError, ValueError):
+                continue
+            scheduled[module] = scheduled.get(module, 0) + minutes
+    if not scheduled:
+        return warnings
+
+    estimates = estimate_module_minutes(config.get('deck_order', []), weights, config.get('exclude'))
+    for module in sorted(scheduled, key=lambda m: (len(m), m)):
+        if module not in estimates:
+            continue
+        planned, needed = scheduled[module], estimates[module]
+        if abs(planned - needed) > max(15, AGENDA_DURATION_TOLERANCE * needed):
+            warnings.append(f"Agenda gives {module} {planned} min; its slides need about {needed} min "
+                            f"(see schedule.durations)")
+    return warnings
+
+
+def validate_workshop(workshop_id, base_dir, config, files=None, asset_index=None, check_durations=False):
     """
     Validate workshop setup before building.
     Returns (success, errors, warnings)
+
+    Custom slides and the core_content files in deck_order are read
+    through the shared `files` cache, so a build that follows reuses the
+    same contents instead of reading them again. Image paths are checked
+    against asset_index. check_durations also compares the agenda with the
+    slide-based duration estimates (check_agenda_durations()).
     """
     workshop_dir = os.path.join(base_dir, "workshops", workshop_id)
     core_content_dir = os.path.join(base_dir, "core_content")
+    if asset_index is None:
+        asset_index = build_asset_index(base_dir, workshop_id)
 
     errors = []
     warnings = []
@@ -126,40 +225,64 @@ def validate_workshop(workshop_id, base_dir, config):
 
     # CHECK 2: Files in deck_order exist
     deck_order = config.get('deck_order', [])
+    exclude_list = config.get('exclude', [])
+    files_to_check = []
     for item in deck_order:
         if item == 'agenda':
             continue
         elif item.endswith('.md'):
-            custom_path = os.path.join(workshop_dir, item)
-            template_path = os.path.join(base_dir, "templates", "custom_slides", item)
-            if not os.path.exists(custom_path) and not os.path.exists(template_path):
+            custom_path = resolve_custom_slide(item, workshop_dir, base_dir, files)
+            if custom_path:
+                files_to_check.append(custom_path)
+            else:
                 errors.append(f"Custom slide missing: {item}")
+        elif is_module_prefix(item):
+            module_files, _, is_valid = resolve_module_prefix(item, exclude=exclude_list)
+            if not is_valid:
+                warnings.append(f"Unknown module prefix '{item}'")
+            for filename in module_files:
+                filepath = os.path.join(core_content_dir, filename)
+                if load_file(filepath, files) is None:
+                    errors.append(f"Core content missing: core_content/{filename}")
+                else:
+                    files_to_check.append(filepath)
 
-    # CHECK 3: Variables have values
-    available_vars = set(['WORKSHOP_ID', 'WORKSHOP_NAME', 'DATE', 'LOCATION',
-                         'FACILITATORS', 'COUNTRY', 'TEA_TIME', 'LUNCH_TIME'])
-    country_data = config.get('country_data', {})
-    available_vars.update(country_data.keys())
+    # CHECK 3: Variables have values (same mapping the build substitutes)
+    available_vars = set(build_replacements(config))
 
-    files_to_check = []
-    for item in deck_order:
-        if item.endswith('.md'):
-            workshop_path = os.path.join(workshop_dir, item)
-            template_path = os.path.join(base_dir, "templates", "custom_slides", item)
-            if os.path.exists(workshop_path):
-                files_to_check.append(workshop_path)
-            elif os.path.exists(template_path):
-                files_to_check.append(template_path)
-
-    used_vars = set()
+    used_vars = {}
+    for filepath in files_to_check:
+        for var in find_variables_in_file(filepath, files):
+            used_vars.setdefault(var, []).append(os.path.basename(filepath))
+
+    for var in sorted(set(used_vars) - available_vars):
+        where = ', '.join(used_vars[var][:3]) + (', ...' if len(used_vars[var]) > 3 else '')
+        warnings.append(f"Variable '{{{{{var}}}}}' used but not defined in country_data ({where})")
+
+    # CHECK 4: Images exist (relative to the file using them), or are
+    # overridden by the workshop's assets/ folder
+    workshop_assets = list_workshop_assets(workshop_id, base_dir, asset_index)
+    overridden = set()
     for filepath in files_to_check:
-        used_vars.update(find_variables_in_file(filepath))
+        for image in find_images_in_file(filepath, files):
+            if image.startswith(('http://', 'https://')):
+                continue
+            assets_rel = get_assets_relative_path(image)
+            if assets_rel is not None and assets_rel in workshop_assets:
+                overridden.add(assets_rel)
+                continue
+            image_path = os.path.join(os.path.dirname(filepath), unquote(image))
+            if not asset_index.exists(image_path):
+                warnings.append(f"Image not found: {image} (in {os.path.basename(filepath)})")
 
-    undefined = used_vars - available_vars
-    for var in sorted(undefined):
-        warnings.append(f"Variable '{{{{{var}}}}}' used but not defined in country_data")
+    # CHECK 5: Agenda time per module matches what its slides need (opt-in:
+    # hand-written agendas often plan discussion time the estimate ignores)
+    if check_durations:
+        warnings.extend(check_agenda_durations(config))
 
     # Print results
+    if overridden:
+        print(f"   {len(overridden)} image(s) overridden by workshops/{workshop_id}/assets/")
     if errors:
         print(f"   ERRORS: {len(errors)}")
         for e in errors:
@@ -177,94 +300,55 @@ def validate_workshop(workshop_id, base_dir, config):
 # ═══════════════════════════════════════════════════════════════════════
 # MODULE DEFINITIONS
 # ═══════════════════════════════════════════════════════════════════════
-# Maps module prefixes (m0, m1, etc.) to their folders and topic files
-
-MODULES = {
-    0: {
-        'name': 'Introduction to FASTR',
-        'folder': 'm0_introduction',
-        'topics': [
-            ('m0_1', 'm0_1_introduction_to_fastr.md'),
-            ('m0_2', 'm0_2_rmncahn_service_use_monitoring.md'),
-            ('m0_3', 'm0_3_why_rapid_cycle_analytics.md'),
-            ('m0_4', 'm0_4_technical_approaches.md'),
-            ('m0_5', 'm0_5_fastr_approach_to_routine_data_analysis.md'),
-        ],
-    },
-    1: {
-        'name': 'Identify Questions & Indicators',
-        'folder': 'm1_identify_questions_indicators',
-        'topics': [
-            ('m1_1', 'm1_1_fastr_gaps_challenges.md'),
-            ('m1_2', 'm1_2_development_of_data_use_case.md'),
-            ('m1_3', 'm1_3_defining_priority_questions.md'),
-            ('m1_4', 'm1_4_preparing_for_data_extraction.md'),
-        ],
-    },
-    2: {
-        'name': 'Data Extraction',
-        'folder': 'm2_data_extraction',
-        'topics': [
-            ('m2_1', 'm2_1_why_extract_data.md'),
-            ('m2_2', 'm2_2_tools_for_data_extraction.md'),
-        ],
-    },
-    3: {
-        'name': 'FASTR Analytics Platform',
-        'folder': 'm3_fastr_analytics_platform',
-        'topics': [
-            ('m3_1', 'm3_1_overview_of_platform.md'),
-            ('m3_2', 'm3_2_accessing_platform.md'),
-            ('m3_3', 'm3_3_setting_up_structure.md'),
-            ('m3_4', 'm3_4_importing_dataset.md'),
-            ('m3_5', 'm3_5_installing_running_modules.md'),
-            ('m3_6', 'm3_6_creating_new_project.md'),
-            ('m3_7', 'm3_7_creating_visualizations.md'),
-            ('m3_8', 'm3_8_creating_reports.md'),
-        ],
-    },
-    4: {
-        'name': 'Data Quality Assessment',
-        'folder': 'm4_data_quality_assessment',
-        'topics': [
-            ('m4_1', 'm4_1_approach_to_dqa.md'),
-            ('m4_2', 'm4_2_indicator_completeness.md'),
-            ('m4_3', 'm4_3_outliers.md'),
-            ('m4_4', 'm4_4_internal_consistency.md'),
-            ('m4_5', 'm4_5_overall_dqa_score.md'),
-        ],
-    },
-    5: {
-        'name': 'Data Quality Adjustment',
-        'folder': 'm5_data_quality_adjustment',
-        'topics': [
-            ('m5_1', 'm5_1_approach_to_dq_adjustment.md'),
-            ('m5_2', 'm5_2_adjustment_for_outliers.md'),
-            ('m5_3', 'm5_3_adjustment_for_completeness.md'),
-        ],
-    },
-    6: {
-        'name': 'Data Analysis',
-        'folder': 'm6_data_analysis',
-        'topics': [
-            ('m6_1', 'm6_1_service_utilization.md'),
-            ('m6_2', 'm6_2_surplus_disruption_analyses.md'),
-            ('m6_3', 'm6_3_service_coverage.md'),
-        ],
-    },
-    7: {
-        'name': 'Results Communication',
-        'folder': 'm7_results_communication',
-        'topics': [
-            ('m7_1', 'm7_1_analytical_thinking_interpretation.md'),
-            ('m7_2', 'm7_2_data_visualization_communication.md'),
-            ('m7_3', 'm7_3_using_data_for_decision_making.md'),
-            ('m7_4', 'm7_4_stakeholder_engagement_advocacy.md'),
-            ('m7_5', 'm7_5_practice_quarterly_reporting.md'),
-        ],
-    },
+# Module folders and topic files come from core_content/slide_index.json,
+# written by tools/00_extract_slides.py. Only display names live here.
+
+MODULE_NAMES = {
+    0: 'Introduction to FASTR',
+    1: 'Identify Questions & Indicators',
+    2: 'Data Extraction',
+    3: 'FASTR Analytics Platform',
+    4: 'Data Quality Assessment',
+    5: 'Data Quality Adjustment',
+    6: 'Data Analysis',
+    7: 'Results Communication',
 }
 
+# Maps module numbers to {'name', 'folder', 'topics': [(topic_id, filename)]}
+# Populated from the slide index by load_modules()
+MODULES = {}
+
+
+def load_modules(base_dir, index=None):
+    """
+    Populate MODULES from the slide index (one file read).
+
+    Safe to call repeatedly; the index is only loaded once per process.
+    Passing an index (e.g. one just built by extraction) replaces MODULES.
+    """
+    if index is not None:
+        MODULES.clear()
+    elif MODULES:
+        return MODULES
+    else:
+        index = load_slide_index(base_dir)
+    for key, module in index['modules'].items():
+        module_num = int(key)
+        folder = module['folder']
+        name = MODULE_NAMES.get(module_num)
+        if not name:
+            # Derive from folder name: m8_new_module -> New Module
+            name = ' '.join(folder.split('_')[1:]).title()
+        MODULES[module_num] = {
+            'name': name,
+            'folder': folder,
+            'topics': [(topic_id, os.path.basename(path))
+                       for topic_id, path in module_topics(index, module_num)],
+            # Slide statistics per topic, for duration estimates
+            'stats': {topic_id: index['slides'][topic_id] for topic_id in module['topics']},
+        }
+    return MODULES
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # SCHEDULE PRESETS
@@ -551,8 +635,10 @@ def load_yaml_config(yaml_path):
         'lunch_time': schedule.get('lunch_time', '12:30 PM'),
         'afternoon_tea_time': schedule.get('afternoon_tea', '3:30 PM'),
         'day_start_time': schedule.get('start_time', '9:00 AM'),
+        'durations': schedule.get('durations') or {},
 
         'deck_order': content.get('deck_order', []),
+        'country_data': yaml_config.get('country_data') or {},
         'include_day_end_slides': True,
         'include_closing': True,
 
@@ -564,8 +650,17 @@ def load_yaml_config(yaml_path):
     return config
 
 
+# Workshop configs parsed ahead of time (e.g. by `fastr serve`), keyed by
+# workshop ID. Each build gets its own copy.
+PRELOADED_CONFIGS = {}
+
+
 def load_workshop_config(workshop_id, base_dir):
     """Load workshop config from YAML or Python file."""
+    if workshop_id in PRELOADED_CONFIGS:
+        print(f"   Using preloaded workshop config")
+        return copy.deepcopy(PRELOADED_CONFIGS[workshop_id])
+
     workshop_dir = os.path.join(base_dir, "workshops", workshop_id)
     yaml_path = os.path.join(workshop_dir, "workshop.yaml")
     py_path = os.path.join(workshop_dir, "config.py")
@@ -759,8 +854,8 @@ def confirm_schedule():
         sys.exit(0)
 
 
-def substitute_variables(content, config, extra_vars=None):
-    """Replace {{VARIABLE}} placeholders with actual values"""
+def build_replacements(config, extra_vars=None):
+    """Build the {{VARIABLE}} -> value mapping for a workshop config"""
     replacements = {
         'WORKSHOP_ID': config.get('workshop_id', ''),
         'WORKSHOP_NAME': config.get('name', ''),
@@ -785,15 +880,98 @@ def substitute_variables(content, config, extra_vars=None):
     if extra_vars:
         replacements.update(extra_vars)
 
-    result = content
-    for var, value in replacements.items():
-        pattern = f'{{{{{var}}}}}'
-        result = result.replace(pattern, str(value))
+    return replacements
 
-    return result
+
+# ═══════════════════════════════════════════════════════════════════════
+# TEMPLATE ENGINE
+# ═══════════════════════════════════════════════════════════════════════
+# Each distinct file content is compiled once into alternating literal
+# text and {{VARIABLE}} names. Rendering is then a single join, and the
+# variables a file uses come from the same pass (no separate scan for
+# validation).
+
+VARIABLE_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+
+class CompiledTemplate:
+    """Markdown content split into literal segments and variable names"""
+
+    __slots__ = ('literals', 'names', 'variables')
+
+    def __init__(self, content):
+        parts = VARIABLE_PATTERN.split(content)
+        self.literals = parts[0::2]   # always len(names) + 1
+        self.names = parts[1::2]
+        self.variables = frozenset(self.names)
+
+    def render(self, replacements, unknown=None):
+        """
+        Substitute variables in a single pass.
+
+        Variables missing from replacements are left as {{NAME}} and, if
+        an `unknown` set is given, added to it.
+        """
+        if not self.names:
+            return self.literals[0]
+
+        out = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            value = replacements.get(name)
+            if value is None:
+                out.append(f'{{{{{name}}}}}')
+                if unknown is not None:
+                    unknown.add(name)
+            else:
+                out.append(str(value))
+            out.append(literal)
+        return ''.join(out)
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_template(content):
+    """Compile content into a CompiledTemplate (cached by content)"""
+    return CompiledTemplate(content)
+
+
+def substitute_variables(content, config, extra_vars=None, replacements=None, unknown=None):
+    """
+    Replace {{VARIABLE}} placeholders with actual values
+
+    Pass a prebuilt `replacements` dict (from build_replacements) to avoid
+    rebuilding it for every file. Names with no value are collected in the
+    optional `unknown` set.
+    """
+    if replacements is None:
+        replacements = build_replacements(config, extra_vars)
+    elif extra_vars:
+        replacements = {**replacements, **extra_vars}
+
+    return compile_template(content).render(replacements, unknown)
+
+
+# Pattern to match ![alt](path) including paths with parentheses
+IMAGE_REF_PATTERN = re.compile(r'!\[([^\]]*)\]\((.*?\.(?:png|jpg|jpeg|gif|svg|webp))\)', re.IGNORECASE)
+
+
+def get_assets_relative_path(original_path):
+    """
+    Return the path within assets/ referenced by an image path,
+    or None if the image is not an assets/ reference.
+    """
+    # Only process paths that reference assets
+    if '../assets/' not in original_path and 'assets/' not in original_path:
+        return None
+
+    # Extract the relative path within assets/
+    if '../assets/' in original_path:
+        return original_path.split('../assets/', 1)[1]
+    elif original_path.startswith('assets/'):
+        return original_path[14:]  # Remove 'assets/'
+    return None
 
 
-def resolve_asset_overrides(content, workshop_id, base_dir):
+def resolve_asset_overrides(content, workshop_id, base_dir, workshop_assets=None):
     """
     Check for workshop-specific asset overrides and rewrite paths.
 
@@ -801,14 +979,15 @@ def resolve_asset_overrides(content, workshop_id, base_dir):
     it will override the default assets/fastr-outputs/m1_completeness.png.
 
     Paths in content like "../assets/X" are rewritten to "../workshops/{id}/assets/X"
-    if the override exists.
+    if the override exists. workshop_assets is the set of files in the
+    workshop's assets/ folder (see list_workshop_assets); it is looked up
+    in memory instead of checking each image on disk.
     """
-    import re
-
-    workshop_assets_dir = os.path.join(base_dir, "workshops", workshop_id, "assets")
+    if workshop_assets is None:
+        workshop_assets = list_workshop_assets(workshop_id, base_dir)
 
-    if not os.path.exists(workshop_assets_dir):
-        return content, []  # No workshop assets folder, no overrides
+    if not workshop_assets:
+        return content, []  # No workshop assets, no overrides
 
     overrides_applied = []
 
@@ -816,23 +995,13 @@ def resolve_asset_overrides(content, workshop_id, base_dir):
     def replace_if_override(match):
         full_match = match.group(0)
         alt_text = match.group(1)
-        original_path = match.group(2)
+        assets_rel = get_assets_relative_path(match.group(2))
 
-        # Only process paths that reference assets
-        if '../assets/' not in original_path and 'assets/' not in original_path:
-            return full_match
-
-        # Extract the relative path within assets/
-        if '../assets/' in original_path:
-            assets_rel = original_path.split('../assets/', 1)[1]
-        elif original_path.startswith('assets/'):
-            assets_rel = original_path[14:]  # Remove 'assets/'
-        else:
+        if assets_rel is None:
             return full_match
 
         # Check if workshop has an override
-        override_path = os.path.join(workshop_assets_dir, assets_rel)
-        if os.path.exists(override_path):
+        if assets_rel in workshop_assets:
             # Rewrite to workshop-specific path
             new_path = f"../workshops/{workshop_id}/assets/{assets_rel}"
             overrides_applied.append(assets_rel)
@@ -840,22 +1009,159 @@ def resolve_asset_overrides(content, workshop_id, base_dir):
 
         return full_match
 
-    # Pattern to match ![alt](path) including paths with parentheses
-    pattern = r'!\[([^\]]*)\]\((.*?\.(?:png|jpg|jpeg|gif|svg|webp))\)'
-    content = re.sub(pattern, replace_if_override, content, flags=re.IGNORECASE)
+    content = IMAGE_REF_PATTERN.sub(replace_if_override, content)
 
     return content, overrides_applied
 
 
-def read_markdown_file(filepath):
-    """Read a markdown file and return its content"""
+# ═══════════════════════════════════════════════════════════════════════
+# TRANSFORM CACHE
+# ═══════════════════════════════════════════════════════════════════════
+# Transformed core_content fragments are cached on disk, keyed by the file's
+# content hash, the values of the variables it uses and the workshop asset
+# overrides that apply to it. Workshops sharing the same content therefore
+# share cache entries. Bump TRANSFORM_CACHE_VERSION when the transform changes.
+#
+# The cache is off unless asked for (--transform-cache). Validation reads
+# every core_content file anyway, and rendering a compiled template takes
+# about as long as reading a cache entry back from disk, so for decks of
+# this size it does not make builds faster.
+
+TRANSFORM_CACHE_VERSION = 2
+TRANSFORM_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def open_transform_cache(base_dir):
+    """Open the on-disk cache of transformed slide fragments"""
+    cache_dir = os.path.join(base_dir, DEFAULT_CACHE_DIR, 'transforms')
+    return ContentCache(cache_dir, max_bytes=TRANSFORM_CACHE_MAX_BYTES)
+
+
+def list_workshop_assets(workshop_id, base_dir, asset_index=None):
+    """
+    Return the set of paths (relative to the workshop's assets/ folder) it contains
+
+    Uses asset_index if given, otherwise walks the folder.
+    """
+    workshop_assets_dir = os.path.join(base_dir, "workshops", workshop_id, "assets")
+    if asset_index is None:
+        asset_index = AssetIndex([workshop_assets_dir])
+    return asset_index.files_under(workshop_assets_dir)
+
+
+def transform_cache_key(raw_content, template, replacements, workshop_id, workshop_assets):
+    """Cache key for one core_content file's transform"""
+    variables = [(var, replacements.get(var)) for var in sorted(template.variables)]
+
+    overrides = set()
+    for match in IMAGE_REF_PATTERN.finditer(raw_content):
+        assets_rel = get_assets_relative_path(match.group(2))
+        if assets_rel is not None and assets_rel in workshop_assets:
+            overrides.add(assets_rel)
+
+    # The workshop ID only matters if it ends up in rewritten asset paths
+    return make_key(TRANSFORM_CACHE_VERSION, hash_text(raw_content), variables,
+                    workshop_id if overrides else None, sorted(overrides))
+
+
+def transform_core_file(filepath, config, workshop_id, base_dir, cache=None,
+                        replacements=None, workshop_assets=None, unknown=None, files=None):
+    """
+    Read and transform one core_content file (frontmatter, variables, asset overrides).
+
+    Returns (content, overrides). If a cache is given, the result is looked
+    up by content key first and stored after a miss; replacements and
+    workshop_assets should then be computed once per build and passed in.
+    Variables with no value are added to the optional `unknown` set, and
+    the file is read through the optional shared `files` cache.
+    """
+    raw_content = read_markdown_file(filepath, files)
+    if not raw_content:
+        return "", []
+
+    if replacements is None:
+        replacements = build_replacements(config)
+
+    template = compile_template(strip_frontmatter(raw_content))
+    if unknown is not None:
+        unknown.update(name for name in template.variables if name not in replacements)
+
+    if workshop_assets is None:
+        workshop_assets = list_workshop_assets(workshop_id, base_dir)
+
+    key = None
+    if cache is not None:
+        key = transform_cache_key(raw_content, template, replacements, workshop_id, workshop_assets)
+        cached = cache.get_json(key)
+        if cached is not None:
+            return cached['content'], cached['overrides']
+
+    content = template.render(replacements)
+    with span("asset resolution", category='assets'):
+        content, overrides = resolve_asset_overrides(content, workshop_id, base_dir, workshop_assets)
+
+    if key is not None:
+        cache.put_json(key, {'content': content, 'overrides': overrides})
+
+    return content, overrides
+
+
+# Files read ahead of time (e.g. core_content/ for batch builds), keyed by
+# absolute path. Worker processes inherit or receive one shared copy.
+PRELOADED_FILES = {}
+
+
+def preload_core_content(base_dir):
+    """
+    Read every core_content file listed in the slide index into memory
+    and compile its template, so many builds share one parsed copy.
+    """
+    load_modules(base_dir)
+    core_content_dir = os.path.join(base_dir, "core_content")
+    for module in MODULES.values():
+        for _, topic_file in module['topics']:
+            filepath = os.path.abspath(os.path.join(core_content_dir, module['folder'], topic_file))
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except FileNotFoundError:
+                continue
+            PRELOADED_FILES[filepath] = content
+            compile_template(strip_frontmatter(content))
+    return PRELOADED_FILES
+
+
+def load_file(filepath, files=None):
+    """
+    Return a file's content, or None if it does not exist.
+
+    files is an optional dict (absolute path -> content, or None if
+    missing) shared by validation and the build of one workshop, so each
+    input is read from disk at most once and both see the same contents.
+    """
+    key = os.path.abspath(filepath)
+    preloaded = PRELOADED_FILES.get(key)
+    if preloaded is not None:
+        return preloaded
+    if files is not None and key in files:
+        return files[key]
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(key, 'r', encoding='utf-8') as f:
             content = f.read()
-        return content
     except FileNotFoundError:
+        content = None
+    if files is not None:
+        files[key] = content
+    return content
+
+
+def read_markdown_file(filepath, files=None):
+    """Read a markdown file and return its content"""
+    content = load_file(filepath, files)
+    if content is None:
         print(f"Warning: File not found: {filepath}")
         return ""
+    return content
 
 
 def strip_frontmatter(content):
@@ -981,27 +1287,751 @@ def add_custom_slides_at_position(position, config, workshop_dir, base_dir):
     return content
 
 
-def build_workshop_deck(workshop_id, base_dir, output_file=None, skip_confirmation=False, override_days=None):
-    """Build a complete slide deck for a workshop"""
+# ═══════════════════════════════════════════════════════════════════════
+# DECK ASSEMBLY PIPELINE
+# ═══════════════════════════════════════════════════════════════════════
+# A deck is assembled as a stream:
+#   iter_deck_plan()           source: what goes in the deck, in order
+#   render_deck_fragments()    transform: read/substitute/resolve each item
+#   write_fragments_atomically() sink: stream to a temp file, rename into place
+# Only one fragment is held at a time, and the plan and render stages can
+# feed other sinks (e.g. other output formats).
+
+MARP_FRONTMATTER = """---
+marp: true
+theme: fastr
+paginate: true
+---
+
+"""
+
+
+def iter_deck_plan(config, deck_order, schedule, num_days, base_dir, workshop_id, files=None):
+    """
+    Source stage: yield the items that make up a deck, in order.
+
+    Each item is a dict with a 'kind':
+        text       - literal markdown ('text')
+        message    - progress line to print ('text'), no content
+        template   - templates/ file (title slide, agenda fallback)
+        agenda     - agenda generated from the YAML schedule
+        custom     - custom slide from the workshop folder
+        core       - core_content file of a module/topic
+        module_end - all files of a module/topic have been emitted
+        break      - tea/lunch/afternoon break slide ('type')
+        day_end    - end-of-day slide ('day', 'next_sessions')
+        closing    - closing slides
+
+    Every item after the frontmatter and title slide also has the 'deck_day'
+    it falls on in the deck: 1 up to the first end of day, then one more after
+    each end of day, so days are contiguous runs of slides.
+    """
+    workshop_dir = os.path.join(base_dir, "workshops", workshop_id)
+    core_content_dir = os.path.join(base_dir, "core_content")
+    templates_dir = os.path.join(base_dir, "templates")
+    exclude_list = config.get('exclude', [])
+
+    # Build a lookup for break info by session
+    break_info = {entry['session']: entry for entry in schedule}
+
+    # Start with Marp frontmatter, then the title slide
+    yield {'kind': 'text', 'text': MARP_FRONTMATTER}
+    yield {'kind': 'template', 'path': os.path.join(templates_dir, "title_slide.md"),
+           'message': "   Title slide added"}
+
+    yield {'kind': 'message', 'text': "\nAdding slides in order:"}
+    current_day = 0
+    item_day = 1
+
+    for item in deck_order:
+        # Check what type of item this is
+        if item == 'agenda':
+            # Agenda slide - generate from YAML config or use template
+            if config.get('_is_yaml'):
+                yield {'kind': 'agenda', 'deck_day': item_day, 'message': "   Agenda (generated from config)"}
+            else:
+                # Fall back to template for Python config
+                yield {'kind': 'template', 'path': os.path.join(templates_dir, "agenda.md"),
+                       'deck_day': item_day, 'message': "   Agenda (from template)"}
+
+        elif item.endswith('.md'):
+            # Custom slide from workshop folder (or templates/custom_slides/)
+            custom_path = resolve_custom_slide(item, workshop_dir, base_dir, files)
+            yield {'kind': 'custom', 'path': custom_path or os.path.join(workshop_dir, item),
+                   'deck_day': item_day, 'message': f"   {item} (custom)"}
+
+        elif is_module_prefix(item):
+            # Module prefix (m0, m0_1, m4_2, etc.)
+            module_files, name, is_valid = resolve_module_prefix(item, exclude=exclude_list)
+            entry = break_info.get(item, {})
+
+            # Day separator (for multi-day)
+            if entry.get('day', 1) != current_day:
+                current_day = entry.get('day', 1)
+                if num_days > 1:
+                    yield {'kind': 'message', 'text': f"\n   DAY {current_day}:"}
+
+            if not (is_valid and module_files):
+                yield {'kind': 'message', 'text': f"   Warning: Unknown module prefix '{item}'"}
+                continue
+
+            # Add all files for this module/topic
+            for filename in module_files:
+                yield {'kind': 'core', 'path': os.path.join(core_content_dir, filename), 'deck_day': item_day}
+            yield {'kind': 'module_end', 'item': item, 'name': name}
+
+            # Add breaks after module
+            if entry.get('tea_after'):
+                yield {'kind': 'break', 'type': 'tea', 'deck_day': item_day, 'message': "      ☕ Tea break"}
+            if entry.get('lunch_after'):
+                yield {'kind': 'break', 'type': 'lunch', 'deck_day': item_day, 'message': "      🍽️  Lunch break"}
+            if entry.get('afternoon_tea_after'):
+                yield {'kind': 'break', 'type': 'afternoon_tea', 'deck_day': item_day,
+                       'message': "      ☕ Afternoon break"}
+
+            # Add end-of-day slide
+            if entry.get('end_of_day') and config.get('include_day_end_slides', True):
+                next_day_sessions = [e['session'] for e in schedule if e['day'] == current_day + 1]
+                yield {'kind': 'day_end', 'day': current_day, 'deck_day': item_day,
+                       'next_sessions': next_day_sessions,
+                       'message': f"      🌙 End of Day {current_day}"}
+            if entry.get('end_of_day'):
+                item_day += 1
+
+        else:
+            yield {'kind': 'message', 'text': f"   Warning: Unknown item '{item}'"}
+
+    # Add closing slide
+    if config.get('include_closing', True):
+        yield {'kind': 'closing', 'path': os.path.join(templates_dir, "closing.md"),
+               'deck_day': item_day, 'message': "\nClosing slides added"}
+
+
+def render_item(item, context, unknown):
+    """
+    Render one plan item to a markdown fragment.
+
+    Returns (fragment, overrides) where overrides is the number of workshop
+    asset overrides applied. Variables with no value are added to `unknown`.
+    """
+    config = context['config']
+    replacements = context['replacements']
+    kind = item['kind']
+
+    if kind == 'text':
+        return item['text'], 0
+
+    if kind in ('template', 'custom', 'closing'):
+        content = read_markdown_file(item['path'], context.get('files'))
+        if not content:
+            return "", 0
+        content = strip_frontmatter(content)
+        content = substitute_variables(content, config, replacements=replacements, unknown=unknown)
+        if kind == 'template':
+            return ensure_slide_break(content) + "\n", 0
+        if kind == 'custom':
+            return "\n" + ensure_slide_break(content) + "\n", 0
+        return content + "\n", 0
+
+    if kind == 'agenda':
+        agenda_content = generate_agenda_slide(config)
+        return (ensure_slide_break(agenda_content) + "\n" if agenda_content else ""), 0
+
+    if kind == 'core':
+        content, overrides = transform_core_file(
+            item['path'], config, context['workshop_id'], context['base_dir'],
+            cache=context['cache'], replacements=replacements,
+            workshop_assets=context['workshop_assets'], unknown=unknown,
+            files=context.get('files'))
+        if not content:
+            return "", 0
+        return "\n" + ensure_slide_break(content) + "\n", len(overrides)
+
+    if kind == 'break':
+        return generate_break_slide(item['type'], config), 0
+
+    if kind == 'day_end':
+        return generate_day_end_slide(item['day'], item['next_sessions'], config), 0
+
+    raise ValueError(f"Unknown deck item kind: {kind}")
+
+
+def render_deck_fragments(plan, context):
+    """
+    Transform stage: turn plan items into markdown fragments.
+
+    context holds the config, workshop_id, base_dir, prebuilt replacements,
+    the unknown_vars set to fill, and the optional transform cache and
+    workshop asset set. If it has a 'sections' list, a record of every
+    rendered section is appended to it; if it has a 'splicer', unchanged
+    sections are copied from the previous build instead of being rendered.
+    Progress is printed as items are rendered.
+    """
+    base_dir = context['base_dir']
+    unknown_vars = context['unknown_vars']
+    sections = context.get('sections')
+    splicer = context.get('splicer')
+    module_overrides = 0
+
+    try:
+        for item in plan:
+            kind = item['kind']
+
+            if kind == 'message':
+                print(item['text'])
+                continue
+
+            if kind == 'module_end':
+                print(f"   [{item['item']}] {item['name']}")
+                if module_overrides:
+                    print(f"      📊 {module_overrides} custom asset(s)")
+                module_overrides = 0
+                continue
+
+            path = dep_key(item['path'], base_dir) if 'path' in item else None
+            previous = splicer.take(kind, path) if splicer else None
+            if previous:
+                section, fragment = previous
+                item_unknown = set(section['unknown'])
+                overrides = section['overrides']
+            else:
+                item_unknown = set()
+                with span(f"transform {os.path.basename(path) if path else kind}", category='transform'):
+                    fragment, overrides = render_item(item, context, item_unknown)
+
+            unknown_vars.update(item_unknown)
+            module_overrides += overrides
+            if sections is not None:
+                sections.append({
+                    'kind': kind,
+                    'path': path,
+                    'day': item.get('deck_day'),
+                    'length': len(fragment),
+                    'hash': hash_text(fragment),
+                    'unknown': sorted(item_unknown),
+                    'overrides': overrides,
+                })
+
+            if fragment:
+                yield fragment
+                if item.get('message'):
+                    print(item['message'])
+    finally:
+        if splicer:
+            splicer.close()
+
+
+def tee_fragments(fragments, sink):
+    """Pass fragments through unchanged, also appending each to sink"""
+    for fragment in fragments:
+        sink.append(fragment)
+        yield fragment
+
+
+def write_fragments_atomically(fragments, output_path):
+    """
+    Sink stage: stream fragments to a temporary file beside output_path,
+    then rename it into place. Readers never see a half-written deck.
+    """
+    output_dir = os.path.dirname(output_path)
+    os.makedirs(output_dir, exist_ok=True)
+    temp_path = os.path.join(output_dir, f".{os.path.basename(output_path)}.{os.getpid()}.tmp")
+
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for fragment in fragments:
+                f.write(fragment)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return output_path
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# DEPENDENCY MANIFEST (incremental rebuilds)
+# ═══════════════════════════════════════════════════════════════════════
+# Each build writes outputs/<name>.deps.json beside the deck. It records
+# every input the deck depends on - the workshop config, templates/, the
+# module registry of the slide index, each core_content file and custom
+# slide, the list of files in the workshop folder (incl. asset overrides)
+# and the tools/ scripts - plus the position and schedule day of every
+# section in the deck. On the next build:
+#   - nothing changed               -> the build is skipped
+#   - only content files changed    -> changed sections are re-rendered and
+#                                      the rest copied from the old deck
+#   - anything global changed       -> full rebuild
+# Files are compared by mtime and size first, and hashed only if those differ.
+# Extraction rewrites slide_index.json whenever a topic's content changes,
+# so only its registry part (module folders and topic files) is a global
+# input; changed topics are caught by their own sections.
+
+DEPS_MANIFEST_VERSION = 3
+
+
+def get_deps_manifest_path(output_path):
+    """Dependency manifest written beside a deck"""
+    return os.path.splitext(output_path)[0] + '.deps.json'
+
+
+def dep_key(path, base_dir):
+    """Manifest key for a path: relative to the repo root, with / separators"""
+    return os.path.relpath(path, base_dir).replace(os.sep, '/')
+
+
+def text_hash(path, files=None):
+    """
+    Hash of a file's text as the build reads it, or None if it is missing.
+
+    Uses the shared `files` cache if it holds the file, so inputs the build
+    has already read are not read again.
+    """
+    key = os.path.abspath(path)
+    if files is not None and files.get(key) is not None:
+        return hash_text(files[key])
+    try:
+        with open(key, 'r', encoding='utf-8', errors='replace') as f:
+            return hash_text(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def snapshot_file(path, files=None, since=None):
+    """
+    Record a file's mtime, size and content hash (hash is None if missing).
+
+    Files modified at or after `since` (ns timestamp of the build start) may
+    have changed after they were read, so their mtime is not recorded and
+    the next check falls back to comparing hashes.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return {'mtime_ns': None, 'size': None, 'hash': None}
+    mtime_ns = stat.st_mtime_ns
+    if since is not None and mtime_ns >= since:
+        mtime_ns = None
+    return {'mtime_ns': mtime_ns, 'size': stat.st_size, 'hash': text_hash(path, files)}
+
+
+def file_changed(path, snapshot):
+    """True if a file no longer matches its snapshot"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return snapshot.get('hash') is not None
+    if stat.st_mtime_ns == snapshot.get('mtime_ns') and stat.st_size == snapshot.get('size'):
+        return False
+    # Touched but possibly identical (e.g. a fresh git checkout)
+    return text_hash(path) != snapshot.get('hash')
+
+
+def listing_hash(directory):
+    """Hash of the names of all files under a directory (detects added/removed files)"""
+    names = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            names.append(os.path.relpath(os.path.join(root, name), directory).replace(os.sep, '/'))
+    return make_key(names)
+
+
+def find_config_path(workshop_id, base_dir):
+    """Path of the config file load_workshop_config() reads, or None"""
+    workshop_dir = os.path.join(base_dir, "workshops", workshop_id)
+    yaml_path = os.path.join(workshop_dir, "workshop.yaml")
+    if os.path.exists(yaml_path) and YAML_AVAILABLE:
+        return yaml_path
+    py_path = os.path.join(workshop_dir, "config.py")
+    return py_path if os.path.exists(py_path) else None
+
+
+def build_modules():
+    """
+    Source files of this script and of every tools/ module it imports,
+    directly or through another tools/ module
+    """
+    tools_dir = os.path.dirname(os.path.abspath(__file__))
+    paths = {os.path.abspath(__file__)}
+    pending = [sys.modules.get(__name__)]
+    seen = set()
+    while pending:
+        module = pending.pop()
+        if module is None or id(module) in seen:
+            continue
+        seen.add(id(module))
+        for value in list(vars(module).values()):
+            if not isinstance(value, types.ModuleType):
+                name = getattr(value, '__module__', None)
+                value = sys.modules.get(name) if isinstance(name, str) else None
+            path = getattr(value, '__file__', None)
+            if path and os.path.dirname(os.path.abspath(path)) == tools_dir:
+                paths.add(os.path.abspath(path))
+                pending.append(value)
+    return sorted(paths)
+
+
+def global_dependencies(workshop_id, base_dir):
+    """
+    Inputs that can affect any part of the deck.
+
+    Returns (files, directories): file paths to snapshot, and directories
+    whose file listing is recorded. The slide index is recorded separately
+    (index_registry_hash()).
+    """
+    files = build_modules()
+    config_path = find_config_path(workshop_id, base_dir)
+    if config_path:
+        files.append(config_path)
+
+    templates_dir = os.path.join(base_dir, "templates")
+    for root, dirs, names in os.walk(templates_dir):
+        dirs.sort()
+        files.extend(os.path.join(root, name) for name in sorted(names))
+
+    directories = [templates_dir, os.path.join(base_dir, "workshops", workshop_id)]
+    return files, directories
+
+
+def index_registry_hash(base_dir):
+    """
+    Hash of the part of the slide index that decides the deck's structure:
+    each module's folder and its topic files in order. Topic hashes and
+    slide statistics are left out.
+    """
+    index = load_slide_index(base_dir)
+    return make_key([(key, module['folder'], module_topics(index, int(key)))
+                     for key, module in sorted(index['modules'].items())])
+
+
+def load_deps_manifest(manifest_path):
+    """Load a dependency manifest, or None if missing, unreadable or outdated"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != DEPS_MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def write_deps_manifest(manifest_path, workshop_id, base_dir, options, output_path, sections,
+                        source_files=None, since=None):
+    """
+    Snapshot every dependency of a finished build and write the manifest.
+
+    source_files is the build's shared file cache; inputs it holds are
+    hashed from memory. since is the ns timestamp the build started at.
+    """
+    paths, directories = global_dependencies(workshop_id, base_dir)
+    deps = {}
+    for path in paths:
+        deps[dep_key(path, base_dir)] = snapshot_file(path, source_files, since)
+    for directory in directories:
+        deps[dep_key(directory, base_dir) + '/'] = {'listing': listing_hash(directory)}
+    index_path = get_index_path(base_dir)
+    deps[dep_key(index_path, base_dir)] = dict(snapshot_file(index_path, source_files, since),
+                                               registry=index_registry_hash(base_dir))
+    for section in sections:
+        if section['path'] and section['path'] not in deps:
+            deps[section['path']] = snapshot_file(os.path.join(base_dir, section['path']),
+                                                  source_files, since)
+
+    manifest = {
+        'version': DEPS_MANIFEST_VERSION,
+        'workshop': workshop_id,
+        'options': options,
+        'output': {'path': dep_key(output_path, base_dir), **snapshot_file(output_path)},
+        'deps': deps,
+        'sections': sections,
+    }
+
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+        f.write('\n')
+    os.replace(temp_path, manifest_path)
+
+
+def check_deps_manifest(manifest, workshop_id, base_dir, options, output_path):
+    """
+    Decide how much of a deck needs rebuilding.
+
+    Returns (status, reasons, changed) where status is 'fresh' (skip the
+    build), 'splice' (re-render only sections whose file is in `changed`)
+    or 'full', and reasons are human-readable explanations.
+    """
+    if manifest is None:
+        return 'full', ["no dependency manifest from a previous build"], set()
+    if manifest.get('workshop') != workshop_id or manifest.get('options') != options:
+        return 'full', ["build options changed"], set()
+
+    output = manifest['output']
+    if file_changed(output_path, output):
+        return 'full', [f"{output['path']} was modified or removed since the last build"], set()
+
+    # A new config file (e.g. workshop.yaml replacing config.py) or template
+    paths, directories = global_dependencies(workshop_id, base_dir)
+    expected = {dep_key(path, base_dir) for path in paths}
+    expected.update(dep_key(directory, base_dir) + '/' for directory in directories)
+    expected.add(dep_key(get_index_path(base_dir), base_dir))
+    missing = sorted(expected - set(manifest['deps']))
+    if missing:
+        return 'full', [f"{key} is new" for key in missing], set()
+
+    section_paths = {section['path'] for section in manifest['sections'] if section['path']}
+    global_reasons = []
+    changed = set()
+
+    for key, snapshot in manifest['deps'].items():
+        path = os.path.join(base_dir, key)
+        if 'listing' in snapshot:
+            if listing_hash(path) != snapshot['listing']:
+                global_reasons.append(f"files were added to or removed from {key}")
+        elif 'registry' in snapshot:
+            # Rewritten on every content change; only the registry matters
+            if file_changed(path, snapshot) and index_registry_hash(base_dir) != snapshot['registry']:
+                global_reasons.append(f"modules or topics in {key} changed")
+        elif file_changed(path, snapshot):
+            if key in section_paths:
+                changed.add(key)
+            else:
+                global_reasons.append(f"{key} changed")
+
+    if global_reasons:
+        return 'full', global_reasons, changed
+    if changed:
+        return 'splice', [f"{key} changed" for key in sorted(changed)], changed
+    return 'fresh', [f"{len(manifest['deps'])} input(s) unchanged"], changed
+
+
+class DeckSplicer:
+    """
+    Reads the sections of a previous build back in order, so unchanged
+    sections can be copied into the new deck without re-rendering them.
+
+    take() must be called once per rendered plan item, in order. If the plan
+    no longer lines up with the recorded sections, or a section's text does
+    not match its recorded hash, splicing stops and everything after that
+    point is rendered normally.
+    """
+
+    def __init__(self, output_path, sections, changed):
+        self.file = open(output_path, 'r', encoding='utf-8')
+        self.sections = iter(sections)
+        self.changed = changed
+        self.active = True
+        self.reused = 0
+
+    def take(self, kind, path):
+        """Return (section, text) if the next section can be reused, else None"""
+        if not self.active:
+            return None
+        section = next(self.sections, None)
+        if section is None or section['kind'] != kind or section['path'] != path:
+            self.close()
+            return None
+
+        text = self.file.read(section['length'])
+        if hash_text(text) != section['hash']:
+            self.close()
+            return None
+        if path in self.changed:
+            return None
+
+        self.reused += 1
+        return section, text
+
+    def close(self):
+        self.active = False
+        self.file.close()
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# DAY SHARDS (one deck per day)
+# ═══════════════════════════════════════════════════════════════════════
+# With split_days a build also writes one deck per workshop day beside the
+# combined deck, cut at its end-of-day slides:
+#   outputs/<name>_day1.md, _day2.md, ...   frontmatter + title slide + that day
+#   outputs/<name>.shards.json              the shards in order
+# so each day can be rendered on its own core, in parallel. The combined
+# deck is the first shard followed by every later shard without its first
+# `header.length` characters (the shared frontmatter and title slide);
+# deck_chunks.stitch_day_shards() puts it back together that way and
+# 04_render_pdf.py --shards joins the rendered days into one PDF.
+
+SHARD_MANIFEST_VERSION = 1
+
+
+def get_shard_manifest_path(output_path):
+    """Shard manifest written beside a deck"""
+    return os.path.splitext(output_path)[0] + '.shards.json'
+
+
+def split_day_shards(deck, sections):
+    """
+    Cut a built deck into its shared header and one body per day.
+
+    sections is the build's section list (see render_deck_fragments()).
+    Returns (header, [(day, body)]) in day order.
+    """
+    if sum(section['length'] for section in sections) != len(deck):
+        raise ValueError("the deck does not match its section list")
+    header, days = [], {}
+    position = 0
+    for section in sections:
+        text = deck[position:position + section['length']]
+        position += section['length']
+        if section.get('day') is None:
+            header.append(text)
+        else:
+            days.setdefault(section['day'], []).append(text)
+    return ''.join(header), [(day, ''.join(days[day])) for day in sorted(days)]
+
+
+def write_day_shards(output_path, sections, workshop_id):
+    """
+    Write the per-day decks of a built deck and their manifest.
+
+    Shards whose text is unchanged are left alone, so their renders stay
+    current; shards of days the deck no longer has are removed. Returns the
+    paths of the shards.
+    """
+    with open(output_path, 'r', encoding='utf-8') as f:
+        deck = f.read()
+    header, days = split_day_shards(deck, sections)
+    stem, ext = os.path.splitext(output_path)
+    manifest_path = get_shard_manifest_path(output_path)
+
+    shards, paths = [], []
+    for day, body in days:
+        path = f"{stem}_day{day}{ext}"
+        text = header + body
+        if text_hash(path) != hash_text(text):
+            write_fragments_atomically([text], path)
+        shards.append({'day': day, 'path': os.path.basename(path), 'length': len(text),
+                       'hash': hash_text(text)})
+        paths.append(path)
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+    for shard in previous.get('shards', []):
+        stale = os.path.join(os.path.dirname(output_path), shard.get('path', ''))
+        if shard.get('path') and stale not in paths and os.path.exists(stale):
+            os.remove(stale)
+
+    manifest = {
+        'version': SHARD_MANIFEST_VERSION,
+        'workshop': workshop_id,
+        'deck': os.path.basename(output_path),
+        'deck_hash': hash_text(deck),
+        'header': {'length': len(header), 'hash': hash_text(header)},
+        'shards': shards,
+    }
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+        f.write('\n')
+    os.replace(temp_path, manifest_path)
+    return paths
+
+
+def build_workshop_deck(workshop_id, base_dir, output_file=None, skip_confirmation=False, override_days=None,
+                        use_cache=False, incremental=False, explain=False, collect=None, split_days=False,
+                        check_durations=False):
+    """
+    Build a complete slide deck for a workshop
+
+    With use_cache, transformed core_content fragments are reused from the
+    on-disk transform cache (.fastr_cache/transforms/; off by default, see
+    TRANSFORM CACHE). With incremental,
+    the dependency manifest of the previous build is checked first: the
+    build is skipped if nothing changed, and only changed sections are
+    re-rendered if only content files changed. explain prints why.
+
+    collect (optional dict) receives the written deck text as 'deck' for
+    the next stage of an in-process pipeline (not set if the deck was
+    already up to date).
+
+    With split_days, one deck per day is also written, with a shard
+    manifest (see DAY SHARDS). check_durations warns about agenda entries
+    far from the slide-based estimates, even if the deck is up to date.
+    """
 
     print("\n" + "=" * 70)
     print(f"       BUILDING WORKSHOP: {workshop_id}")
     print("=" * 70)
+    build_start = time.time_ns()
+
+    # Set output filename
+    if not output_file:
+        output_file = f"{workshop_id}_deck.md"
+    output_path = os.path.join(base_dir, "outputs", output_file)
+    manifest_path = get_deps_manifest_path(output_path)
+    options = {'days': override_days}
+
+    status, changed, previous = 'full', set(), None
+    if incremental:
+        print("\nChecking dependencies...")
+        with span("dependency check"):
+            previous = load_deps_manifest(manifest_path)
+            status, reasons, changed = check_deps_manifest(previous, workshop_id, base_dir, options,
+                                                           output_path)
+        if explain:
+            label = {'fresh': "Up to date", 'splice': "Re-splicing changed sections",
+                     'full': "Full rebuild"}[status]
+            print(f"   {label}:")
+            for reason in reasons:
+                print(f"      - {reason}")
+        elif status == 'splice':
+            print(f"   {len(changed)} content file(s) changed - re-splicing (--explain for details)")
+        elif status == 'full' and previous is not None:
+            print(f"   {len(reasons)} change(s) need a full rebuild (--explain for details)")
+
+        if status == 'fresh':
+            print(f"\nDeck is up to date: {output_path}")
+            if split_days:
+                with span("write day shards", category='write'):
+                    shards = write_day_shards(output_path, previous['sections'], workshop_id)
+                print(f"Day decks: {len(shards)} ({os.path.basename(get_shard_manifest_path(output_path))})")
+            if check_durations:
+                config = load_workshop_config(workshop_id, base_dir)
+                load_modules(base_dir)
+                problems = check_agenda_durations(config)
+                print(f"Agenda durations: {len(problems)} warning(s)")
+                for problem in problems:
+                    print(f"   - {problem}")
+            print("\n" + "=" * 70 + "\n")
+            return output_path
 
     # Step 1: Load and validate workshop configuration
     print("\nStep 1: Loading and validating workshop...")
-    config = load_workshop_config(workshop_id, base_dir)
-    print("   Config loaded successfully")
+    with span("config load"):
+        config = load_workshop_config(workshop_id, base_dir)
+        print("   Config loaded successfully")
+        load_modules(base_dir)
 
     # Validate before building
-    valid, errors, warnings = validate_workshop(workshop_id, base_dir, config)
+    # Inputs are read once, shared by validation and assembly; one walk of
+    # the asset folders answers every image lookup
+    files = {}
+    with span("asset index", category='assets'):
+        asset_index = build_asset_index(base_dir, workshop_id)
+    with span("validation"):
+        valid, errors, warnings = validate_workshop(workshop_id, base_dir, config, files, asset_index,
+                                                    check_durations)
     if not valid:
         print("\n   Build cancelled due to errors. Please fix the issues above.")
         sys.exit(1)
 
     # Check if using new deck_order format
     deck_order = config.get('deck_order')
-    exclude_list = config.get('exclude', [])
 
     # Step 2: Determine number of days
     if override_days:
@@ -1024,12 +2054,8 @@ def build_workshop_deck(workshop_id, base_dir, output_file=None, skip_confirmati
     sessions = [item for item in deck_order if not item.endswith('.md') and item != 'agenda']
 
     # Step 4: Generate schedule (for break placement)
-    schedule = generate_schedule(sessions, num_days, config)
-
-    # Build a lookup for break info by session
-    break_info = {}
-    for entry in schedule:
-        break_info[entry['session']] = entry
+    with span("schedule generation"):
+        schedule = generate_schedule(sessions, num_days, config)
 
     # Step 5: Preview and confirm
     if not skip_confirmation:
@@ -1038,151 +2064,71 @@ def build_workshop_deck(workshop_id, base_dir, output_file=None, skip_confirmati
             print("\nBuild cancelled. Please adjust your config.py and try again.")
             sys.exit(0)
 
-    # Step 6: Set output filename
-    if not output_file:
-        output_file = f"{workshop_id}_deck.md"
-
     print(f"\nStep 2: Assembling deck components...")
 
-    # Start with Marp frontmatter
-    deck_content = """---
-marp: true
-theme: fastr
-paginate: true
----
-
-"""
-
-    # Add title slide
-    template_path = os.path.join(base_dir, "templates", "title_slide.md")
-    title_content = read_markdown_file(template_path)
-    if title_content:
-        title_content = strip_frontmatter(title_content)
-        title_content = substitute_variables(title_content, config)
-        deck_content += ensure_slide_break(title_content) + "\n"
-        print(f"   Title slide added")
-
-    # Workshop and content directories
-    workshop_dir = os.path.join(base_dir, "workshops", workshop_id)
-    core_content_dir = os.path.join(base_dir, "core_content")
-
-    # ═══════════════════════════════════════════════════════════════════════
-    # BUILD DECK FROM deck_order
-    # ═══════════════════════════════════════════════════════════════════════
-    print(f"\nAdding slides in order:")
-    current_day = 0
-
-    for item in deck_order:
-        # Check what type of item this is
-        if item == 'agenda':
-            # Agenda slide - generate from YAML config or use template
-            if config.get('_is_yaml'):
-                # Generate agenda from YAML schedule
-                agenda_content = generate_agenda_slide(config)
-                if agenda_content:
-                    deck_content += ensure_slide_break(agenda_content) + "\n"
-                    print(f"   Agenda (generated from config)")
-            else:
-                # Fall back to template for Python config
-                agenda_path = os.path.join(base_dir, "templates", "agenda.md")
-                agenda_content = read_markdown_file(agenda_path)
-                if agenda_content:
-                    agenda_content = strip_frontmatter(agenda_content)
-                    agenda_content = substitute_variables(agenda_content, config)
-                    deck_content += ensure_slide_break(agenda_content) + "\n"
-                    print(f"   Agenda (from template)")
-
-        elif item.endswith('.md'):
-            # Custom slide from workshop folder
-            custom_path = os.path.join(workshop_dir, item)
-            content = read_markdown_file(custom_path)
-            if content:
-                content = strip_frontmatter(content)
-                content = substitute_variables(content, config)
-                deck_content += "\n" + ensure_slide_break(content) + "\n"
-                print(f"   {item} (custom)")
-
-        elif is_module_prefix(item):
-            # Module prefix (m0, m0_1, m4_2, etc.)
-            files, name, is_valid = resolve_module_prefix(item, exclude=exclude_list)
-            entry = break_info.get(item, {})
-
-            # Day separator (for multi-day)
-            if entry.get('day', 1) != current_day:
-                current_day = entry.get('day', 1)
-                if num_days > 1:
-                    print(f"\n   DAY {current_day}:")
-
-            if is_valid and files:
-                # Add all files for this module/topic
-                module_overrides = []
-                for filename in files:
-                    filepath = os.path.join(core_content_dir, filename)
-                    content = read_markdown_file(filepath)
-                    if content:
-                        content = strip_frontmatter(content)
-                        content = substitute_variables(content, config)
-                        content, overrides = resolve_asset_overrides(content, workshop_id, base_dir)
-                        module_overrides.extend(overrides)
-                        deck_content += "\n" + ensure_slide_break(content) + "\n"
-
-                print(f"   [{item}] {name}")
-                if module_overrides:
-                    print(f"      📊 {len(module_overrides)} custom asset(s)")
-
-                # Add breaks after module
-                if entry.get('tea_after'):
-                    deck_content += generate_break_slide('tea', config)
-                    print(f"      ☕ Tea break")
-
-                if entry.get('lunch_after'):
-                    deck_content += generate_break_slide('lunch', config)
-                    print(f"      🍽️  Lunch break")
-
-                if entry.get('afternoon_tea_after'):
-                    deck_content += generate_break_slide('afternoon_tea', config)
-                    print(f"      ☕ Afternoon break")
-
-                # Add end-of-day slide
-                if entry.get('end_of_day') and config.get('include_day_end_slides', True):
-                    next_day_sessions = [e['session'] for e in schedule if e['day'] == current_day + 1]
-                    deck_content += generate_day_end_slide(current_day, next_day_sessions, config)
-                    print(f"      🌙 End of Day {current_day}")
-            else:
-                print(f"   Warning: Unknown module prefix '{item}'")
-
-        else:
-            print(f"   Warning: Unknown item '{item}'")
-
-    # Add closing slide
-    if config.get('include_closing', True):
-        closing_path = os.path.join(base_dir, "templates", "closing.md")
-        closing_content = read_markdown_file(closing_path)
-        if closing_content:
-            closing_content = strip_frontmatter(closing_content)
-            closing_content = substitute_variables(closing_content, config)
-            deck_content += closing_content + "\n"
-            print(f"\nClosing slides added")
-
-    # Write output file
-    print(f"\nStep 3: Writing output file...")
-    output_dir = os.path.join(base_dir, "outputs")
-    os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, output_file)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(deck_content)
+    # Shared state for the render stage. Variable values are built once;
+    # names with no value are collected in unknown_vars.
+    context = {
+        'config': config,
+        'workshop_id': workshop_id,
+        'base_dir': base_dir,
+        'replacements': build_replacements(config),
+        'unknown_vars': set(),
+        'cache': open_transform_cache(base_dir) if use_cache else None,
+        'workshop_assets': list_workshop_assets(workshop_id, base_dir, asset_index),
+        'sections': [],
+        'files': files,
+    }
+    if status == 'splice':
+        context['splicer'] = DeckSplicer(output_path, previous['sections'], changed)
+
+    # source -> transform -> sink: fragments are written as they are produced
+    plan = iter_deck_plan(config, deck_order, schedule, num_days, base_dir, workshop_id, files)
+    fragments = render_deck_fragments(plan, context)
+    if collect is not None:
+        fragments = tee_fragments(fragments, collect.setdefault('fragments', []))
+    with span("assemble and write", category='write'):
+        write_fragments_atomically(fragments, output_path)
+    with span("write dependency manifest", category='write'):
+        write_deps_manifest(manifest_path, workshop_id, base_dir, options, output_path,
+                            context['sections'], source_files=files, since=build_start)
+    if collect is not None:
+        collect['deck'] = ''.join(collect.pop('fragments'))
+    shards = []
+    if split_days:
+        with span("write day shards", category='write'):
+            shards = write_day_shards(output_path, context['sections'], workshop_id)
+    print(f"\nStep 3: Output written")
+    if 'splicer' in context:
+        reused = context['splicer'].reused
+        print(f"   Re-spliced: {len(context['sections']) - reused} section(s) rendered, {reused} reused")
+
+    cache = context['cache']
+    unknown_vars = context['unknown_vars']
 
     # Success!
     print("\n" + "=" * 70)
     print("                    SUCCESS!")
     print("=" * 70)
     print(f"\nDeck created: {output_path}")
+    if shards:
+        print(f"Day decks: {', '.join(os.path.basename(path) for path in shards)}")
+        print(f"   Shard manifest: {get_shard_manifest_path(output_path)}")
+    if cache is not None:
+        print(f"Transform cache: {cache.summary()}")
+    if unknown_vars:
+        names = ', '.join(f'{{{{{var}}}}}' for var in sorted(unknown_vars))
+        print(f"Warning: no value for {len(unknown_vars)} variable(s), left as-is: {names}")
 
     print(f"\nNext steps:")
     print(f"\n   OPTION 1: Convert to PDF (RECOMMENDED)")
     print(f"   " + "-" * 40)
     print(f"   marp --no-config {output_path} --theme fastr-theme.css --pdf --allow-local-files")
+    print(f"   or, reusing modules rendered before:")
+    print(f"   python3 tools/04_render_pdf.py {output_path}")
+    if shards:
+        print(f"   or render the day decks in parallel and join them:")
+        print(f"   python3 tools/04_render_pdf.py {output_path} --shards")
     print(f"\n   Why PDF? Consistent styling, no font issues, ready to present!")
 
     print(f"\n   OPTION 2: Convert to PowerPoint")
@@ -1195,6 +2141,154 @@ paginate: true
     return output_path
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# BATCH BUILDS
+# ═══════════════════════════════════════════════════════════════════════
+
+def _init_batch_worker(preloaded, modules, tracing=False, memory=False):
+    """Pool initializer: install the shared core content and module registry"""
+    PRELOADED_FILES.update(preloaded)
+    MODULES.update(modules)
+    worker_init(tracing, memory)
+
+
+def _build_one(workshop_id, base_dir, override_days, use_cache, incremental, split_days=False,
+               check_durations=False):
+    """
+    Build one workshop non-interactively with its console output captured.
+
+    Returns a result dict; never raises, so one failing workshop does not
+    stop the batch.
+    """
+    log = io.StringIO()
+    start = time.perf_counter()
+    output_path = None
+    ok = True
+
+    try:
+        with contextlib.redirect_stdout(log), span(f"build {workshop_id}"):
+            output_path = build_workshop_deck(workshop_id, base_dir, skip_confirmation=True,
+                                              override_days=override_days, use_cache=use_cache,
+                                              incremental=incremental, split_days=split_days,
+                                              check_durations=check_durations)
+    except SystemExit as e:
+        ok = e.code in (0, None)
+    except Exception:
+        ok = False
+        log.write(traceback.format_exc())
+
+    return {
+        'workshop': workshop_id,
+        'ok': ok and output_path is not None,
+        'seconds': time.perf_counter() - start,
+        'output': output_path,
+        'log': log.getvalue(),
+    }
+
+
+def _build_in_worker(*args):
+    """_build_one() for a pool worker: also returns the worker's trace events and memory rows"""
+    result = _build_one(*args)
+    result['trace'] = TRACER.drain()
+    return result
+
+
+def print_batch_summary(results, total_seconds):
+    """Print a table of per-workshop timings and failures"""
+    width = max([len('Workshop')] + [len(r['workshop']) for r in results])
+
+    print("\n" + "=" * 70)
+    print("                    BATCH BUILD SUMMARY")
+    print("=" * 70 + "\n")
+    print(f"   {'Workshop'.ljust(width)}  Status   Time     Output")
+    print(f"   {'-' * width}  -------  -------  ------")
+    for r in results:
+        status = "OK" if r['ok'] else "FAILED"
+        output = os.path.basename(r['output']) if r['output'] else "-"
+        print(f"   {r['workshop'].ljust(width)}  {status.ljust(7)}  {r['seconds']:6.2f}s  {output}")
+
+    failed = [r for r in results if not r['ok']]
+    print(f"\n   {len(results) - len(failed)} built, {len(failed)} failed in {total_seconds:.2f}s")
+    print("\n" + "=" * 70 + "\n")
+
+
+def build_many_workshops(workshop_ids, base_dir, jobs=None, override_days=None, use_cache=False,
+                         incremental=False, split_days=False, check_durations=False):
+    """
+    Build several workshops, in parallel worker processes when jobs > 1.
+
+    Core content is read and compiled once here and shared with every
+    worker. Console output of failed builds is shown, followed by a summary
+    table. Returns True if every build succeeded.
+    """
+    start = time.perf_counter()
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(workshop_ids)))
+
+    print("\n" + "=" * 70)
+    print(f"       BATCH BUILD: {len(workshop_ids)} workshop(s), {jobs} worker(s)")
+    print("=" * 70)
+
+    preloaded = preload_core_content(base_dir)
+    print(f"\n   Core content loaded: {len(preloaded)} file(s)")
+
+    args = [(workshop_id, base_dir, override_days, use_cache, incremental, split_days, check_durations)
+            for workshop_id in workshop_ids]
+    results = []
+
+    if jobs == 1:
+        for arg in args:
+            result = _build_one(*arg)
+            print(f"   {'done' if result['ok'] else 'FAILED'}: {result['workshop']}")
+            results.append(result)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                                 initargs=(preloaded, dict(MODULES), *worker_settings())) as pool:
+            # map() keeps results in the requested order
+            for result in pool.map(_build_in_worker, *zip(*args)):
+                TRACER.merge(result.pop('trace'))
+                print(f"   {'done' if result['ok'] else 'FAILED'}: {result['workshop']}")
+                results.append(result)
+
+    for result in results:
+        if not result['ok']:
+            print(f"\n--- {result['workshop']} (failed) " + "-" * 40)
+            print(result['log'].rstrip())
+
+    print_batch_summary(results, time.perf_counter() - start)
+    return all(r['ok'] for r in results)
+
+
+def watch_workshop(workshop_id, base_dir, output_file=None, override_days=None,
+                   use_cache=False, force=False, poll=False, debounce=DEFAULT_DEBOUNCE, split_days=False,
+                   check_durations=False):
+    """
+    Build a workshop deck, then rebuild it whenever its inputs change.
+
+    Rebuilds are incremental: only sections whose inputs changed are
+    re-rendered and spliced into the existing deck.
+    """
+    roots = [os.path.join(base_dir, 'core_content'),
+             os.path.join(base_dir, 'templates'),
+             os.path.join(base_dir, 'workshops', workshop_id)]
+    first_run = [force]
+
+    def rebuild(changed):
+        if any(os.path.basename(path) == 'slide_index.json' for path in changed):
+            MODULES.clear()  # Re-read on the next load_modules()
+        try:
+            build_workshop_deck(workshop_id, base_dir, output_file, skip_confirmation=True,
+                                override_days=override_days, use_cache=use_cache,
+                                incremental=not (first_run.pop() if first_run else False),
+                                split_days=split_days, check_durations=check_durations)
+        except SystemExit:
+            print("❌ Build failed - waiting for changes")
+        except Exception as e:
+            print(f"❌ Build failed: {type(e).__name__}: {e}")
+            print("   Waiting for changes")
+
+    watch(roots, rebuild, base_dir, poll=poll, debounce=debounce)
+
+
 def main():
     """Main entry point"""
 
@@ -1212,18 +2306,47 @@ def main():
 Examples:
   python3 tools/02_build_deck.py --workshop 2025-01-nigeria
   python3 tools/02_build_deck.py --workshop example --output test.md
+  python3 tools/02_build_deck.py --workshops 2025-nigeria,2025-kenya
+  python3 tools/02_build_deck.py --all --jobs 4
+  python3 tools/02_build_deck.py --workshop 2025-nigeria --explain
+  python3 tools/02_build_deck.py --workshop 2025-nigeria --force --trace build.json
+  python3 tools/02_build_deck.py --all --jobs 2 --memory-report
+  python3 tools/02_build_deck.py --workshop 2025-nigeria --watch
+  python3 tools/02_build_deck.py --workshop 2025-nigeria --split-days
+  python3 tools/02_build_deck.py --workshop 2025-nigeria --check-durations
+
+--watch rebuilds the deck whenever core_content/, templates/ or the
+workshop folder changes. Run it next to `00_extract_slides.py --watch`
+so methodology edits flow through extraction into the deck.
+
+--split-days also writes one deck per workshop day (<deck>_day1.md, ...)
+and <deck>.shards.json listing them, so the days can be rendered in
+parallel (04_render_pdf.py --shards joins the rendered days).
 
 For more help, see: docs/building-decks.md
             """
         )
 
-        parser.add_argument(
+        target = parser.add_mutually_exclusive_group(required=True)
+
+        target.add_argument(
             '--workshop',
             type=str,
-            required=True,
             help='Workshop folder name (e.g., "2025-01-nigeria")'
         )
 
+        target.add_argument(
+            '--workshops',
+            type=str,
+            help='Comma-separated workshop folder names to build in one batch'
+        )
+
+        target.add_argument(
+            '--all',
+            action='store_true',
+            help='Build every workshop in workshops/'
+        )
+
         parser.add_argument(
             '--output',
             type=str,
@@ -1237,10 +2360,86 @@ For more help, see: docs/building-decks.md
             help='Number of workshop days (default: 2)'
         )
 
+        parser.add_argument(
+            '--transform-cache',
+            action='store_true',
+            help='Reuse transformed core_content files from .fastr_cache/transforms/'
+        )
+
+        # The transform cache used to be on by default; --no-cache is still accepted
+        parser.add_argument('--no-cache', action='store_true', help=argparse.SUPPRESS)
+
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Rebuild even if the deck is up to date with its inputs'
+        )
+
+        parser.add_argument(
+            '--explain',
+            action='store_true',
+            help='Print which inputs changed and why the deck is (or is not) rebuilt'
+        )
+
+        parser.add_argument(
+            '--jobs', '-j',
+            type=int,
+            default=0,
+            metavar='N',
+            help='Worker processes for --all/--workshops (default: one per CPU)'
+        )
+
+        parser.add_argument(
+            '--split-days',
+            action='store_true',
+            help='Also write one deck per workshop day and a shard manifest (<deck>.shards.json)'
+        )
+
+        parser.add_argument(
+            '--check-durations',
+            action='store_true',
+            help='Warn when the agenda gives a module much more or less time than its slides need'
+        )
+
+        add_watch_arguments(parser)
+        add_tracing_arguments(parser)
+
         args = parser.parse_args()
 
-        build_workshop_deck(args.workshop, base_dir, args.output,
-                           skip_confirmation=True, override_days=args.days)
+        if args.watch:
+            if not args.workshop:
+                parser.error("--watch can only be used with --workshop")
+            watch_workshop(args.workshop, base_dir, args.output, override_days=args.days,
+                           use_cache=args.transform_cache, force=args.force,
+                           poll=args.poll, debounce=args.debounce, split_days=args.split_days,
+                           check_durations=args.check_durations)
+            return
+
+        if args.all or args.workshops:
+            if args.output:
+                parser.error("--output can only be used with --workshop")
+            if args.all:
+                workshop_ids = list_available_workshops(base_dir)
+            else:
+                workshop_ids = [w.strip() for w in args.workshops.split(',') if w.strip()]
+            if not workshop_ids:
+                print("No workshops to build.")
+                sys.exit(1)
+            success = run_instrumented(
+                lambda: build_many_workshops(workshop_ids, base_dir, jobs=args.jobs,
+                                             override_days=args.days, use_cache=args.transform_cache,
+                                             incremental=not args.force, split_days=args.split_days,
+                                             check_durations=args.check_durations),
+                trace_path=args.trace, profile_path=args.profile, memory_report=args.memory_report)
+            sys.exit(0 if success else 1)
+
+        run_instrumented(
+            lambda: build_workshop_deck(args.workshop, base_dir, args.output,
+                                        skip_confirmation=True, override_days=args.days,
+                                        use_cache=args.transform_cache, incremental=not args.force,
+                                        explain=args.explain, split_days=args.split_days,
+                                        check_durations=args.check_durations),
+            trace_path=args.trace, profile_path=args.profile, memory_report=args.memory_report)
 
     else:
         # Interactive mode
@@ -7,9 +7,14 @@
 ⚠️  IMPORTANT: PDF is the RECOMMENDED export format!
 
 This tool converts markdown to PowerPoint, but be aware:
-  ❌ Fonts may need manual adjustment
-  ❌ Layouts may not match perfectly
-  ❌ Requires editing Slide Master for best results
+  ❌ Layouts may not match the PDF perfectly
+  ❌ SVG images need pandoc (the built-in writer skips them)
+
+By default the built-in writer (tools/pptx_writer.py) is used: no pandoc
+needed, FASTR fonts and colours applied, text sized to fit each slide.
+With --engine pandoc (or --reference) pandoc converts the deck instead,
+and fonts may then need manual adjustment in the Slide Master. Decks
+with SVG images are also converted with pandoc when it is installed.
 
 ✅ PDF export is easier and more consistent!
 
@@ -45,12 +50,20 @@ Or with custom template:
 
     python3 tools/03_convert_pptx.py outputs/deck.md --reference custom.pptx
 
+Or with pandoc instead of the built-in writer:
+
+    python3 tools/03_convert_pptx.py outputs/deck.md --engine pandoc
+
+Convert many decks at once (no prompts, logs in outputs/logs/):
+
+    python3 tools/03_convert_pptx.py --batch --jobs 4
+
 
 ═══════════════════════════════════════════════════════════════════════
                       BEFORE YOU START
 ═══════════════════════════════════════════════════════════════════════
 
-1. Install Pandoc (if not already installed):
+1. For --engine pandoc, --reference or decks with SVG images: install Pandoc
 
    Mac:     brew install pandoc
    Windows: See https://pandoc.org/installing.html
@@ -80,17 +93,21 @@ Why PDF is better:
   ✅ Smaller file size
   ✅ Ready to present immediately
 
-PowerPoint requires manual adjustments after export!
+PowerPoint from pandoc requires manual adjustments after export!
 
 ═══════════════════════════════════════════════════════════════════════
 """
 
 import argparse
+import functools
 import os
 import subprocess
 import shutil
 import sys
 import re
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -99,17 +116,25 @@ from pathlib import Path
 
 def ensure_venv():
     """Re-execute with venv Python if not already in venv."""
-    if sys.prefix != sys.base_prefix:
+    if sys.prefix != sys.base_prefix or os.environ.get('FASTR_VENV_REEXEC'):
         return
     script_dir = Path(__file__).resolve().parent
     project_root = script_dir.parent
     for venv_name in ['.venv', 'venv']:
         venv_python = project_root / venv_name / 'bin' / 'python3'
         if venv_python.exists():
+            os.environ['FASTR_VENV_REEXEC'] = '1'
             os.execv(str(venv_python), [str(venv_python)] + sys.argv)
 
 ensure_venv()
 
+from asset_index import build_asset_index
+from content_cache import DEFAULT_CACHE_DIR, ContentCache, hash_file, hash_text, make_key
+from deck_chunks import split_deck, trim_slide_breaks
+from pptx_merge import merge_presentations
+from pptx_writer import write_presentation
+from tracing import add_tracing_arguments, run_instrumented, span
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # HELPER FUNCTIONS
@@ -286,14 +311,48 @@ def convert_slide_breaks(content):
     return '\n'.join(result)
 
 
-def fix_image_paths(content, base_dir):
+def resolve_image_path(img_path, base_dir, asset_index):
+    """
+    Absolute path of an image a deck refers to, or None if it cannot be found
+
+    Deck image paths are written relative to the content they came from, so
+    several locations under base_dir are tried.
+    """
+    # List of paths to try
+    paths_to_try = [
+        os.path.join(base_dir, img_path),
+        os.path.join(base_dir, img_path.lstrip('../')),
+        os.path.join(base_dir, 'assets', os.path.basename(img_path)),
+        os.path.join(base_dir, 'outputs', img_path),
+        os.path.join(base_dir, 'outputs', img_path.lstrip('../')),
+    ]
+
+    # Also try relative to outputs folder
+    if img_path.startswith('../'):
+        paths_to_try.append(os.path.join(base_dir, img_path.replace('../', '')))
+
+    for test_path in paths_to_try:
+        if asset_index.exists(test_path):
+            return os.path.abspath(test_path)
+    return None
+
+
+def fix_image_paths(content, base_dir, asset_index=None, missing=None):
     """
     Convert relative image paths to absolute paths for pandoc
     Removes images that can't be found to prevent conversion errors
 
-    Pandoc needs absolute paths to find images correctly
+    Pandoc needs absolute paths to find images correctly. Candidate paths
+    are checked against an in-memory asset index (one directory walk)
+    rather than on disk, and each distinct image is resolved only once.
+    Missing images are added to the `missing` list if one is given,
+    otherwise their number is printed.
     """
-    missing_images = []
+    if asset_index is None:
+        asset_index = build_asset_index(base_dir)
+
+    missing_images = [] if missing is None else missing
+    resolved = {}
 
     def replace_path(match):
         alt_text = match.group(1)
@@ -303,23 +362,11 @@ def fix_image_paths(content, base_dir):
         if img_path.startswith('http://') or img_path.startswith('https://'):
             return match.group(0)
 
-        # List of paths to try
-        paths_to_try = [
-            os.path.join(base_dir, img_path),
-            os.path.join(base_dir, img_path.lstrip('../')),
-            os.path.join(base_dir, 'assets', os.path.basename(img_path)),
-            os.path.join(base_dir, 'outputs', img_path),
-            os.path.join(base_dir, 'outputs', img_path.lstrip('../')),
-        ]
-
-        # Also try relative to outputs folder
-        if img_path.startswith('../'):
-            paths_to_try.append(os.path.join(base_dir, img_path.replace('../', '')))
-
-        for test_path in paths_to_try:
-            if os.path.exists(test_path):
-                abs_path = os.path.abspath(test_path)
-                return f'![{alt_text}]({abs_path})'
+        if img_path not in resolved:
+            resolved[img_path] = resolve_image_path(img_path, base_dir, asset_index)
+        abs_path = resolved[img_path]
+        if abs_path:
+            return f'![{alt_text}]({abs_path})'
 
         # Image not found - remove it to prevent pandoc error
         missing_images.append(img_path)
@@ -327,21 +374,299 @@ def fix_image_paths(content, base_dir):
 
     result = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', replace_path, content)
 
-    if missing_images:
+    if missing_images and missing is None:
         print(f"   Note: {len(missing_images)} image(s) not found and skipped")
 
     return result
 
 
-def convert_to_pptx(md_file, base_dir, reference_template=None, skip_confirmation=False):
+# ═══════════════════════════════════════════════════════════════════════
+# PANDOC
+# ═══════════════════════════════════════════════════════════════════════
+
+def pandoc_command(pptx_file, resource_dir, reference_doc=None, slide_level=None):
+    """pandoc command line that reads the cleaned markdown from stdin"""
+    cmd = [
+        'pandoc',
+        '-f', 'markdown-yaml_metadata_block',
+        '-t', 'pptx',
+        '--resource-path', resource_dir,
+        '-o', pptx_file
+    ]
+    if reference_doc:
+        cmd.extend(['--reference-doc', reference_doc])
+    if slide_level:
+        cmd.extend(['--slide-level', str(slide_level)])
+    return cmd
+
+
+def run_pandoc(cmd, markdown, timeout=None, log=None):
+    """
+    Run pandoc with markdown piped through stdin (no temp file on disk).
+
+    pandoc's stdout and stderr are captured, or streamed into `log` (an
+    open file) if given. Raises CalledProcessError on failure and
+    TimeoutExpired (after killing pandoc) if it runs past timeout seconds.
+    """
+    if log is None:
+        return subprocess.run(cmd, input=markdown, check=True, capture_output=True,
+                              encoding='utf-8', timeout=timeout)
+    log.flush()
+    return subprocess.run(cmd, input=markdown, check=True, stdout=log, stderr=subprocess.STDOUT,
+                          encoding='utf-8', timeout=timeout)
+
+
+@functools.lru_cache(maxsize=None)
+def pandoc_version():
+    """First line of `pandoc --version` (part of the chunk cache key)"""
+    result = subprocess.run(['pandoc', '--version'], check=True, capture_output=True, encoding='utf-8')
+    return result.stdout.split('\n', 1)[0].strip()
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# CHUNKED CONVERSION (per-module cache)
+# ═══════════════════════════════════════════════════════════════════════
+# A deck is split where one module's slides end and the next begin, using
+# the section list 02_build_deck.py writes to outputs/<deck>.deps.json.
+# Each chunk is converted on its own and its .pptx cached under
+# .fastr_cache/pptx/, keyed by the chunk's cleaned markdown, the images it
+# shows, the reference document and the pandoc version. Core modules are
+# the same in every workshop, so after the first conversion only the agenda,
+# breaks and custom slides go through pandoc again. The chunks are then
+# merged into one presentation (pptx_merge.py).
+# Bump PPTX_CACHE_VERSION when the conversion changes.
+
+PPTX_CACHE_VERSION = 1
+PPTX_CACHE_MAX_BYTES = 512 * 1024 * 1024
+CHUNK_JOBS = min(4, os.cpu_count() or 1)
+
+IMAGE_TARGET_PATTERN = re.compile(r'!\[[^\]]*\]\(([^)]+)\)')
+ATX_HEADING_PATTERN = re.compile(r'^(#{1,6})\s')
+
+
+def open_pptx_cache(base_dir):
+    """Open the on-disk cache of converted deck chunks"""
+    cache_dir = os.path.join(base_dir, DEFAULT_CACHE_DIR, 'pptx')
+    return ContentCache(cache_dir, max_bytes=PPTX_CACHE_MAX_BYTES, suffix='.pptx')
+
+
+def slide_level(markdown):
     """
-    MAIN FUNCTION: Convert markdown file to PowerPoint using pandoc
+    The slide level pandoc picks for a document: the highest heading level
+    that is directly followed by content (not by another heading or a
+    slide break). Chunks are converted with the level of the whole deck so
+    they are cut into slides exactly as the whole deck would be.
+    """
+    level = None
+    pending = None
+    previous_blank = True
+    in_code = False
+    for line in markdown.split('\n'):
+        stripped = line.strip()
+        if stripped.startswith(('```', '~~~')):
+            in_code = not in_code
+        elif not in_code and previous_blank and ATX_HEADING_PATTERN.match(line):
+            pending = len(ATX_HEADING_PATTERN.match(line).group(1))
+            previous_blank = False
+            continue
+        if stripped:
+            if pending is not None and stripped != '---':
+                level = pending if level is None else min(level, pending)
+            pending = None
+        previous_blank = not stripped
+    return level
+
+
+def image_fingerprints(markdown):
+    """(path, mtime, size) of every local image a chunk shows"""
+    fingerprints = []
+    for target in sorted(set(IMAGE_TARGET_PATTERN.findall(markdown))):
+        if target.startswith(('http://', 'https://')):
+            continue
+        try:
+            stat = os.stat(target)
+            fingerprints.append((target, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprints.append((target, None, None))
+    return fingerprints
+
 
-    This is the converter that creates editable PowerPoint files
+def convert_markdown(content, md_file, pptx_file, base_dir, reference_doc=None, asset_index=None,
+                     cache=None, jobs=1, timeout=None, log=None, missing=None):
     """
+    Convert a built deck's markdown to pptx_file.
+
+    Without a cache the whole deck goes through pandoc in one run. With one,
+    the deck is split at module boundaries (split_deck()); chunks missing
+    from the cache are converted, up to `jobs` at a time, and stored, and
+    all chunks are merged in order.
+
+    Raises what run_pandoc() raises, or ValueError if the chunks cannot be
+    merged. Returns (chunks, converted): how many chunks the deck had and
+    how many of them pandoc converted.
+    """
+    if asset_index is None:
+        asset_index = build_asset_index(base_dir)
+    resource_dir = os.path.dirname(os.path.abspath(md_file))
+
+    if cache is None:
+        with span("prepare markdown", category='transform'):
+            cleaned = prepare_markdown(content, base_dir, asset_index, missing)
+        cmd = pandoc_command(pptx_file, resource_dir, reference_doc)
+        if log is not None:
+            log.write(f"# {' '.join(cmd)}\n")
+        with span("pandoc", category='subprocess'):
+            run_pandoc(cmd, cleaned, timeout=timeout, log=log)
+        return 1, 1
+
+    with span("split deck", category='transform'):
+        chunks = []
+        for i, (label, text) in enumerate(split_deck(content, md_file)):
+            cleaned = trim_slide_breaks(prepare_markdown(text, base_dir, asset_index, missing,
+                                                         strip_frontmatter=(i == 0)))
+            if cleaned:
+                chunks.append((label, cleaned))
+        level = slide_level('\n---\n\n'.join(text for _, text in chunks)) if len(chunks) > 1 else None
+
+    with span("chunk keys", category='transform'):
+        reference_hash = hash_file(reference_doc) if reference_doc else None
+        version = pandoc_version()
+        keys = [make_key('pptx', PPTX_CACHE_VERSION, hash_text(text), image_fingerprints(text),
+                         level, reference_hash, version)
+                for _, text in chunks]
+
+    paths = {}
+    todo = {}
+    for key, (label, text) in zip(keys, chunks):
+        if key in paths or key in todo:
+            continue
+        path = cache.lookup(key)
+        if path:
+            paths[key] = path
+        else:
+            todo[key] = (label, text)
+
+    def convert_chunk(key, label, text):
+        temp_pptx = f"{pptx_file}.{key[:12]}.tmp"
+        cmd = pandoc_command(temp_pptx, resource_dir, reference_doc, level)
+        if log is not None:
+            log.write(f"# {label}: {' '.join(cmd)}\n")
+        try:
+            with span(f"pandoc {label}", category='subprocess'):
+                run_pandoc(cmd, text, timeout=timeout, log=log)
+            return cache.put_file(key, temp_pptx)
+        finally:
+            if os.path.exists(temp_pptx):
+                os.remove(temp_pptx)
+
+    if jobs > 1 and len(todo) > 1:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            futures = {key: pool.submit(convert_chunk, key, *todo[key]) for key in todo}
+            for key, future in futures.items():
+                paths[key] = future.result()
+    else:
+        for key, (label, text) in todo.items():
+            paths[key] = convert_chunk(key, label, text)
+
+    with span("merge chunks", category='write'):
+        if len(keys) == 1:
+            shutil.copyfile(paths[keys[0]], pptx_file)
+        else:
+            merge_presentations([paths[key] for key in keys], pptx_file)
+    return len(chunks), len(todo)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# NATIVE WRITER (no pandoc)
+# ═══════════════════════════════════════════════════════════════════════
+# The default engine: pptx_writer.py lays out every slide itself in the
+# FASTR theme (teal titles, Segoe UI, text sized to fit), so no pandoc and
+# no manual fixes are needed. pandoc is still used with --engine pandoc and
+# whenever a --reference template is given, since only pandoc can apply one.
+# The writer cannot embed SVG, so decks with SVG images go to pandoc too
+# when it is installed; otherwise every skipped image is named.
+
+ENGINES = ('native', 'pandoc')
+SVG_IMAGE_PATTERN = re.compile(
+    r'!\[[^\]]*\]\(\s*<?([^)\s>]+\.svg)[\s>)]'
+    r'|<img\b[^>]*\bsrc\s*=\s*["\']([^"\']+\.svg)["\']', re.I)
+
+
+def svg_images(markdown):
+    """SVG images a deck shows, in sorted order"""
+    return sorted({a or b for a, b in SVG_IMAGE_PATTERN.findall(markdown)})
+
+
+def default_engine(reference_template=None, content=None):
+    """
+    'pandoc' when a reference template is given, or when the deck shows SVG
+    images and pandoc is installed; 'native' otherwise
+    """
+    if reference_template:
+        return 'pandoc'
+    if content is not None and svg_images(content) and check_pandoc_installed():
+        return 'pandoc'
+    return 'native'
+
+
+def print_skipped_images(missing, indent="   "):
+    """Name every image the conversion left out"""
+    if missing:
+        print(f"{indent}⚠️  {len(missing)} image(s) not found or not supported, skipped:")
+        for image in sorted(set(missing)):
+            print(f"{indent}   - {image}")
+
+
+def convert_native(content, pptx_file, base_dir, asset_index=None, missing=None):
+    """
+    Write a built deck's markdown to pptx_file with the native writer.
+
+    Images are found as for pandoc (resolve_image_path()). Ones that cannot
+    be found, or that the writer cannot embed (it takes PNG, JPEG and GIF,
+    not SVG), are added to `missing`. Returns the number of slides.
+    """
+    if asset_index is None:
+        asset_index = build_asset_index(base_dir)
+
+    def resolve(img_path):
+        if img_path.startswith(('http://', 'https://')):
+            return None
+        return resolve_image_path(img_path, base_dir, asset_index)
+
+    with span("native writer", category='write'):
+        result = write_presentation(content, pptx_file, resolve_image=resolve, missing=missing)
+    return result.slides
+
+
+def convert_to_pptx(md_file, base_dir, reference_template=None, skip_confirmation=False, content=None,
+                    use_cache=True, engine=None):
+    """
+    MAIN FUNCTION: Convert markdown file to PowerPoint
+
+    This is the converter that creates editable PowerPoint files.
+    content is the deck's markdown if the caller already has it in memory
+    (e.g. the in-process pipeline); md_file then only names the output.
+    engine is 'native' (see NATIVE WRITER) or 'pandoc'; by default pandoc
+    is only used with a reference template or for a deck with SVG images
+    (see default_engine()). With pandoc and use_cache the
+    deck is converted module by module and unchanged modules come from
+    .fastr_cache/pptx/ (see CHUNKED CONVERSION).
+    """
+    # Get full path to markdown file
+    if not md_file.startswith('/'):
+        md_file = os.path.join(base_dir, md_file)
+
+    if engine is None:
+        if content is None and not reference_template and os.path.exists(md_file):
+            with span("read markdown"):
+                with open(md_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+        engine = default_engine(reference_template, content)
+        if engine == 'pandoc' and not reference_template:
+            print("\n🖼️  The deck has SVG images - converting with pandoc to keep them")
 
     # Check if pandoc is installed
-    if not check_pandoc_installed():
+    if engine == 'pandoc' and not check_pandoc_installed():
         print("\n" + "=" * 70)
         print("              PANDOC NOT FOUND")
         print("=" * 70)
@@ -376,12 +701,8 @@ def convert_to_pptx(md_file, base_dir, reference_template=None, skip_confirmatio
             print("\n\nCancelled.")
             return False
 
-    # Get full path to markdown file
-    if not md_file.startswith('/'):
-        md_file = os.path.join(base_dir, md_file)
-
     # Check if markdown file exists
-    if not os.path.exists(md_file):
+    if content is None and not os.path.exists(md_file):
         print(f"\n❌ Error: File not found: {md_file}")
         print(f"\n💡 Make sure you've built a deck first:")
         print(f"   python3 tools/02_build_deck.py --workshop YOUR-WORKSHOP")
@@ -392,13 +713,17 @@ def convert_to_pptx(md_file, base_dir, reference_template=None, skip_confirmatio
     print("           CONVERTING TO POWERPOINT")
     print("═" * 70)
 
-    file_size = os.path.getsize(md_file) / 1024
+    if content is None:
+        file_size = os.path.getsize(md_file) / 1024
+    else:
+        file_size = len(content.encode('utf-8')) / 1024
     print(f"\n📄 Input:  {os.path.basename(md_file)} ({file_size:.1f} KB)")
 
     # Confirm conversion (unless skipped)
     if not skip_confirmation:
         print("\n⚠️  Reminder: PDF export is recommended for better results!")
-        print("   PowerPoint may require manual font/layout adjustments.")
+        if engine == 'pandoc':
+            print("   PowerPoint may require manual font/layout adjustments.")
         print("\n" + "─" * 70)
         response = input("\n➤ Continue with PowerPoint conversion? [y/N]: ").strip().lower()
         if response not in ['y', 'yes']:
@@ -409,33 +734,31 @@ def convert_to_pptx(md_file, base_dir, reference_template=None, skip_confirmatio
 
     # Read and process markdown
     print(f"\n🔧 Step 1: Processing markdown...")
-    with open(md_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Get absolute directory for fixing paths
-    md_dir = os.path.dirname(os.path.abspath(md_file))
+    if content is None:
+        with span("read markdown"):
+            with open(md_file, 'r', encoding='utf-8') as f:
+                content = f.read()
 
     # Strip frontmatter, convert slide breaks, and fix image paths
+    # (done by convert_markdown(), chunk by chunk when caching, or by the
+    # native writer as it reads the slides)
     print(f"   ✓ Removing Marp frontmatter")
-    cleaned_content = strip_marp_frontmatter(content)
-
     print(f"   ✓ Converting slide breaks")
-    cleaned_content = convert_slide_breaks(cleaned_content)
-
     print(f"   ✓ Fixing image paths")
-    cleaned_content = fix_image_paths(cleaned_content, base_dir)
-
-    # Create temp file without frontmatter
-    temp_file = md_file.replace('.md', '_temp.md')
-    with open(temp_file, 'w', encoding='utf-8') as f:
-        f.write(cleaned_content)
+    with span("asset index", category='assets'):
+        asset_index = build_asset_index(base_dir)
 
     # Build output filename
     pptx_file = md_file.replace('.md', '.pptx')
 
     # Determine which reference template to use
     reference_msg = ""
-    if reference_template and os.path.exists(reference_template):
+    if engine == 'native':
+        reference_doc = None
+        reference_msg = "FASTR theme (native writer)"
+        if reference_template:
+            print(f"\n⚠️  --reference needs --engine pandoc - ignoring {os.path.basename(reference_template)}")
+    elif reference_template and os.path.exists(reference_template):
         reference_doc = reference_template
         reference_msg = f"custom template: {os.path.basename(reference_template)}"
     else:
@@ -445,22 +768,23 @@ def convert_to_pptx(md_file, base_dir, reference_template=None, skip_confirmatio
     print(f"\n🎨 Step 2: Applying template...")
     print(f"   ✓ Using {reference_msg}")
 
-    # Build pandoc command
-    cmd = [
-        'pandoc', temp_file,
-        '-f', 'markdown-yaml_metadata_block',
-        '-t', 'pptx',
-        '--resource-path', md_dir,
-        '-o', pptx_file
-    ]
-
-    if reference_doc:
-        cmd.extend(['--reference-doc', reference_doc])
-
-    # Run conversion
+    # Run conversion (the cleaned markdown goes to pandoc through stdin)
     print(f"\n🔨 Step 3: Converting to PowerPoint...")
+    cache = open_pptx_cache(base_dir) if use_cache and engine == 'pandoc' else None
+    missing = []
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        if engine == 'native':
+            slides = convert_native(content, pptx_file, base_dir, asset_index, missing=missing)
+            print_skipped_images(missing)
+            if svg_images(content):
+                print(f"   💡 Install pandoc to keep SVG images (see: python3 tools/03_convert_pptx.py --help)")
+            print(f"   ✓ {slides} slides written")
+        else:
+            chunks, converted = convert_markdown(content, md_file, pptx_file, base_dir, reference_doc,
+                                                 asset_index, cache=cache, jobs=CHUNK_JOBS, missing=missing)
+            print_skipped_images(missing)
+            if cache is not None:
+                print(f"   ✓ {chunks} chunk(s): {converted} converted, {chunks - converted} from cache")
 
         output_size = os.path.getsize(pptx_file) / 1024
 
@@ -470,13 +794,17 @@ def convert_to_pptx(md_file, base_dir, reference_template=None, skip_confirmatio
         print(f"\n📊 Output: {os.path.basename(pptx_file)} ({output_size:.1f} KB)")
         print(f"   Location: {pptx_file}")
 
-        print(f"\n⚠️  IMPORTANT: Check your PowerPoint file!")
-        print(f"   You may need to:")
-        print(f"   1. Adjust font sizes (View → Slide Master)")
-        print(f"   2. Fix any layout issues")
-        print(f"   3. Verify FASTR teal color (#0f706d)")
+        if engine == 'native':
+            print(f"\n🎨 FASTR styling applied: teal titles, Segoe UI, text sized to fit each slide")
+            print(f"\n💡 For presenting, PDF is still recommended:")
+        else:
+            print(f"\n⚠️  IMPORTANT: Check your PowerPoint file!")
+            print(f"   You may need to:")
+            print(f"   1. Adjust font sizes (View → Slide Master)")
+            print(f"   2. Fix any layout issues")
+            print(f"   3. Verify FASTR teal color (#0f706d)")
 
-        print(f"\n💡 To avoid manual fixes, use PDF:")
+            print(f"\n💡 To avoid manual fixes, use PDF:")
         print(f"   marp {md_file} --no-config --theme fastr-theme.css --pdf --allow-local-files")
 
         print("\n" + "═" * 70 + "\n")
@@ -490,11 +818,199 @@ def convert_to_pptx(md_file, base_dir, reference_template=None, skip_confirmatio
         print(f"\n💡 Try PDF export instead:")
         print(f"   marp {md_file} --no-config --theme fastr-theme.css --pdf --allow-local-files")
         return False
+    except (ValueError, zipfile.BadZipFile, KeyError) as e:
+        print(f"\n❌ Could not merge the converted modules: {e}")
+        print(f"\n💡 Convert the whole deck in one go instead:")
+        print(f"   python3 tools/03_convert_pptx.py {os.path.relpath(md_file, base_dir)} --no-cache")
+        return False
+    except OSError as e:
+        print(f"\n❌ Could not write {os.path.basename(pptx_file)}: {e}")
+        return False
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# BATCH CONVERSION
+# ═══════════════════════════════════════════════════════════════════════
+
+BATCH_JOBS = min(4, os.cpu_count() or 1)
+PANDOC_TIMEOUT = 300   # seconds per attempt
+PANDOC_RETRIES = 1     # extra attempts after a failure or timeout
+RETRY_DELAY = 1.0      # seconds, multiplied by the attempt number
+
+
+def list_built_decks(base_dir):
+    """All outputs/*_deck.md files"""
+    outputs_dir = os.path.join(base_dir, "outputs")
+    return [os.path.join(outputs_dir, deck) for deck in list_available_decks(base_dir)
+            if deck.endswith('_deck.md')]
+
+
+def prepare_markdown(content, base_dir, asset_index=None, missing=None, strip_frontmatter=True):
+    """Frontmatter removal, slide breaks and image paths, as convert_to_pptx() does"""
+    cleaned = strip_marp_frontmatter(content) if strip_frontmatter else content
+    cleaned = convert_slide_breaks(cleaned)
+    return fix_image_paths(cleaned, base_dir, asset_index, missing)
+
+
+def convert_job(md_file, base_dir, reference_doc, asset_index, logs_dir, cache=None,
+                timeout=PANDOC_TIMEOUT, retries=PANDOC_RETRIES, engine=None):
+    """
+    Convert one deck for --batch (runs in a worker thread).
+
+    pandoc's output is streamed into logs_dir/<deck>.log together with one
+    header line per attempt and per pandoc run (with the native engine, one
+    line with the slide count). engine None picks one per deck
+    (default_engine()). The .pptx is written under a
+    temporary name and moved into place only when the conversion succeeds.
+    Chunks converted before a failed attempt stay in the cache, so a retry
+    only redoes the rest. Never raises: returns a dict with 'deck', 'ok',
+    'attempts', 'seconds', 'chunks', 'converted', 'skipped' (images left
+    out), 'log' and 'error'.
+    """
+    name = os.path.basename(md_file)
+    log_path = os.path.join(logs_dir, os.path.splitext(name)[0] + '.log')
+    pptx_file = os.path.splitext(md_file)[0] + '.pptx'
+    temp_pptx = pptx_file + '.tmp'
+    result = {'deck': name, 'ok': False, 'attempts': 0, 'seconds': 0.0, 'chunks': 0, 'converted': 0,
+              'skipped': 0, 'log': log_path, 'output': pptx_file, 'error': None}
+    started = time.perf_counter()
+
+    with span(f"convert {name}", category='batch'), open(log_path, 'w', encoding='utf-8') as log:
+        try:
+            with open(md_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except OSError as e:
+            result['error'] = f"cannot read deck: {e}"
+            log.write(f"# {result['error']}\n")
+            return result
+        if engine is None:
+            engine = default_engine(reference_doc, content)
+            if engine == 'pandoc' and not reference_doc:
+                log.write("# the deck has SVG images - converting with pandoc\n")
+
+        for attempt in range(1, retries + 2):
+            result['attempts'] = attempt
+            log.write(f"# attempt {attempt}/{retries + 1}\n")
+            attempt_started = time.perf_counter()
+            missing = []
+            try:
+                if engine == 'native':
+                    slides = convert_native(content, temp_pptx, base_dir, asset_index, missing=missing)
+                    log.write(f"# native writer: {slides} slides\n")
+                else:
+                    result['chunks'], result['converted'] = convert_markdown(
+                        content, md_file, temp_pptx, base_dir, reference_doc, asset_index,
+                        cache=cache, timeout=timeout, log=log, missing=missing)
+                os.replace(temp_pptx, pptx_file)
+                log.write(f"# done in {time.perf_counter() - attempt_started:.1f}s\n")
+                result['ok'], result['error'] = True, None
+                break
+            except subprocess.TimeoutExpired:
+                result['error'] = f"timed out after {timeout}s"
+            except subprocess.CalledProcessError as e:
+                result['error'] = f"pandoc exited with status {e.returncode}"
+            except (OSError, ValueError, zipfile.BadZipFile, KeyError) as e:
+                result['error'] = str(e)
+            finally:
+                result['skipped'] = len(set(missing))
+                if attempt == 1:
+                    for image in missing:
+                        log.write(f"# image not found or not supported, skipped: {image}\n")
+            log.write(f"# failed: {result['error']}\n")
+            if os.path.exists(temp_pptx):
+                os.remove(temp_pptx)
+            if attempt <= retries:
+                time.sleep(RETRY_DELAY * attempt)
+
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def convert_batch(md_files, base_dir, reference_template=None, jobs=BATCH_JOBS,
+                  timeout=PANDOC_TIMEOUT, retries=PANDOC_RETRIES, use_cache=True, engine=None):
+    """
+    Convert many decks to PowerPoint, at most `jobs` at a time.
+
+    No prompts: meant for scripts and CI. Every deck gets a log in
+    outputs/logs/. With pandoc and use_cache the decks share one chunk
+    cache, so a core module is converted once for all of them. Returns
+    True if every deck converted. Without an engine, decks with SVG images
+    use pandoc when it is installed and the rest the native writer.
+    """
+    if engine is None and reference_template:
+        engine = 'pandoc'
+    if engine == 'pandoc' and not check_pandoc_installed():
+        print("❌ Pandoc not found on PATH - install it first (see: python3 tools/03_convert_pptx.py --help)")
+        return False
 
-    finally:
-        # Clean up temp file
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+    md_files = [f if os.path.isabs(f) else os.path.join(base_dir, f) for f in md_files]
+    if not md_files:
+        print("❌ No decks to convert (build one with tools/02_build_deck.py)")
+        return False
+
+    reference_doc = None
+    if engine == 'pandoc' and reference_template and os.path.exists(reference_template):
+        reference_doc = reference_template
+    logs_dir = os.path.join(base_dir, "outputs", "logs")
+    os.makedirs(logs_dir, exist_ok=True)
+    jobs = max(1, min(jobs, len(md_files)))
+
+    print("\n" + "═" * 70)
+    print("           CONVERTING TO POWERPOINT (BATCH)")
+    print("═" * 70)
+    if engine == 'native':
+        print(f"\n📄 {len(md_files)} deck(s), {jobs} at a time (native writer)")
+    elif engine is None:
+        print(f"\n📄 {len(md_files)} deck(s), {jobs} at a time "
+              f"(native writer; pandoc for decks with SVG images)")
+    else:
+        print(f"\n📄 {len(md_files)} deck(s), {jobs} at a time "
+              f"(timeout {timeout}s, {retries} retr{'y' if retries == 1 else 'ies'})")
+    if reference_doc:
+        print(f"🎨 Template: {os.path.basename(reference_doc)}")
+    elif engine == 'native' and reference_template:
+        print(f"⚠️  --reference needs --engine pandoc - ignoring {os.path.basename(reference_template)}")
+    print("")
+
+    with span("asset index", category='assets'):
+        asset_index = build_asset_index(base_dir)
+    cache = open_pptx_cache(base_dir) if use_cache and engine != 'native' else None
+
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(convert_job, md_file, base_dir, reference_doc, asset_index,
+                               logs_dir, cache, timeout, retries, engine) for md_file in md_files]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            retried = f", {result['attempts']} attempts" if result['attempts'] > 1 else ""
+            chunked = (f", {result['converted']} of {result['chunks']} chunks converted"
+                       if result['chunks'] and result['ok'] else "")
+            skipped = (f", {result['skipped']} image(s) skipped - see the log"
+                       if result['skipped'] else "")
+            if result['ok']:
+                print(f"   ✓ {result['deck']} → {os.path.basename(result['output'])} "
+                      f"({result['seconds']:.1f}s{chunked}{skipped}{retried})")
+            else:
+                print(f"   ✗ {result['deck']}: {result['error']}{retried}")
+
+    failed = [r for r in results if not r['ok']]
+    print("\n" + "─" * 70)
+    if not failed:
+        print(f"✅ Converted {len(results)} of {len(results)} deck(s)")
+    else:
+        marker = '❌' if len(failed) == len(results) else '⚠️ '
+        print(f"{marker} Converted {len(results) - len(failed)} of {len(results)} deck(s), "
+              f"{len(failed)} failed")
+    if cache is not None and any(r['chunks'] for r in results):
+        print(f"   Chunk cache: {cache.summary()}")
+    if failed:
+        print(f"   See the logs of the failed deck(s):")
+        for result in sorted(failed, key=lambda r: r['deck']):
+            print(f"      {os.path.relpath(result['log'], base_dir)}")
+    print(f"   Logs: {os.path.relpath(logs_dir, base_dir)}/")
+    print("─" * 70 + "\n")
+    return not failed
 
 
 def main():
@@ -509,18 +1025,31 @@ def main():
     base_dir = os.path.dirname(script_dir)  # Go up one level from tools/
 
     # Check if user provided command-line arguments
-    if len(sys.argv) > 1 and not sys.argv[1].startswith('-'):
+    if len(sys.argv) > 1:
         # ═══════════════════════════════════════════════════════════════
         # COMMAND LINE MODE
         # ═══════════════════════════════════════════════════════════════
 
         parser = argparse.ArgumentParser(
-            description="Convert markdown to editable PowerPoint using pandoc",
+            description="Convert markdown to editable PowerPoint",
             formatter_class=argparse.RawDescriptionHelpFormatter,
             epilog="""
 Examples:
   python3 tools/03_convert_pptx.py outputs/example_deck.md
   python3 tools/03_convert_pptx.py outputs/my_deck.md --reference custom.pptx
+  python3 tools/03_convert_pptx.py outputs/my_deck.md --engine pandoc
+  python3 tools/03_convert_pptx.py outputs/my_deck.md --trace convert.json
+  python3 tools/03_convert_pptx.py --batch                  (all outputs/*_deck.md)
+  python3 tools/03_convert_pptx.py --batch outputs/a_deck.md outputs/b_deck.md --jobs 2
+
+--batch never prompts. Each deck gets a log in outputs/logs/.
+
+By default the deck is written by the built-in writer: no pandoc needed, and
+FASTR fonts and colours are applied. With --engine pandoc (the default when
+--reference is given) decks are converted module by module. Each module's
+PowerPoint is cached in .fastr_cache/pptx/, so reconverting a deck (or
+another workshop's deck) only runs pandoc on what changed - usually the
+agenda and custom slides.
 
 Note: PDF export is recommended over PowerPoint!
   marp outputs/deck.md --no-config --theme fastr-theme.css --pdf --allow-local-files
@@ -531,19 +1060,86 @@ For more help, see: docs/building-decks.md
 
         parser.add_argument(
             'markdown_file',
+            nargs='?',
             help='Markdown file to convert to PowerPoint'
         )
 
+        parser.add_argument(
+            '--batch',
+            nargs='*',
+            metavar='DECK',
+            help='Convert several decks (default: every outputs/*_deck.md) without prompts'
+        )
+
+        parser.add_argument(
+            '--jobs', '-j',
+            type=int,
+            default=BATCH_JOBS,
+            metavar='N',
+            help=f'With --batch: pandoc processes at a time (default: {BATCH_JOBS})'
+        )
+
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=PANDOC_TIMEOUT,
+            metavar='SECONDS',
+            help=f'With --batch: stop a pandoc run after this long (default: {PANDOC_TIMEOUT})'
+        )
+
+        parser.add_argument(
+            '--retries',
+            type=int,
+            default=PANDOC_RETRIES,
+            metavar='N',
+            help=f'With --batch: extra attempts for a failed or timed-out deck (default: {PANDOC_RETRIES})'
+        )
+
         parser.add_argument(
             '--reference',
             type=str,
-            help='Custom PowerPoint reference template for styling'
+            help='Custom PowerPoint reference template for styling (uses pandoc)'
+        )
+
+        parser.add_argument(
+            '--engine',
+            choices=ENGINES,
+            help='native: built-in writer with FASTR styling, no pandoc needed; '
+                 'pandoc: convert with pandoc (default: native, or pandoc with --reference '
+                 'or for decks with SVG images)'
         )
 
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='With pandoc: convert the whole deck in one run instead of module by module from .fastr_cache/pptx/'
+        )
+
+        add_tracing_arguments(parser)
+
         args = parser.parse_args()
 
+        if args.batch is not None:
+            decks = list(args.batch)
+            if args.markdown_file:
+                decks.insert(0, args.markdown_file)
+            if not decks:
+                decks = list_built_decks(base_dir)
+            success = run_instrumented(
+                lambda: convert_batch(decks, base_dir, args.reference, jobs=args.jobs,
+                                      timeout=args.timeout, retries=max(0, args.retries),
+                                      use_cache=not args.no_cache, engine=args.engine),
+                trace_path=args.trace, profile_path=args.profile, memory_report=args.memory_report)
+            sys.exit(0 if success else 1)
+
+        if not args.markdown_file:
+            parser.error("give a markdown file to convert, or use --batch")
+
         # Convert the file (skip confirmation in command-line mode)
-        success = convert_to_pptx(args.markdown_file, base_dir, args.reference, skip_confirmation=True)
+        success = run_instrumented(
+            lambda: convert_to_pptx(args.markdown_file, base_dir, args.reference, skip_confirmation=True,
+                                    use_cache=not args.no_cache, engine=args.engine),
+            trace_path=args.trace, profile_path=args.profile, memory_report=args.memory_report)
         sys.exit(0 if success else 1)
 
     else:
@@ -558,7 +1154,6 @@ For more help, see: docs/building-decks.md
 
         # Remind about PDF
         print("\n⚠️  Reminder: PDF is the RECOMMENDED export format!")
-        print("   PowerPoint requires manual adjustments after export.")
         print("\n💡 To use PDF instead (easier, better results):")
         print("   marp outputs/your-deck.md --no-config --theme fastr-theme.css --pdf --allow-local-files")
 
@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════
+                    FASTR PDF RENDERER
+═══════════════════════════════════════════════════════════════════════
+
+Renders a built deck to PDF with Marp (the RECOMMENDED export format):
+
+    python3 tools/04_render_pdf.py outputs/2025-nigeria_deck.md
+
+The result is the PDF you get from
+
+    marp --no-config outputs/2025-nigeria_deck.md --theme fastr-theme.css --pdf --allow-local-files
+
+but much faster when you render again, or render another workshop:
+
+  ✓ Each core module is rendered to its own PDF once and kept in
+    .fastr_cache/pdf/. Core modules are the same in every workshop, so
+    usually only the title, agenda, breaks and custom slides are rendered
+  ✓ Modules that do need rendering are rendered in parallel (--jobs)
+  ✓ The cached pages are then joined into one PDF (tools/pdf_merge.py)
+    and numbered as Marp would number them
+
+═══════════════════════════════════════════════════════════════════════
+                         HOW TO USE
+═══════════════════════════════════════════════════════════════════════
+
+    python3 tools/04_render_pdf.py outputs/deck.md
+    python3 tools/04_render_pdf.py outputs/deck.md --jobs 8
+    python3 tools/04_render_pdf.py outputs/deck.md --no-cache      (one marp run)
+    python3 tools/04_render_pdf.py outputs/deck.md --shards        (one run per day)
+
+--shards renders the per-day decks written by
+`02_build_deck.py --split-days` (outputs/deck_day1.md, ...) side by side,
+one renderer run per day, and joins their pages into outputs/deck.pdf.
+
+The PDF is written next to the deck (outputs/deck.pdf).
+
+Another renderer can be used instead of marp, e.g. a stand-in for tests:
+
+    python3 tools/04_render_pdf.py outputs/deck.md \\
+        --renderer 'python3 benchmarks/stub_renderer.py {input} {output}'
+
+{input}, {output} and {theme} are replaced by the markdown to render, the
+PDF to write and the path of fastr-theme.css. The FASTR_PDF_RENDERER
+environment variable sets the same thing.
+
+═══════════════════════════════════════════════════════════════════════
+                      BEFORE YOU START
+═══════════════════════════════════════════════════════════════════════
+
+Install Marp CLI (needs Node.js):
+
+    npm install                          (uses package.json in this repo)
+    npm install -g @marp-team/marp-cli   (or install it for all projects)
+
+═══════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# ═══════════════════════════════════════════════════════════════════════
+# AUTO-DETECT AND USE VENV
+# ═══════════════════════════════════════════════════════════════════════
+
+def ensure_venv():
+    """Re-execute with venv Python if not already in venv."""
+    if sys.prefix != sys.base_prefix or os.environ.get('FASTR_VENV_REEXEC'):
+        return
+    script_dir = Path(__file__).resolve().parent
+    project_root = script_dir.parent
+    for venv_name in ['.venv', 'venv']:
+        venv_python = project_root / venv_name / 'bin' / 'python3'
+        if venv_python.exists():
+            os.environ['FASTR_VENV_REEXEC'] = '1'
+            os.execv(str(venv_python), [str(venv_python)] + sys.argv)
+
+ensure_venv()
+
+from content_cache import DEFAULT_CACHE_DIR, ContentCache, hash_file, hash_text, make_key
+from deck_chunks import read_day_shards, split_deck, split_frontmatter, split_slides, trim_slide_breaks
+from pdf_merge import count_pages, merge_pdfs
+from tracing import add_tracing_arguments, run_instrumented, span
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# RENDERER
+# ═══════════════════════════════════════════════════════════════════════
+# The renderer is a command line template. The default runs Marp exactly
+# as 02_build_deck.py suggests, with an explicit output file.
+
+THEME_FILE = 'fastr-theme.css'
+RENDERER_ENV = 'FASTR_PDF_RENDERER'
+MARP_ARGUMENTS = '--no-config {input} --theme {theme} --pdf --allow-local-files -o {output}'
+RENDER_TIMEOUT = 600  # seconds per renderer run
+RENDER_JOBS = min(4, os.cpu_count() or 1)
+
+
+def find_renderer(base_dir, renderer=None):
+    """
+    Renderer command template to use, or None if Marp cannot be found
+
+    An explicit renderer wins, then $FASTR_PDF_RENDERER, then marp on the
+    PATH, then the marp installed by `npm install` in node_modules/.
+    """
+    renderer = renderer or os.environ.get(RENDERER_ENV)
+    if renderer:
+        return renderer
+    local_marp = os.path.join(base_dir, 'node_modules', '.bin', 'marp')
+    marp = shutil.which('marp') or (local_marp if os.path.exists(local_marp) else None)
+    if marp:
+        return f"{shlex.quote(marp)} {MARP_ARGUMENTS}"
+    return None
+
+
+def renderer_command(template, input_path, output_path, theme_path):
+    """The renderer's command line for one markdown file"""
+    values = {'input': input_path, 'output': output_path, 'theme': theme_path}
+    return [arg.format(**values) for arg in shlex.split(template)]
+
+
+def run_renderer(cmd, cwd, timeout=RENDER_TIMEOUT):
+    """
+    Run the renderer. Raises CalledProcessError on failure (with its
+    output captured) and TimeoutExpired if it runs past timeout seconds.
+    """
+    return subprocess.run(cmd, cwd=cwd, check=True, capture_output=True,
+                          encoding='utf-8', errors='replace', timeout=timeout)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# CHUNKED RENDERING (per-module cache)
+# ═══════════════════════════════════════════════════════════════════════
+# The deck is split at module boundaries (deck_chunks.split_deck()). Each
+# chunk is rendered as a deck of its own - the deck's frontmatter plus the
+# chunk's slides - and its PDF cached under .fastr_cache/pdf/, keyed by
+# the chunk's markdown, the images it shows, fastr-theme.css and the
+# renderer command.
+#
+# Marp would number each chunk's pages from 1, so chunks are rendered with
+# pagination off and the page numbers are drawn when the pages are joined,
+# following the deck's `paginate` directives.
+# Bump PDF_CACHE_VERSION when the rendering changes.
+
+PDF_CACHE_VERSION = 1
+PDF_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+COMMENT_PATTERN = re.compile(r'<!--(.*?)-->', re.S)
+PAGINATE_PATTERN = re.compile(r'(?<![\w-])(_?)paginate(\s*:\s*)([\w-]+)')
+FRONTMATTER_PAGINATE_PATTERN = re.compile(r'^paginate\s*:\s*(\S+)[ \t]*$', re.M)
+IMAGE_REFERENCE_PATTERN = re.compile(
+    r'!\[[^\]]*\]\(\s*<?([^)\s>]+)'
+    r'|\bsrc\s*=\s*["\']([^"\']+)["\']'
+    r'|url\(\s*["\']?([^"\')]+)["\']?\s*\)')
+
+
+def open_pdf_cache(base_dir):
+    """Open the on-disk cache of rendered deck chunks"""
+    cache_dir = os.path.join(base_dir, DEFAULT_CACHE_DIR, 'pdf')
+    return ContentCache(cache_dir, max_bytes=PDF_CACHE_MAX_BYTES, suffix='.pdf')
+
+
+def is_enabled(value):
+    """A YAML boolean directive value"""
+    return value.lower() in ('true', 'yes', 'on')
+
+
+def page_numbers(frontmatter, slides):
+    """
+    The page number Marp shows on each slide, or None where it shows none.
+
+    Follows `paginate` in the frontmatter, <!-- paginate: ... --> (this
+    slide and the ones after it) and <!-- _paginate: ... --> (this slide
+    only). A slide's number is its position in the deck.
+    """
+    match = FRONTMATTER_PAGINATE_PATTERN.search(frontmatter)
+    paginate = bool(match) and is_enabled(match.group(1))
+    numbers = []
+    for number, slide in enumerate(slides, 1):
+        spot = None
+        for comment in COMMENT_PATTERN.findall(slide):
+            for underscore, _, value in PAGINATE_PATTERN.findall(comment):
+                if underscore:
+                    spot = is_enabled(value)
+                else:
+                    paginate = is_enabled(value)
+        shown = paginate if spot is None else spot
+        numbers.append(str(number) if shown else None)
+    return numbers
+
+
+def chunk_markdown(frontmatter, text):
+    """
+    One chunk as a deck of its own: the deck's frontmatter and the chunk's
+    slides, with every paginate directive turned off
+    """
+    if FRONTMATTER_PAGINATE_PATTERN.search(frontmatter):
+        frontmatter = FRONTMATTER_PAGINATE_PATTERN.sub('paginate: false', frontmatter)
+    elif frontmatter:
+        body, end = frontmatter.rstrip('\n').rsplit('\n', 1)
+        frontmatter = f"{body}\npaginate: false\n{end}\n"
+    else:
+        frontmatter = "---\nmarp: true\npaginate: false\n---\n"
+
+    def disable(match):
+        return PAGINATE_PATTERN.sub(r'\1paginate\2false', match.group(0))
+
+    return f"{frontmatter}\n{COMMENT_PATTERN.sub(disable, text)}"
+
+
+def image_fingerprints(markdown, deck_dir):
+    """(path, mtime, size) of every local image a chunk shows"""
+    targets = {next(group for group in groups if group)
+               for groups in IMAGE_REFERENCE_PATTERN.findall(markdown)}
+    fingerprints = []
+    for target in sorted(targets):
+        if target.startswith(('http://', 'https://', 'data:')):
+            continue
+        path = os.path.normpath(os.path.join(deck_dir, target))
+        try:
+            stat = os.stat(path)
+            fingerprints.append((target, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprints.append((target, None, None))
+    return fingerprints
+
+
+def prepare_chunks(content, md_file):
+    """
+    Split a built deck into chunks to render.
+
+    Returns [(label, markdown, skip, numbers)]: each chunk as a deck of its
+    own (chunk_markdown()), how many of its leading pages to drop (none
+    here) and the page numbers to draw on the rest. As in the PowerPoint
+    conversion, the empty slide Marp makes from a closing `---` is left out.
+    """
+    frontmatter, _ = split_frontmatter(content)
+    chunks = []
+    for i, (label, text) in enumerate(split_deck(content, md_file)):
+        if i == 0:
+            _, text = split_frontmatter(text)
+        text = trim_slide_breaks(text)
+        if not text:
+            continue
+        slides = split_slides(text)
+        chunks.append((label, chunk_markdown(frontmatter, text), slides))
+
+    all_numbers = page_numbers(frontmatter, [slide for _, _, slides in chunks for slide in slides])
+    prepared = []
+    start = 0
+    for label, markdown, slides in chunks:
+        prepared.append((label, markdown, 0, all_numbers[start:start + len(slides)]))
+        start += len(slides)
+    return prepared
+
+
+def get_shard_manifest_path(md_file):
+    """Shard manifest 02_build_deck.py --split-days writes beside a deck"""
+    return os.path.splitext(md_file)[0] + '.shards.json'
+
+
+def prepare_shards(content, md_file):
+    """
+    Chunks to render from the per-day decks of a built deck, one per day.
+
+    Every day deck starts with the deck's frontmatter and title slide, so
+    after the first day those pages are dropped and the rest joined in day
+    order gives the combined deck's pages. Returns chunks as
+    prepare_chunks() does. Raises ValueError if the shards are missing or
+    were not built from this deck.
+    """
+    manifest, shards = read_day_shards(get_shard_manifest_path(md_file))
+    if manifest.get('deck_hash') != hash_text(content):
+        raise ValueError("the day decks are older than the deck; rebuild with --split-days")
+
+    frontmatter, header = split_frontmatter(shards[0][:manifest['header']['length']])
+    header_slides = len(split_slides(trim_slide_breaks(header)))
+    chunks = []
+    for i, (shard, text) in enumerate(zip(manifest['shards'], shards)):
+        _, text = split_frontmatter(text)
+        text = trim_slide_breaks(text)
+        chunks.append((f"day {shard['day']}", chunk_markdown(frontmatter, text),
+                       header_slides if i else 0, split_slides(text)))
+
+    all_numbers = page_numbers(frontmatter, [slide for _, _, skip, slides in chunks
+                                             for slide in slides[skip:]])
+    prepared = []
+    start = 0
+    for label, markdown, skip, slides in chunks:
+        count = len(slides) - skip
+        prepared.append((label, markdown, skip, all_numbers[start:start + count]))
+        start += count
+    return prepared
+
+
+def render_chunks(chunks, md_file, pdf_file, base_dir, renderer, cache, jobs=RENDER_JOBS,
+                  timeout=RENDER_TIMEOUT):
+    """
+    Render a built deck to pdf_file chunk by chunk.
+
+    chunks come from prepare_chunks() or prepare_shards(). Chunks missing from the cache are rendered, up to `jobs` at a time, and
+    stored; then the pages of all chunks are joined in order and numbered.
+    Raises what run_renderer() raises, or ValueError if a chunk's PDF does
+    not have one page per slide or cannot be read. Returns (chunks,
+    rendered, pages).
+    """
+    deck_dir = os.path.dirname(os.path.abspath(md_file))
+    stem = os.path.splitext(os.path.basename(md_file))[0]
+    theme_path = os.path.join(base_dir, THEME_FILE)
+
+    with span("chunk keys", category='transform'):
+        theme_hash = hash_file(theme_path)
+        keys = [make_key('pdf', PDF_CACHE_VERSION, hash_text(markdown),
+                         image_fingerprints(markdown, deck_dir), theme_hash, renderer)
+                for _, markdown, _, _ in chunks]
+
+    paths = {}
+    todo = {}
+    for key, (label, markdown, _, _) in zip(keys, chunks):
+        if key in paths or key in todo:
+            continue
+        path = cache.lookup(key)
+        if path:
+            paths[key] = path
+        else:
+            todo[key] = (label, markdown)
+
+    def render_chunk(key, label, markdown):
+        # Rendered beside the deck so relative image paths resolve as in the deck
+        temp_base = os.path.join(deck_dir, f".{stem}.{key[:12]}")
+        temp_md, temp_pdf = temp_base + '.md', temp_base + '.pdf'
+        try:
+            with open(temp_md, 'w', encoding='utf-8') as f:
+                f.write(markdown)
+            cmd = renderer_command(renderer, temp_md, temp_pdf, theme_path)
+            with span(f"render {label}", category='subprocess'):
+                run_renderer(cmd, base_dir, timeout=timeout)
+            if not os.path.exists(temp_pdf):
+                raise ValueError(f"the renderer wrote no PDF for {label}")
+            return cache.put_file(key, temp_pdf)
+        finally:
+            for path in (temp_md, temp_pdf):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    if jobs > 1 and len(todo) > 1:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            futures = {key: pool.submit(render_chunk, key, *todo[key]) for key in todo}
+            for key, future in futures.items():
+                paths[key] = future.result()
+    else:
+        for key, (label, markdown) in todo.items():
+            paths[key] = render_chunk(key, label, markdown)
+
+    with span("join pages", category='write'):
+        parts, numbers = [], []
+        for key, (label, _, skip, chunk_numbers) in zip(keys, chunks):
+            pages = count_pages(paths[key])
+            if pages != skip + len(chunk_numbers):
+                raise ValueError(f"{label}: {pages} page(s) rendered for "
+                                 f"{skip + len(chunk_numbers)} slide(s)")
+            parts.append((paths[key], range(skip, pages)) if skip else paths[key])
+            numbers.extend(chunk_numbers)
+        temp_pdf = os.path.join(deck_dir, f".{os.path.basename(pdf_file)}.{os.getpid()}.tmp")
+        try:
+            pages = merge_pdfs(parts, temp_pdf, numbers=numbers)
+            os.replace(temp_pdf, pdf_file)
+        finally:
+            if os.path.exists(temp_pdf):
+                os.remove(temp_pdf)
+    return len(chunks), len(todo), pages
+
+
+def render_whole(md_file, pdf_file, base_dir, renderer, timeout=RENDER_TIMEOUT):
+    """Render the deck file in one renderer run (no cache); returns its page count"""
+    temp_pdf = os.path.join(os.path.dirname(os.path.abspath(pdf_file)),
+                            f".{os.path.basename(pdf_file)}.{os.getpid()}.tmp.pdf")
+    cmd = renderer_command(renderer, md_file, temp_pdf, os.path.join(base_dir, THEME_FILE))
+    try:
+        with span("render deck", category='subprocess'):
+            run_renderer(cmd, base_dir, timeout=timeout)
+        if not os.path.exists(temp_pdf):
+            raise ValueError("the renderer wrote no PDF")
+        os.replace(temp_pdf, pdf_file)
+    finally:
+        if os.path.exists(temp_pdf):
+            os.remove(temp_pdf)
+    return count_pages(pdf_file)
+
+
+def render_deck_pdf(md_file, base_dir, content=None, renderer=None, use_cache=True,
+                    jobs=RENDER_JOBS, timeout=RENDER_TIMEOUT, shards=False):
+    """
+    MAIN FUNCTION: Render a built deck to PDF
+
+    content is the deck's markdown if the caller already has it in memory
+    (e.g. the in-process pipeline); it must match md_file on disk, which
+    the renderer reads. renderer is a command template (see
+    find_renderer()). With use_cache the deck is rendered module by module
+    and unchanged modules come from .fastr_cache/pdf/ (see CHUNKED
+    RENDERING); without it the whole deck is rendered in one run. With
+    shards the per-day decks of 02_build_deck.py --split-days are rendered
+    instead, one per day and in parallel, and joined (needs use_cache).
+    Returns True on success.
+    """
+    renderer = find_renderer(base_dir, renderer)
+    if renderer is None:
+        print("\n❌ Marp CLI not found")
+        print("\n💡 Install it (needs Node.js):")
+        print("   npm install                          (in this repository)")
+        print("   npm install -g @marp-team/marp-cli   (for all projects)")
+        print(f"\n   Or name another renderer with --renderer or ${RENDERER_ENV}")
+        return False
+
+    if not os.path.isabs(md_file):
+        md_file = os.path.join(base_dir, md_file)
+    if not os.path.exists(md_file):
+        print(f"\n❌ Error: File not found: {md_file}")
+        print(f"\n💡 Make sure you've built a deck first:")
+        print(f"   python3 tools/02_build_deck.py --workshop YOUR-WORKSHOP")
+        return False
+    pdf_file = os.path.splitext(md_file)[0] + '.pdf'
+
+    print("\n" + "═" * 70)
+    print("              RENDERING PDF")
+    print("═" * 70)
+    print(f"\n📄 Input:  {os.path.basename(md_file)} ({os.path.getsize(md_file) / 1024:.1f} KB)")
+
+    started = time.perf_counter()
+    cache = open_pdf_cache(base_dir) if use_cache else None
+    try:
+        if cache is None:
+            print(f"\n🔨 Rendering the whole deck...")
+            pages = render_whole(md_file, pdf_file, base_dir, renderer, timeout=timeout)
+        else:
+            if content is None:
+                with span("read markdown"):
+                    with open(md_file, 'r', encoding='utf-8') as f:
+                        content = f.read()
+            with span("split deck", category='transform'):
+                if shards:
+                    chunks = prepare_shards(content, md_file)
+                else:
+                    chunks = prepare_chunks(content, md_file)
+            print(f"\n🔨 Rendering {'day by day' if shards else 'module by module'}...")
+            chunks, rendered, pages = render_chunks(chunks, md_file, pdf_file, base_dir, renderer,
+                                                    cache, jobs=jobs, timeout=timeout)
+            print(f"   ✓ {chunks} chunk(s): {rendered} rendered, {chunks - rendered} from cache")
+    except subprocess.CalledProcessError as e:
+        print(f"\n❌ Renderer failed (exit code {e.returncode}):")
+        output = (e.stderr or e.stdout or '').strip()
+        for line in output.split('\n')[-10:]:
+            print(f"   {line}")
+        return False
+    except subprocess.TimeoutExpired:
+        print(f"\n❌ Renderer did not finish within {timeout:.0f}s")
+        return False
+    except ValueError as e:
+        print(f"\n❌ Could not assemble the PDF: {e}")
+        if cache is not None:
+            print(f"\n💡 Render the whole deck in one go instead:")
+            print(f"   python3 tools/04_render_pdf.py {os.path.relpath(md_file, base_dir)} --no-cache")
+        return False
+    except OSError as e:
+        print(f"\n❌ Could not write {os.path.basename(pdf_file)}: {e}")
+        return False
+
+    print("\n" + "═" * 70)
+    print("                    ✅ SUCCESS!")
+    print("═" * 70)
+    print(f"\n📊 Output: {os.path.basename(pdf_file)} ({pages} pages, "
+          f"{os.path.getsize(pdf_file) / 1024:.1f} KB) in {time.perf_counter() - started:.1f}s")
+    print(f"   Location: {pdf_file}")
+    if cache is not None:
+        print(f"   PDF cache: {cache.summary()}")
+    print("\n" + "═" * 70 + "\n")
+    return True
+
+
+def main():
+    """Main entry point"""
+
+    # Determine base directory (parent of tools/)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    base_dir = os.path.dirname(script_dir)
+
+    parser = argparse.ArgumentParser(
+        description="Render a built deck to PDF with Marp, reusing cached modules",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 tools/04_render_pdf.py outputs/2025-nigeria_deck.md
+  python3 tools/04_render_pdf.py outputs/2025-nigeria_deck.md --jobs 8
+  python3 tools/04_render_pdf.py outputs/2025-nigeria_deck.md --no-cache
+  python3 tools/04_render_pdf.py outputs/2025-nigeria_deck.md --shards
+  python3 tools/04_render_pdf.py outputs/deck.md --renderer 'python3 benchmarks/stub_renderer.py {input} {output}'
+
+Each core module is rendered once and kept in .fastr_cache/pdf/; later
+renders of this deck or any other only render what changed and join the
+cached pages. --no-cache renders the whole deck in one marp run.
+--shards renders the per-day decks written by 02_build_deck.py
+--split-days, one marp run per day, and joins them.
+        """
+    )
+
+    parser.add_argument('markdown_file', help='Built deck to render (e.g. outputs/2025-nigeria_deck.md)')
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=RENDER_JOBS,
+        metavar='N',
+        help=f'Chunks to render at a time (default: {RENDER_JOBS})'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=RENDER_TIMEOUT,
+        metavar='SECONDS',
+        help=f'Stop a renderer run after this long (default: {RENDER_TIMEOUT})'
+    )
+    parser.add_argument(
+        '--renderer',
+        metavar='COMMAND',
+        help='Renderer command with {input}, {output} and {theme} placeholders '
+             f'(default: ${RENDERER_ENV}, or marp)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Render the whole deck in one run instead of module by module from .fastr_cache/pdf/'
+    )
+    parser.add_argument(
+        '--shards',
+        action='store_true',
+        help='Render the per-day decks of 02_build_deck.py --split-days in parallel and join them'
+    )
+    add_tracing_arguments(parser)
+
+    args = parser.parse_args()
+    if args.shards and args.no_cache:
+        parser.error("--shards cannot be combined with --no-cache")
+
+    success = run_instrumented(
+        lambda: render_deck_pdf(args.markdown_file, base_dir, renderer=args.renderer,
+                                use_cache=not args.no_cache, jobs=max(1, args.jobs),
+                                timeout=args.timeout, shards=args.shards),
+        trace_path=args.trace, profile_path=args.profile, memory_report=args.memory_report)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+In-memory index of asset files used to resolve image paths.
+
+The deck builder (02) rewrites image references to workshop asset
+overrides, and the PowerPoint converter (03) tries several candidate
+locations for every image. Rather than calling os.path.exists() for each
+candidate of each image, a build walks the asset folders once and answers
+existence checks from memory. On network-mounted workshop folders those
+per-image stat calls dominate build time.
+
+Folders indexed by build_asset_index():
+    workshops/<id>/assets/   (or all of workshops/ when no ID is given)
+    resources/
+    outputs/
+    assets/                  (if present)
+
+Paths outside the indexed folders are checked on disk once and remembered.
+"""
+
+import os
+
+
+class AssetIndex:
+    """
+    Every file and directory below a list of root folders.
+
+    Built with a single os.walk() per root; exists() then answers from
+    memory for any path inside a root.
+    """
+
+    def __init__(self, roots):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.files = set()
+        self.dirs = set()
+        self._outside = {}
+        for root in self.roots:
+            for dirpath, _, filenames in os.walk(root):
+                self.dirs.add(dirpath)
+                self.files.update(os.path.join(dirpath, name) for name in filenames)
+
+    def _covers(self, abs_path):
+        return any(abs_path == root or abs_path.startswith(root + os.sep)
+                   for root in self.roots)
+
+    def exists(self, path):
+        """os.path.exists() answered from the index where possible"""
+        abs_path = os.path.abspath(path)
+        if self._covers(abs_path):
+            return abs_path in self.files or abs_path in self.dirs
+        if abs_path not in self._outside:
+            self._outside[abs_path] = os.path.exists(abs_path)
+        return self._outside[abs_path]
+
+    def files_under(self, directory):
+        """Return the set of paths (relative to directory, / separated) of files below it"""
+        prefix = os.path.abspath(directory) + os.sep
+        return {path[len(prefix):].replace(os.sep, '/')
+                for path in self.files if path.startswith(prefix)}
+
+
+def build_asset_index(base_dir, workshop_id=None):
+    """
+    Index the folders images are resolved against.
+
+    With a workshop ID only that workshop's assets/ folder is indexed from
+    workshops/; without one, all of workshops/ is.
+    """
+    if workshop_id:
+        workshop_root = os.path.join(base_dir, "workshops", workshop_id, "assets")
+    else:
+        workshop_root = os.path.join(base_dir, "workshops")
+    roots = [workshop_root,
+             os.path.join(base_dir, "resources"),
+             os.path.join(base_dir, "outputs"),
+             os.path.join(base_dir, "assets")]
+    return AssetIndex(roots)
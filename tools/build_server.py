@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════
+                    FASTR BUILD SERVER
+═══════════════════════════════════════════════════════════════════════
+
+A long-running local build service for workshop weeks, when decks are
+rebuilt many times while country slides are edited.
+
+USAGE:
+    fastr serve                          HTTP on 127.0.0.1:8765
+    fastr serve --port 9000
+    fastr serve --socket /tmp/fastr.sock Unix socket instead of TCP
+    fastr serve --poll                   Stat polling instead of inotify
+
+    (or: python3 tools/build_server.py ...)
+
+At start-up the server reads core_content/ (and compiles every topic
+template), templates/, the markdown files of every workshop and every
+workshops/*/workshop.yaml into memory, once. Builds then run in this
+process from memory and take milliseconds.
+
+A file watcher (inotify, or stat polling where inotify is unavailable,
+see tools/file_watcher.py) keeps the in-memory copies current: an edited
+file is re-read, a changed workshop.yaml is re-parsed and a changed slide
+index reloads the module registry.
+
+REQUESTS:
+    GET  /                               Status: what is loaded, builds served
+    GET  /workshops                      Workshop IDs
+    POST /build?workshop=ID              Build outputs/ID_deck.md
+         &days=N                         Override the number of days
+         &force=1                        Rebuild even if up to date
+         &log=1                          Include the build log on success
+
+    curl -X POST 'http://127.0.0.1:8765/build?workshop=2025-nigeria'
+    curl --unix-socket /tmp/fastr.sock -X POST 'http://fastr/build?workshop=2025-nigeria'
+
+Responses are JSON. A failed build returns HTTP 422 with its log.
+═══════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from file_watcher import DEFAULT_POLL_INTERVAL, open_watcher, wait_for_changes
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+
+def import_build_tool():
+    """Import tools/02_build_deck.py as `build_deck` (once per process)"""
+    if 'build_deck' not in sys.modules:
+        try:
+            return importlib.import_module('build_deck')  # Found by fastr's tool finder
+        except ImportError:
+            spec = importlib.util.spec_from_file_location(
+                'build_deck', os.path.join(TOOLS_DIR, '02_build_deck.py'))
+            module = importlib.util.module_from_spec(spec)
+            sys.modules['build_deck'] = module
+            spec.loader.exec_module(module)
+    return sys.modules['build_deck']
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# HOT CONTENT
+# ═══════════════════════════════════════════════════════════════════════
+
+class HotContent:
+    """
+    The build inputs kept in memory, and their invalidation.
+
+    Files live in the build tool's PRELOADED_FILES and configs in its
+    PRELOADED_CONFIGS, which every build consults before the disk. The
+    lock serialises builds with reloads, since both touch that state.
+
+    The watcher normally reloads files before anyone asks for a build.
+    Each build also compares the modification time of every loaded file
+    first (one stat each), so a build requested within the watcher's
+    debounce window never sees stale content.
+    """
+
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self.build = import_build_tool()
+        self.lock = threading.Lock()
+        self.mtimes = {}  # path -> st_mtime_ns when loaded (None if missing)
+        self.reloads = 0
+        self.builds = 0
+        self.started = time.time()
+
+    def _path(self, *parts):
+        return os.path.abspath(os.path.join(self.base_dir, *parts))
+
+    def _stamp(self, path):
+        try:
+            self.mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            self.mtimes[path] = None
+
+    def load_all(self):
+        """Read everything once; returns (files, workshops) counts"""
+        build = self.build
+        self.mtimes.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            build.MODULES.clear()
+            build.PRELOADED_FILES.clear()
+            build.preload_core_content(self.base_dir)
+        self._stamp(self._path('core_content', 'slide_index.json'))
+        for path in build.PRELOADED_FILES:
+            self._stamp(path)
+        for folder in ('templates', 'workshops'):
+            for root, _, names in os.walk(self._path(folder)):
+                for name in names:
+                    if name.endswith('.md'):
+                        self._reload_file(os.path.join(root, name))
+
+        build.PRELOADED_CONFIGS.clear()
+        for workshop_id in build.list_available_workshops(self.base_dir):
+            self._reload_config(workshop_id)
+        return len(build.PRELOADED_FILES), len(build.PRELOADED_CONFIGS)
+
+    def _reload_file(self, path):
+        self._stamp(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.build.PRELOADED_FILES[path] = f.read()
+        except OSError:
+            self.build.PRELOADED_FILES.pop(path, None)
+
+    def _reload_config(self, workshop_id):
+        for name in ('workshop.yaml', 'config.py'):
+            self._stamp(self._path('workshops', workshop_id, name))
+        self.build.PRELOADED_CONFIGS.pop(workshop_id, None)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                config = self.build.load_workshop_config(workshop_id, self.base_dir)
+        except (Exception, SystemExit):
+            # Missing or broken: let the next build read it and report the error
+            config = None
+        if config is not None:
+            self.build.PRELOADED_CONFIGS[workshop_id] = config
+
+    def apply_changes(self, paths):
+        """Bring the in-memory copies up to date with changed files"""
+        with self.lock:
+            return self._apply_changes(paths)
+
+    def _apply_changes(self, paths):
+        core_dir = self._path('core_content')
+        workshops_dir = self._path('workshops')
+        reload_index = False
+        configs = set()
+        files = set()
+
+        for path in paths:
+            path = os.path.abspath(path)
+            if path.startswith(core_dir + os.sep) or path == core_dir:
+                if os.path.basename(path) == 'slide_index.json' or path == core_dir:
+                    reload_index = True
+                elif path.endswith('.md'):
+                    files.add(path)
+            elif path.startswith(workshops_dir + os.sep):
+                parts = os.path.relpath(path, workshops_dir).split(os.sep)
+                if len(parts) == 1 or parts[-1] in ('workshop.yaml', 'config.py'):
+                    configs.add(parts[0])
+                if path.endswith('.md'):
+                    files.add(path)
+            elif path.endswith('.md'):
+                files.add(path)
+
+        if reload_index:
+            self.load_all()
+        else:
+            for path in files:
+                self._reload_file(path)
+            for workshop_id in configs:
+                self._reload_config(workshop_id)
+        self.reloads += 1
+        return reload_index, files, configs
+
+    def build_deck(self, workshop_id, days=None, force=False):
+        """Build one workshop from memory; returns the batch-style result dict"""
+        with self.lock:
+            stale = []
+            for path, mtime in list(self.mtimes.items()):
+                try:
+                    current = os.stat(path).st_mtime_ns
+                except OSError:
+                    current = None
+                if current != mtime:
+                    stale.append(path)
+            if stale:
+                self._apply_changes(stale)
+            self.builds += 1
+            return self.build._build_one(workshop_id, self.base_dir, days, True, not force)
+
+    def status(self):
+        build = self.build
+        return {
+            'base_dir': self.base_dir,
+            'files': len(build.PRELOADED_FILES),
+            'modules': len(build.MODULES),
+            'workshops': sorted(build.PRELOADED_CONFIGS),
+            'builds': self.builds,
+            'reloads': self.reloads,
+            'uptime_seconds': round(time.time() - self.started, 1),
+        }
+
+
+def watch_loop(content, watcher):
+    """Background thread: apply file changes as they happen"""
+    while True:
+        changed = wait_for_changes(watcher)
+        if not changed:
+            continue
+        reload_index, files, configs = content.apply_changes(changed)
+        what = ["slide index (full reload)"] if reload_index else []
+        what += [os.path.relpath(path, content.base_dir) for path in sorted(files)]
+        what += [f"workshops/{workshop_id} config" for workshop_id in sorted(configs)]
+        if what:
+            with content.lock:  # Not while a build has stdout redirected
+                print(f"🔄 Reloaded: {', '.join(what)}", flush=True)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# HTTP
+# ═══════════════════════════════════════════════════════════════════════
+
+class BuildRequestHandler(BaseHTTPRequestHandler):
+    """JSON endpoints over HTTP (TCP or Unix socket)"""
+
+    server_version = 'fastr-serve/1'
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        pass  # Builds are logged by handle_build
+
+    def send_json(self, status, payload):
+        body = (json.dumps(payload, indent=2) + '\n').encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/':
+            self.send_json(200, self.server.content.status())
+        elif url.path == '/workshops':
+            self.send_json(200, sorted(self.server.content.build.PRELOADED_CONFIGS))
+        elif url.path == '/build':
+            self.handle_build(url)
+        else:
+            self.send_json(404, {'error': f"Unknown path: {url.path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path == '/build':
+            self.handle_build(url)
+        else:
+            self.send_json(404, {'error': f"Unknown path: {url.path}"})
+
+    def handle_build(self, url):
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        workshop_id = query.get('workshop', '')
+        content = self.server.content
+
+        if not workshop_id:
+            self.send_json(400, {'error': "Missing ?workshop=ID"})
+            return
+        if (workshop_id not in content.build.PRELOADED_CONFIGS
+                and workshop_id not in content.build.list_available_workshops(content.base_dir)):
+            self.send_json(404, {'error': f"Unknown workshop: {workshop_id}"})
+            return
+        try:
+            days = int(query['days']) if query.get('days') else None
+        except ValueError:
+            self.send_json(400, {'error': "days must be a number from 1 to 5"})
+            return
+        if days is not None and days not in range(1, 6):
+            self.send_json(400, {'error': "days must be a number from 1 to 5"})
+            return
+        force = query.get('force', '') not in ('', '0', 'false')
+
+        result = content.build_deck(workshop_id, days, force)
+        status = "OK" if result['ok'] else "FAILED"
+        print(f"🔨 {workshop_id}: {status} in {result['seconds'] * 1000:.0f} ms", flush=True)
+
+        payload = {
+            'workshop': workshop_id,
+            'ok': result['ok'],
+            'output': result['output'],
+            'seconds': round(result['seconds'], 4),
+        }
+        if not result['ok'] or query.get('log', '') not in ('', '0', 'false'):
+            payload['log'] = result['log']
+        self.send_json(200 if result['ok'] else 422, payload)
+
+
+class UnixHTTPServer(socketserver.UnixStreamServer):
+    """HTTPServer's interface on a Unix domain socket"""
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name = 'localhost'
+        self.server_port = 0
+
+
+def serve(base_dir, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, poll=False,
+          poll_interval=DEFAULT_POLL_INTERVAL):
+    """Load everything, start the watcher and answer requests until interrupted"""
+    print("\n" + "═" * 70)
+    print("              FASTR BUILD SERVER")
+    print("═" * 70 + "\n")
+
+    content = HotContent(base_dir)
+    start = time.perf_counter()
+    files, workshops = content.load_all()
+    print(f"📂 Loaded {files} file(s), {len(content.build.MODULES)} module(s), "
+          f"{workshops} workshop config(s) in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    roots = [os.path.join(base_dir, folder) for folder in ('core_content', 'templates', 'workshops')]
+    watcher = open_watcher(roots, poll=poll, interval=poll_interval)
+    threading.Thread(target=watch_loop, args=(content, watcher), daemon=True).start()
+    print(f"👀 Watching core_content/, templates/, workshops/ ({watcher.kind})")
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = UnixHTTPServer(socket_path, BuildRequestHandler)
+        where = f"unix socket {socket_path}"
+        example = f"curl --unix-socket {socket_path} -X POST 'http://fastr/build?workshop=ID'"
+    else:
+        server = HTTPServer((host, port), BuildRequestHandler)
+        where = f"http://{host}:{server.server_port}"
+        example = f"curl -X POST '{where}/build?workshop=ID'"
+    server.content = content
+
+    print(f"🚀 Serving on {where}")
+    print(f"   {example}")
+    print("   Press Ctrl+C to stop\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        server.server_close()
+        watcher.close()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve FASTR deck builds from memory",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  fastr serve
+  fastr serve --socket /tmp/fastr.sock
+  curl -X POST 'http://127.0.0.1:8765/build?workshop=2025-nigeria'
+        """
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Address to listen on (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'TCP port (default: {DEFAULT_PORT})')
+    parser.add_argument('--socket', metavar='PATH', help='Listen on a Unix socket instead of TCP')
+    parser.add_argument('--poll', action='store_true', help='Detect changes by polling instead of inotify')
+    parser.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL, metavar='SECONDS',
+                        help=f'Polling interval (default: {DEFAULT_POLL_INTERVAL})')
+    args = parser.parse_args()
+
+    base_dir = os.path.dirname(TOOLS_DIR)
+    serve(base_dir, args.host, args.port, args.socket, args.poll, args.poll_interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Content-addressed on-disk cache with size-bounded LRU eviction.
+
+Used by the FASTR tools to avoid redoing work whose inputs have not changed
+(e.g. transformed slide fragments in 02_build_deck.py). Entries are stored
+as one file per key under a cache directory; a file's modification time is
+its last-used time, so least recently used entries are evicted first once
+the directory grows past max_bytes.
+
+Keys are built with make_key() from any JSON-serialisable parts - typically
+content hashes plus whatever settings affect the result.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+# Default location, relative to the repository root
+DEFAULT_CACHE_DIR = '.fastr_cache'
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def hash_text(text):
+    """SHA-256 hex digest of a string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def hash_file(path, chunk_size=1024 * 1024):
+    """SHA-256 hex digest of a file's bytes, or None if it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def make_key(*parts):
+    """Build a cache key from JSON-serialisable parts."""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+    return hash_text(payload)
+
+
+class ContentCache:
+    """
+    A directory of cache entries keyed by content hash.
+
+    Counts hits, misses and evictions for reporting at the end of a run.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES, suffix='.json'):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = None  # Computed lazily on first write
+
+    def path_for(self, key):
+        """File path where the entry for key is (or would be) stored."""
+        return os.path.join(self.cache_dir, key + self.suffix)
+
+    def lookup(self, key):
+        """
+        Return the path of a cached entry, or None on a miss.
+
+        A hit refreshes the entry's last-used time.
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def get_json(self, key):
+        """Return the cached JSON value for key, or None on a miss."""
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # Corrupt or concurrently evicted entry: treat as a miss
+            self.hits -= 1
+            self.misses += 1
+            return None
+
+    def put_json(self, key, value):
+        """Store a JSON-serialisable value under key."""
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        return self._store(key, lambda f: f.write(data))
+
+    def put_file(self, key, src_path):
+        """Copy an existing file into the cache under key; returns the cached path."""
+        def copy(f):
+            with open(src_path, 'rb') as src:
+                shutil.copyfileobj(src, f)
+        return self._store(key, copy)
+
+    def _store(self, key, write):
+        """Write an entry atomically, then evict if over the size limit."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path_for(key)
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += os.path.getsize(path) - old_size
+
+        if self._size > self.max_bytes:
+            self.evict(keep=path)
+        return path
+
+    def _entries(self):
+        """List (mtime, size, path) for every entry in the cache directory."""
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return entries
+        for name in names:
+            if not name.endswith(self.suffix):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, keep=None):
+        """Remove least recently used entries until under max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        self._size = total
+
+    def summary(self):
+        """One-line hit/miss report."""
+        lookups = self.hits + self.misses
+        rate = f" ({100 * self.hits / lookups:.0f}% hit rate)" if lookups else ""
+        line = f"{self.hits} hit(s), {self.misses} miss(es){rate}"
+        if self.evictions:
+            line += f", {self.evictions} evicted"
+        return line
@@ -0,0 +1,138 @@
+"""
+Splits a built deck into per-module chunks.
+
+02_build_deck.py records every section it writes (core content file,
+agenda, break, custom slide) in outputs/<deck>.deps.json. split_deck()
+uses that list to cut the deck where one module's slides end and the
+next begin, so a later stage can convert or render each chunk once and
+cache it: 03_convert_pptx.py (pandoc) and 04_render_pdf.py (Marp) both do.
+"""
+
+import json
+import os
+import re
+
+from content_cache import hash_text
+
+FRONTMATTER_PATTERN = re.compile(r'\A---[ \t]*\n(.*?\n)---[ \t]*\n', re.S)
+
+
+def split_frontmatter(content):
+    """(frontmatter block or '', rest of the deck) of a Marp deck"""
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return '', content
+    return match.group(0), content[match.end():]
+
+
+def section_module(section):
+    """'m3' for a deck section from core module m3, None for anything else"""
+    parts = (section.get('path') or '').split('/')
+    if section.get('kind') == 'core' and len(parts) > 2:
+        return parts[1].split('_')[0]
+    return None
+
+
+def split_deck(content, md_file):
+    """
+    Split a built deck at module boundaries.
+
+    Returns [(label, text)]: one chunk per core module ('m0', 'm1', ...)
+    and one for each run of other slides ('custom': title, agenda, breaks,
+    custom slides) between them. Section boundaries are slide breaks, so
+    every chunk holds whole slides. If outputs/<deck>.deps.json is missing
+    or describes another build of the deck, the whole deck is one chunk.
+    """
+    whole = [('deck', content)]
+    manifest_path = os.path.splitext(md_file)[0] + '.deps.json'
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            sections = json.load(f).get('sections') or []
+    except (OSError, ValueError, AttributeError):
+        return whole
+    if sum(section.get('length', 0) for section in sections) != len(content):
+        return whole
+
+    chunks = []
+    position = 0
+    for section in sections:
+        length = section.get('length', 0)
+        text = content[position:position + length]
+        position += length
+        if hash_text(text) != section.get('hash'):
+            return whole
+        label = section_module(section) or 'custom'
+        if chunks and chunks[-1][0] == label:
+            chunks[-1][1].append(text)
+        else:
+            chunks.append((label, [text]))
+    return [(label, ''.join(texts)) for label, texts in chunks]
+
+
+def trim_slide_breaks(markdown):
+    """Drop blank lines and slide breaks at the start and end of a chunk"""
+    lines = markdown.split('\n')
+    start, end = 0, len(lines)
+    while start < end and lines[start].strip() in ('', '---'):
+        start += 1
+    while end > start and lines[end - 1].strip() in ('', '---'):
+        end -= 1
+    return '\n'.join(lines[start:end]) + '\n' if start < end else ''
+
+
+def split_slides(markdown):
+    """
+    Slides of a chunk (frontmatter already removed): the text between
+    `---` lines, outside fenced code blocks
+    """
+    slides, current = [], []
+    in_code = False
+    for line in markdown.split('\n'):
+        stripped = line.strip()
+        if stripped.startswith(('```', '~~~')):
+            in_code = not in_code
+        if stripped == '---' and not in_code:
+            slides.append('\n'.join(current))
+            current = []
+        else:
+            current.append(line)
+    slides.append('\n'.join(current))
+    return slides
+
+
+def read_day_shards(manifest_path):
+    """
+    Read the per-day decks listed in a shard manifest (written by
+    02_build_deck.py --split-days). Returns (manifest, [shard text]) in day
+    order. Raises ValueError if the manifest or a shard cannot be read or
+    a shard changed since the build wrote it.
+    """
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"cannot read {os.path.basename(manifest_path)}: {e}")
+    directory = os.path.dirname(manifest_path)
+    shards = []
+    for shard in manifest.get('shards') or []:
+        path = os.path.join(directory, shard['path'])
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError as e:
+            raise ValueError(f"cannot read {shard['path']}: {e}")
+        if hash_text(text) != shard['hash']:
+            raise ValueError(f"{shard['path']} changed since it was built")
+        shards.append(text)
+    if not shards:
+        raise ValueError(f"{os.path.basename(manifest_path)} lists no shards")
+    return manifest, shards
+
+
+def stitch_day_shards(manifest, shards):
+    """
+    The combined deck from its per-day decks: the first shard, then every
+    later one without the frontmatter and title slide they share
+    """
+    header = manifest['header']['length']
+    return shards[0] + ''.join(text[header:] for text in shards[1:])
@@ -0,0 +1,96 @@
+"""
+Teaching-time estimates from the slide index.
+
+Every topic's minutes come from its statistics in
+core_content/slide_index.json, which 00_extract_slides.py keeps up to date
+incrementally:
+
+    minutes = minutes_per_topic
+            + minutes_per_slide     * slides
+            + minutes_per_100_words * words / 100
+            + minutes_per_image     * images
+            + minutes_per_table     * tables
+
+times `scale`, rounded to the nearest 5 minutes (at least 5).
+
+The default weights are calibrated on the current core content so that
+topics average the 15 minutes the wizard used to give every topic. A
+40-slide DQA topic and a 3-slide introduction no longer count the same.
+
+A workshop can override any weight, or pin single topics, in workshop.yaml:
+
+    schedule:
+      durations:
+        minutes_per_slide: 4      # slower pace
+        scale: 1.2                # or stretch everything by 20%
+        topics:
+          m4_3: 45                # fixed minutes for one topic
+"""
+
+DEFAULT_WEIGHTS = {
+    'minutes_per_topic': 3.0,
+    'minutes_per_slide': 3.5,
+    'minutes_per_100_words': 5.0,
+    'minutes_per_image': 2.5,
+    'minutes_per_table': 3.5,
+    'scale': 1.0,
+}
+
+ROUND_TO_MINUTES = 5
+MIN_TOPIC_MINUTES = 5
+
+
+def duration_weights(overrides=None):
+    """
+    Merge workshop.yaml `schedule.durations` overrides into the defaults.
+
+    Returns (weights, problems): invalid entries are left out of weights
+    and described in problems, so the caller can warn about them.
+    """
+    weights = dict(DEFAULT_WEIGHTS, topics={})
+    problems = []
+    if not overrides:
+        return weights, problems
+    if not isinstance(overrides, dict):
+        return weights, ["schedule.durations should be a mapping of weight names to numbers"]
+
+    for key, value in overrides.items():
+        if key == 'topics':
+            for topic_id, minutes in (value or {}).items():
+                if isinstance(minutes, (int, float)) and not isinstance(minutes, bool) and minutes > 0:
+                    weights['topics'][str(topic_id)] = minutes
+                else:
+                    problems.append(f"schedule.durations.topics.{topic_id} should be a positive number of minutes")
+        elif key not in DEFAULT_WEIGHTS:
+            problems.append(f"Unknown schedule.durations setting '{key}' "
+                            f"(expected one of: {', '.join(DEFAULT_WEIGHTS)}, topics)")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+            weights[key] = value
+        else:
+            problems.append(f"schedule.durations.{key} should be a number (got {value!r})")
+    return weights, problems
+
+
+def round_minutes(minutes):
+    """Nearest multiple of ROUND_TO_MINUTES, at least MIN_TOPIC_MINUTES"""
+    rounded = int(minutes / ROUND_TO_MINUTES + 0.5) * ROUND_TO_MINUTES
+    return max(MIN_TOPIC_MINUTES, rounded)
+
+
+def topic_minutes(topic_id, record, weights=DEFAULT_WEIGHTS):
+    """Estimated minutes for one topic from its slide index record"""
+    pinned = weights.get('topics', {}).get(topic_id)
+    if pinned is not None:
+        return pinned
+    minutes = (weights['minutes_per_topic']
+               + weights['minutes_per_slide'] * (record.get('slide_count') or 0)
+               + weights['minutes_per_100_words'] * (record.get('word_count') or 0) / 100
+               + weights['minutes_per_image'] * len(record.get('images') or [])
+               + weights['minutes_per_table'] * (record.get('table_count') or 0))
+    return round_minutes(minutes * weights['scale'])
+
+
+def estimate_topic_minutes(index, weights=DEFAULT_WEIGHTS):
+    """{topic_id: minutes} for every topic in a slide index"""
+    return {topic_id: topic_minutes(topic_id, record, weights)
+            for topic_id, record in index['slides'].items()}
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════
+                    FASTR COMMAND LINE
+═══════════════════════════════════════════════════════════════════════
+
+One entry point for all the slide tools:
+
+    python3 tools/fastr.py extract  [...]   Step 0: tools/00_extract_slides.py
+    python3 tools/fastr.py new      [...]   Step 1: tools/01_new_workshop.py
+    python3 tools/fastr.py build    [...]   Step 2: tools/02_build_deck.py
+    python3 tools/fastr.py pptx     [...]   Step 3: tools/03_convert_pptx.py
+    python3 tools/fastr.py pdf      [...]   Step 3: tools/04_render_pdf.py
+    python3 tools/fastr.py serve    [...]   Build service: tools/build_server.py
+    python3 tools/fastr.py pipeline --workshop ID [...]
+                                            extract → validate → build → pptx
+
+(or ./fastr <command> from the repository root)
+
+extract/new/build/pptx/pdf/serve take exactly the options of the tool they run, e.g.
+`fastr build --workshop 2025-nigeria --force` or `fastr pptx --help`.
+
+pipeline runs every step in this one process. Extracted slides and the
+slide index are handed to the build in memory, and the built deck is
+handed to the PowerPoint converter in memory (files are still written
+as usual). Validation runs at the start of the build and stops the
+pipeline on errors.
+
+Each tool is imported only when its command runs, so `fastr --help`
+starts instantly and does not need PyYAML. The venv re-exec happens at
+most once, here, before any tool is loaded.
+═══════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import importlib
+import importlib.abc
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+# ═══════════════════════════════════════════════════════════════════════
+# AUTO-DETECT AND USE VENV
+# ═══════════════════════════════════════════════════════════════════════
+
+def ensure_venv():
+    """Re-execute with venv Python if not already in venv (at most once)."""
+    if sys.prefix != sys.base_prefix or os.environ.get('FASTR_VENV_REEXEC'):
+        return
+    script_dir = Path(__file__).resolve().parent
+    project_root = script_dir.parent
+    for venv_name in ['.venv', 'venv']:
+        venv_python = project_root / venv_name / 'bin' / 'python3'
+        if venv_python.exists():
+            os.environ['FASTR_VENV_REEXEC'] = '1'
+            os.execv(str(venv_python), [str(venv_python)] + sys.argv)
+
+ensure_venv()
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# LAZY TOOL LOADING
+# ═══════════════════════════════════════════════════════════════════════
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TOOLS_DIR)
+
+# command -> (importable module name, script in tools/, help line)
+COMMANDS = {
+    'extract': ('extract_slides', '00_extract_slides.py', 'Extract slides from methodology/ into core_content/'),
+    'new': ('new_workshop', '01_new_workshop.py', 'Create a new workshop (interactive wizard)'),
+    'build': ('build_deck', '02_build_deck.py', 'Validate and build a workshop slide deck'),
+    'pptx': ('convert_pptx', '03_convert_pptx.py', 'Convert a built deck to PowerPoint'),
+    'pdf': ('render_pdf', '04_render_pdf.py', 'Render a built deck to PDF, reusing cached modules'),
+    'serve': ('build_server', 'build_server.py', 'Serve deck builds from memory, reloading on file changes'),
+}
+
+
+class ToolFinder(importlib.abc.MetaPathFinder):
+    """
+    Makes the numbered tool scripts importable by name (`import build_deck`).
+
+    Worker processes started by a tool unpickle functions by module name,
+    so the names must resolve in every process, not just this one.
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        for module_name, script, _ in COMMANDS.values():
+            if fullname == module_name:
+                return importlib.util.spec_from_file_location(
+                    module_name, os.path.join(TOOLS_DIR, script))
+        return None
+
+
+sys.meta_path.append(ToolFinder())
+
+
+def load_tool(command):
+    """Import a tool's module (once) and return it"""
+    return importlib.import_module(COMMANDS[command][0])
+
+
+def run_tool(command, args):
+    """Run a tool's main() as if its script had been called with args"""
+    sys.argv = [f"fastr {command}"] + args
+    load_tool(command).main()
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# PIPELINE
+# ═══════════════════════════════════════════════════════════════════════
+
+def run_pipeline(args, base_dir=BASE_DIR):
+    """
+    extract → validate → build → pptx in one process.
+
+    Returns True if every step succeeded.
+    """
+    from tracing import span
+
+    print("\n" + "═" * 70)
+    print(f"              FASTR PIPELINE: {args.workshop}")
+    print("═" * 70)
+
+    # Step 0: extraction; keep what it produced for the build
+    extracted = {}
+    if not args.skip_extract:
+        with span("extract"):
+            extract = load_tool('extract')
+            jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+            if not extract.extract_slides(base_dir, force=args.force, jobs=jobs, collect=extracted):
+                print("❌ Pipeline stopped: extraction failed")
+                return False
+
+    # Steps 1-2: validation and build, reading extracted slides from memory
+    built = {}
+    with span("build"):
+        build = load_tool('build')
+        if 'index' in extracted:
+            build.load_modules(base_dir, index=extracted['index'])
+        build.PRELOADED_FILES.update(extracted.get('files', {}))
+        output_path = build.build_workshop_deck(
+            args.workshop, base_dir, args.output, skip_confirmation=True,
+            override_days=args.days, use_cache=args.transform_cache,
+            incremental=not args.force, collect=built)
+
+    if args.skip_pptx:
+        return True
+
+    # Step 3: PowerPoint, from the deck text the build just produced
+    with span("pptx"):
+        convert = load_tool('pptx')
+        return convert.convert_to_pptx(output_path, base_dir, args.reference,
+                                       skip_confirmation=True, content=built.get('deck'),
+                                       use_cache=not args.no_cache, engine=args.engine)
+
+
+def pipeline_parser(subparsers):
+    """Options of `fastr pipeline`"""
+    from tracing import add_tracing_arguments
+
+    parser = subparsers.add_parser(
+        'pipeline',
+        help='Extract, validate, build and convert one workshop in a single process',
+        description='Run extract → validate → build → pptx in one process',
+    )
+    parser.add_argument('--workshop', '-w', required=True, help='Workshop ID (folder name in workshops/)')
+    parser.add_argument('--output', '-o', help='Deck file name in outputs/ (default: <workshop>_deck.md)')
+    parser.add_argument('--days', '-d', type=int, choices=[1, 2, 3, 4, 5],
+                        help='Number of days (overrides config)')
+    parser.add_argument('--reference', help='Custom PowerPoint reference template (uses pandoc)')
+    parser.add_argument('--engine', choices=['native', 'pandoc'],
+                        help='PowerPoint writer (default: native, or pandoc with --reference '
+                             'or for decks with SVG images)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-extract every file and rebuild the deck even if up to date')
+    parser.add_argument('--no-cache', action='store_true', help='Do not use the PowerPoint chunk cache')
+    parser.add_argument('--transform-cache', action='store_true',
+                        help='Reuse transformed core_content files from .fastr_cache/transforms/')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Extraction worker processes (0 = one per CPU)')
+    parser.add_argument('--skip-extract', action='store_true',
+                        help='Use core_content/ as it is instead of extracting first')
+    parser.add_argument('--skip-pptx', action='store_true', help='Stop after building the deck')
+    add_tracing_arguments(parser)
+    return parser
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    """Main entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+
+    parser = argparse.ArgumentParser(
+        prog='fastr',
+        description="FASTR slide tools",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  fastr extract --jobs 4
+  fastr new
+  fastr build --workshop 2025-nigeria
+  fastr pptx outputs/2025-nigeria_deck.md
+  fastr pdf outputs/2025-nigeria_deck.md
+  fastr pipeline --workshop 2025-nigeria --trace pipeline.json
+  fastr serve --port 8765
+
+Run `fastr <command> --help` for a command's options.
+        """
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='<command>')
+    for command, (_, script, help_text) in COMMANDS.items():
+        # Options belong to the tool; its own parser handles them (and --help)
+        subparsers.add_parser(command, help=f"{help_text} ({script})", add_help=False)
+
+    # Only the command actually run has its parser (and imports) set up
+    if argv and argv[0] in COMMANDS:
+        run_tool(argv[0], argv[1:])
+        return
+    if argv and argv[0] == 'pipeline':
+        pipeline_parser(subparsers)
+    else:
+        subparsers.add_parser('pipeline', help='Extract, validate, build and convert one workshop '
+                                               'in a single process')
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        sys.exit(1)
+
+    from tracing import run_instrumented
+    success = run_instrumented(lambda: run_pipeline(args), trace_path=args.trace,
+                               profile_path=args.profile, memory_report=args.memory_report)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+File change notifications for the FASTR tools.
+
+Used by `fastr serve` to invalidate its in-memory content and by the
+--watch modes of 00_extract_slides.py and 02_build_deck.py (see watch()
+and add_watch_arguments()).
+
+Two backends with the same interface:
+
+    InotifyWatcher   Linux inotify through ctypes. Blocks in select()
+                     until something changes, so idle CPU use is zero.
+    PollingWatcher   Stats every file under the roots once per interval.
+                     Works everywhere, including network and container
+                     mounts where inotify events never arrive (Codespaces)
+
+open_watcher() picks inotify where available and falls back to polling.
+Polling is forced with poll=True, FASTR_WATCH_POLL=1, or automatically in
+GitHub Codespaces.
+
+Hidden files and folders (.git, .fastr_cache, editor swap files),
+__pycache__, backup files ending in ~ and the tools' own .tmp files
+(written before an atomic rename) are ignored.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_DEBOUNCE = 0.3
+
+# inotify constants (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def is_ignored(name):
+    """True for names the watchers never report"""
+    return (name.startswith('.') or name == '__pycache__'
+            or name.endswith('~') or name.endswith('.tmp'))
+
+
+def iter_tree(root):
+    """Yield (dirpath, filenames) below root, skipping ignored entries"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if not is_ignored(name)]
+        yield dirpath, [name for name in filenames if not is_ignored(name)]
+
+
+class PollingWatcher:
+    """Detects changes by comparing (mtime, size) of every file between scans."""
+
+    kind = 'polling'
+
+    def __init__(self, roots, interval=DEFAULT_POLL_INTERVAL):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.interval = interval
+        self._state = self._scan()
+
+    def _scan(self):
+        state = {}
+        for root in self.roots:
+            for dirpath, filenames in iter_tree(root):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def wait(self, timeout=None):
+        """
+        Block until files change or timeout seconds pass.
+
+        Returns the set of changed, added or removed paths (empty on timeout).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            state = self._scan()
+            changed = {path for path in state.keys() | self._state.keys()
+                       if state.get(path) != self._state.get(path)}
+            self._state = state
+            if changed:
+                return changed
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return set()
+                time.sleep(min(self.interval, remaining))
+            else:
+                time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Recursive inotify watches on every folder below the roots."""
+
+    kind = 'inotify'
+
+    def __init__(self, roots):
+        libc_name = ctypes.util.find_library('c')
+        if sys.platform != 'linux' or not libc_name:
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.roots = [os.path.abspath(root) for root in roots]
+        self._dirs = {}  # watch descriptor -> directory
+        try:
+            for root in self.roots:
+                for dirpath, _ in iter_tree(root):
+                    self._add_watch(dirpath)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            # Typically ENOSPC: fs.inotify.max_user_watches reached
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._dirs[wd] = directory
+
+    def _read_events(self):
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were lost: report the roots so callers rescan
+                    changed.update(self.roots)
+                    continue
+                directory = self._dirs.get(wd)
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                if directory is None or (name and is_ignored(name)):
+                    continue
+
+                path = os.path.join(directory, name) if name else directory
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    # New folder: watch it, and report what it already contains
+                    for dirpath, filenames in iter_tree(path):
+                        try:
+                            self._add_watch(dirpath)
+                        except OSError:
+                            continue
+                        changed.update(os.path.join(dirpath, filename) for filename in filenames)
+                changed.add(path)
+
+    def wait(self, timeout=None):
+        """
+        Block until files change or timeout seconds pass.
+
+        Returns the set of changed, added or removed paths (empty on timeout).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return set()
+            changed = self._read_events()
+            if changed:
+                return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def polling_preferred():
+    """True where inotify is unreliable or explicitly disabled"""
+    return (os.environ.get('FASTR_WATCH_POLL', '') not in ('', '0')
+            or os.environ.get('CODESPACES') == 'true')
+
+
+def open_watcher(roots, poll=False, interval=DEFAULT_POLL_INTERVAL):
+    """Watch existing folders among roots, with inotify if possible"""
+    roots = [root for root in roots if os.path.isdir(root)]
+    if not poll and not polling_preferred():
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots, interval)
+
+
+def wait_for_changes(watcher, debounce=DEFAULT_DEBOUNCE, timeout=None):
+    """
+    Wait for a change, then keep collecting until no further change
+    arrives for `debounce` seconds, so a burst of saves is one batch.
+
+    Returns the set of changed paths (empty if timeout passed first).
+    """
+    changed = watcher.wait(timeout)
+    while changed:
+        more = watcher.wait(debounce)
+        if not more:
+            break
+        changed |= more
+    return changed
+
+
+def add_watch_arguments(parser):
+    """Add --watch, --poll and --debounce to an argparse parser"""
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and redo the work whenever inputs change'
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='With --watch: detect changes by polling instead of inotify'
+    )
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        metavar='SECONDS',
+        help=f'With --watch: wait for this long without changes before acting (default: {DEFAULT_DEBOUNCE})'
+    )
+
+
+def watch(roots, action, base_dir, poll=False, debounce=DEFAULT_DEBOUNCE, accept=None):
+    """
+    Run action(set()) once, then action(changed_paths) after every burst
+    of changes below roots, until Ctrl+C.
+
+    accept(path) can narrow which changed paths count. The watcher is
+    started before the first run, so edits made during it are not missed.
+    """
+    watcher = open_watcher(roots, poll=poll)
+    try:
+        action(set())
+        folders = ', '.join(os.path.relpath(root, base_dir) + '/' for root in roots)
+        print(f"👀 Watching {folders} ({watcher.kind}) - press Ctrl+C to stop")
+        while True:
+            changed = wait_for_changes(watcher, debounce)
+            if accept:
+                changed = {path for path in changed if accept(path)}
+            if not changed:
+                continue
+            shown = sorted(os.path.relpath(path, base_dir) for path in changed)
+            more = f" and {len(shown) - 5} more" if len(shown) > 5 else ""
+            print(f"\n🔄 Changed: {', '.join(shown[:5])}{more}")
+            action(changed)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
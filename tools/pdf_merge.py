@@ -0,0 +1,591 @@
+"""
+Joins PDF files page by page and writes page numbers onto the result.
+
+04_render_pdf.py renders a deck module by module and caches each part's
+PDF (see render_deck_pdf() there); merge_pdfs() stitches page ranges of
+the cached parts back together in order. Only the standard library is
+used. A PDF is a set of numbered objects found through a cross-reference
+table, so each input is read through its xref table or xref stream
+(compressed object streams included). Every page is then copied with the
+objects it uses, renumbered, into a new file with one flat page tree.
+
+    pages                  copied with the resources, fonts, images and
+                           annotations they refer to; attributes a page
+                           inherits from its page tree are copied onto it
+    catalog, outlines,     dropped - the merged file gets a fresh catalog
+    structure tree         and page tree
+
+Content streams are copied byte for byte, still compressed. Page numbers
+are added as an extra content stream per page, set in Helvetica (one of
+the PDF base fonts, so nothing is embedded). Encrypted files are refused
+with a ValueError.
+"""
+
+import re
+import zlib
+from collections import namedtuple
+
+WHITESPACE = b'\x00\t\n\x0c\r '
+DELIMITERS = b'()<>[]{}/%'
+NUMBER_PATTERN = re.compile(rb'[+-]?(\d+\.?\d*|\.\d+)$')
+INT_PATTERN = re.compile(rb'[+-]?\d+$')
+OBJECT_HEADER = re.compile(rb'(\d+)\s+(\d+)\s+obj\b')
+STARTXREF_PATTERN = re.compile(rb'startxref\s+(\d+)')
+XREF_ENTRY_PATTERN = re.compile(rb'(\d{10}) (\d{5}) ([nf])')
+
+# Page attributes a page can inherit from its ancestors in the page tree
+INHERITED = ('/Resources', '/MediaBox', '/CropBox', '/Rotate')
+
+# Marp's default theme puts the page number in the bottom right corner;
+# sizes in px of the 1280x720 slide. Helvetica digits are 0.556 em wide.
+NumberStyle = namedtuple('NumberStyle', ['size', 'right', 'bottom', 'gray'])
+MARP_NUMBER_STYLE = NumberStyle(size=24, right=30, bottom=21, gray=0.47)
+SLIDE_WIDTH_PX = 1280
+DIGIT_WIDTH = 0.556
+NUMBER_FONT = '/FastrPageNumber'
+
+
+class Raw(bytes):
+    """A token written back exactly as read: strings, reals, true/false/null"""
+
+
+class Name(str):
+    """A PDF name, kept with its leading slash ('/Type')"""
+
+
+Ref = namedtuple('Ref', ['num', 'gen'])
+
+
+class Stream:
+    """A stream object: its dictionary and its still-encoded data"""
+
+    def __init__(self, info, data):
+        self.info = info
+        self.data = data
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# READING
+# ═══════════════════════════════════════════════════════════════════════
+
+def _skip(data, pos):
+    """Position of the next token: skips whitespace and comments"""
+    length = len(data)
+    while pos < length:
+        char = data[pos]
+        if char in WHITESPACE:
+            pos += 1
+        elif char == 0x25:  # %
+            while pos < length and data[pos] not in b'\r\n':
+                pos += 1
+        else:
+            break
+    return pos
+
+
+def _token_end(data, pos):
+    length = len(data)
+    while pos < length and data[pos] not in WHITESPACE and data[pos] not in DELIMITERS:
+        pos += 1
+    return pos
+
+
+def _literal_string_end(data, pos):
+    """End of the (...) string starting at pos; parentheses nest"""
+    depth = 0
+    length = len(data)
+    while pos < length:
+        char = data[pos]
+        if char == 0x5C:  # backslash
+            pos += 2
+            continue
+        if char == 0x28:
+            depth += 1
+        elif char == 0x29:
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos += 1
+    raise ValueError("unterminated string")
+
+
+def parse_object(data, pos):
+    """Parse one direct object at pos. Returns (object, end position)."""
+    pos = _skip(data, pos)
+    if pos >= len(data):
+        raise ValueError("unexpected end of file")
+    char = data[pos:pos + 1]
+
+    if data.startswith(b'<<', pos):
+        info = {}
+        pos += 2
+        while True:
+            pos = _skip(data, pos)
+            if data.startswith(b'>>', pos):
+                return info, pos + 2
+            key, pos = parse_object(data, pos)
+            if not isinstance(key, Name):
+                raise ValueError(f"dictionary key is not a name at {pos}")
+            info[key], pos = parse_object(data, pos)
+    if char == b'[':
+        items = []
+        pos += 1
+        while True:
+            pos = _skip(data, pos)
+            if data.startswith(b']', pos):
+                return items, pos + 1
+            item, pos = parse_object(data, pos)
+            items.append(item)
+    if char == b'<':
+        end = data.index(b'>', pos) + 1
+        return Raw(data[pos:end]), end
+    if char == b'(':
+        end = _literal_string_end(data, pos)
+        return Raw(data[pos:end]), end
+    if char == b'/':
+        end = _token_end(data, pos + 1)
+        return Name(data[pos:end].decode('latin-1')), end
+
+    end = _token_end(data, pos)
+    if end == pos:
+        raise ValueError(f"unexpected {char!r} at {pos}")
+    token = data[pos:end]
+    if INT_PATTERN.match(token):
+        # "12 0 R" is a reference
+        gen_start = _skip(data, end)
+        gen_end = _token_end(data, gen_start)
+        if gen_end > gen_start and data[gen_start:gen_end].isdigit():
+            r_start = _skip(data, gen_end)
+            if data[r_start:_token_end(data, r_start)] == b'R':
+                return Ref(int(token), int(data[gen_start:gen_end])), r_start + 1
+        return int(token), end
+    if token in (b'true', b'false', b'null') or NUMBER_PATTERN.match(token):
+        return Raw(token), end
+    raise ValueError(f"unexpected token {token[:20]!r} at {pos}")
+
+
+def number(value):
+    """A number read from a PDF as int or float"""
+    return value if isinstance(value, int) else float(value)
+
+
+def _unpredict(data, params):
+    """Undo a PNG predictor (used by xref streams)"""
+    predictor = params.get('/Predictor', 1)
+    if predictor < 10:
+        if predictor != 1:
+            raise ValueError(f"unsupported predictor {predictor}")
+        return data
+    columns = params.get('/Columns', 1) * params.get('/Colors', 1) * params.get('/BitsPerComponent', 8) // 8
+    bpp = max(1, params.get('/Colors', 1) * params.get('/BitsPerComponent', 8) // 8)
+    output = bytearray()
+    previous = bytearray(columns)
+    for row_start in range(0, len(data), columns + 1):
+        kind = data[row_start]
+        row = bytearray(data[row_start + 1:row_start + 1 + columns])
+        for i in range(len(row)):
+            left = row[i - bpp] if i >= bpp else 0
+            up = previous[i]
+            if kind == 1:
+                row[i] = (row[i] + left) & 0xFF
+            elif kind == 2:
+                row[i] = (row[i] + up) & 0xFF
+            elif kind == 3:
+                row[i] = (row[i] + (left + up) // 2) & 0xFF
+            elif kind == 4:
+                upper_left = previous[i - bpp] if i >= bpp else 0
+                estimate = left + up - upper_left
+                pa, pb, pc = abs(estimate - left), abs(estimate - up), abs(estimate - upper_left)
+                predicted = left if pa <= pb and pa <= pc else up if pb <= pc else upper_left
+                row[i] = (row[i] + predicted) & 0xFF
+        output += row
+        previous = row
+    return bytes(output)
+
+
+class PdfDocument:
+    """
+    A PDF file read into memory. Objects are parsed on first use.
+
+    pages is the list of page object numbers in order; page_info(num)
+    gives a page's dictionary with inherited attributes filled in.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = f.read()
+        self.offsets = {}       # num -> byte offset
+        self.compressed = {}    # num -> (object stream num, index)
+        self.objects = {}
+        self.inherited = {}
+        try:
+            self.trailer = self._read_xref()
+        except (ValueError, IndexError, KeyError, zlib.error):
+            self.trailer = self._rebuild_xref()
+        if '/Encrypt' in self.trailer:
+            raise ValueError(f"{path}: encrypted PDFs are not supported")
+        self.pages = []
+        catalog = self.resolve(self.trailer['/Root'])
+        self._walk_pages(catalog['/Pages'], {}, set())
+
+    # Cross-reference sections, newest first; older entries never override
+
+    def _read_xref(self):
+        match = None
+        for match in STARTXREF_PATTERN.finditer(self.data, max(0, len(self.data) - 2048)):
+            pass
+        if match is None:
+            raise ValueError("no startxref")
+        trailer = None
+        offset, seen = int(match.group(1)), set()
+        while offset is not None and offset not in seen:
+            seen.add(offset)
+            if self.data.startswith(b'xref', _skip(self.data, offset)):
+                section = self._read_xref_table(_skip(self.data, offset) + 4)
+                if '/XRefStm' in section:
+                    self._read_xref_stream(section['/XRefStm'])
+            else:
+                section = self._read_xref_stream(offset)
+            trailer = trailer or section
+            offset = section.get('/Prev')
+        if '/Root' not in trailer:
+            raise ValueError("trailer has no /Root")
+        return trailer
+
+    def _read_xref_table(self, pos):
+        data = self.data
+        while True:
+            pos = _skip(data, pos)
+            if data.startswith(b'trailer', pos):
+                trailer, _ = parse_object(data, pos + 7)
+                return trailer
+            first, pos = parse_object(data, pos)
+            count, pos = parse_object(data, pos)
+            for num in range(first, first + count):
+                entry = XREF_ENTRY_PATTERN.match(data, _skip(data, pos))
+                if not entry:
+                    raise ValueError(f"bad xref entry at {pos}")
+                pos = entry.end()
+                if entry.group(3) == b'n' and num not in self.offsets and num not in self.compressed:
+                    self.offsets[num] = int(entry.group(1))
+
+    def _read_xref_stream(self, offset):
+        stream = self._parse_indirect(offset)
+        info = stream.info
+        rows = self._decode(stream)
+        widths = info['/W']
+        index = info.get('/Index', [0, info['/Size']])
+        row_size = sum(widths)
+        pos = 0
+        for first, count in zip(index[0::2], index[1::2]):
+            for num in range(first, first + count):
+                fields = []
+                for width in widths:
+                    fields.append(int.from_bytes(rows[pos:pos + width], 'big') if width else None)
+                    pos += width
+                kind = 1 if fields[0] is None else fields[0]
+                if num in self.offsets or num in self.compressed:
+                    continue
+                if kind == 1:
+                    self.offsets[num] = fields[1]
+                elif kind == 2:
+                    self.compressed[num] = (fields[1], fields[2] or 0)
+        if pos > len(rows) or row_size == 0:
+            raise ValueError("xref stream is too short")
+        return info
+
+    def _rebuild_xref(self):
+        """Find objects by scanning the file, for damaged cross-references"""
+        self.offsets, self.compressed, self.objects = {}, {}, {}
+        for match in OBJECT_HEADER.finditer(self.data):
+            self.offsets[int(match.group(1))] = match.start()
+        trailer = {}
+        for match in re.finditer(rb'trailer\s*<<', self.data):
+            trailer.update(parse_object(self.data, match.start() + 7)[0])
+        for num in sorted(self.offsets):
+            try:
+                obj = self.get(num)
+            except (ValueError, IndexError, zlib.error):
+                continue
+            if not isinstance(obj, Stream):
+                continue
+            if obj.info.get('/Type') == '/ObjStm':
+                for index, (member, _) in enumerate(self._object_stream_header(obj)):
+                    if member not in self.offsets:
+                        self.compressed[member] = (num, index)
+            elif obj.info.get('/Type') == '/XRef':
+                trailer.update(obj.info)
+        if '/Root' not in trailer:
+            raise ValueError(f"{self.path}: not a PDF file or damaged beyond repair")
+        return trailer
+
+    def _parse_indirect(self, offset):
+        header = OBJECT_HEADER.match(self.data, _skip(self.data, offset))
+        if not header:
+            raise ValueError(f"no object at {offset}")
+        obj, pos = parse_object(self.data, header.end())
+        pos = _skip(self.data, pos)
+        if isinstance(obj, dict) and self.data.startswith(b'stream', pos):
+            pos += 6
+            if self.data.startswith(b'\r\n', pos):
+                pos += 2
+            elif self.data[pos:pos + 1] in (b'\n', b'\r'):
+                pos += 1
+            length = obj.get('/Length')
+            if isinstance(length, Ref):
+                length = self.resolve(length)
+            end = pos + length if isinstance(length, int) else -1
+            if end < 0 or not self.data.startswith(b'endstream', _skip(self.data, end)):
+                end = self.data.index(b'endstream', pos)
+                while end > pos and self.data[end - 1] in b'\r\n':
+                    end -= 1
+            return Stream(obj, self.data[pos:end])
+        return obj
+
+    def _decode(self, stream):
+        filters = stream.info.get('/Filter', [])
+        params = stream.info.get('/DecodeParms') or {}
+        if not isinstance(filters, list):
+            filters, params = [filters], [params]
+        elif not isinstance(params, list):
+            params = [params] * len(filters)
+        data = stream.data
+        for name, param in zip(filters, params):
+            if name not in ('/FlateDecode', '/Fl'):
+                raise ValueError(f"unsupported filter {name}")
+            data = _unpredict(zlib.decompress(data), self.resolve(param) or {})
+        return data
+
+    def _object_stream_header(self, stream):
+        data = self._decode(stream)
+        pairs, pos = [], 0
+        for _ in range(stream.info['/N']):
+            num, pos = parse_object(data, pos)
+            offset, pos = parse_object(data, pos)
+            pairs.append((num, offset))
+        return pairs
+
+    def get(self, num):
+        """Object number num (None if it does not exist)"""
+        if num in self.objects:
+            return self.objects[num]
+        if num in self.offsets:
+            obj = self._parse_indirect(self.offsets[num])
+        elif num in self.compressed:
+            stream_num, index = self.compressed[num]
+            stream = self.get(stream_num)
+            data = self._decode(stream)
+            _, offset = self._object_stream_header(stream)[index]
+            obj, _ = parse_object(data, stream.info['/First'] + offset)
+        else:
+            obj = None
+        self.objects[num] = obj
+        return obj
+
+    def resolve(self, value):
+        """Follow a reference to its object; other values are returned as-is"""
+        seen = set()
+        while isinstance(value, Ref) and value.num not in seen:
+            seen.add(value.num)
+            value = self.get(value.num)
+        return value
+
+    def _walk_pages(self, ref, inherited, seen):
+        if not isinstance(ref, Ref) or ref.num in seen:
+            raise ValueError(f"{self.path}: broken page tree")
+        seen.add(ref.num)
+        node = self.resolve(ref)
+        attributes = dict(inherited)
+        attributes.update((key, node[key]) for key in INHERITED if key in node)
+        if node.get('/Type') == '/Pages' or '/Kids' in node:
+            for kid in self.resolve(node['/Kids']):
+                self._walk_pages(kid, attributes, seen)
+        else:
+            self.pages.append(ref.num)
+            self.inherited[ref.num] = attributes
+
+    def page_info(self, num):
+        """Page dictionary of object num with inherited attributes filled in"""
+        info = dict(self.inherited[num])
+        info.update(self.get(num))
+        return info
+
+
+def count_pages(path):
+    """Number of pages in a PDF file"""
+    return len(PdfDocument(path).pages)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# WRITING
+# ═══════════════════════════════════════════════════════════════════════
+
+def serialize(value):
+    """Bytes for a direct object"""
+    if isinstance(value, Raw):
+        return bytes(value)
+    if isinstance(value, str):
+        return value.encode('latin-1')
+    if isinstance(value, bool):
+        return b'true' if value else b'false'
+    if isinstance(value, int):
+        return b'%d' % value
+    if isinstance(value, float):
+        return (b'%.4f' % value).rstrip(b'0').rstrip(b'.')
+    if isinstance(value, Ref):
+        return b'%d %d R' % value
+    if isinstance(value, list):
+        return b'[' + b' '.join(serialize(item) for item in value) + b']'
+    if isinstance(value, dict):
+        return b'<<' + b''.join(serialize(key) + b' ' + serialize(item) + b' '
+                                for key, item in value.items()) + b'>>'
+    if value is None:
+        return b'null'
+    raise TypeError(f"cannot write {type(value).__name__}")
+
+
+class _Merger:
+    """Collects renumbered objects for the merged file"""
+
+    def __init__(self):
+        self.objects = [None]   # object 0 is the free list head
+        self.pages = []
+        self.page_tree = self.reserve()
+        self.number_font = None
+
+    def reserve(self):
+        self.objects.append(None)
+        return Ref(len(self.objects) - 1, 0)
+
+    def add(self, obj):
+        ref = self.reserve()
+        self.objects[ref.num] = obj
+        return ref
+
+    def copy_pages(self, doc, page_nums):
+        """Copy pages of doc with everything they refer to; returns their refs"""
+        mapping = {num: self.reserve() for num in page_nums}
+        queue = list(page_nums)
+        seen = set(page_nums)
+
+        def renumber(value):
+            if isinstance(value, Ref):
+                if value.num not in mapping:
+                    if doc.get(value.num) is None:
+                        return None
+                    mapping[value.num] = self.reserve()
+                if value.num not in seen:
+                    seen.add(value.num)
+                    queue.append(value.num)
+                return mapping[value.num]
+            if isinstance(value, list):
+                return [renumber(item) for item in value]
+            if isinstance(value, dict):
+                return {key: renumber(item) for key, item in value.items()}
+            if isinstance(value, Stream):
+                return Stream(renumber(value.info), value.data)
+            return value
+
+        while queue:
+            num = queue.pop()
+            if num in page_nums:
+                info = doc.page_info(num)
+                info.pop('/Parent', None)
+                info = renumber(info)
+                info[Name('/Parent')] = self.page_tree
+                self.objects[mapping[num].num] = info
+            else:
+                self.objects[mapping[num].num] = renumber(doc.get(num))
+        return [mapping[num] for num in page_nums]
+
+    def stamp(self, page_ref, text, style):
+        """Draw text in the bottom right corner of a copied page"""
+        page = self.objects[page_ref.num]
+        if self.number_font is None:
+            self.number_font = self.add({Name('/Type'): Name('/Font'), Name('/Subtype'): Name('/Type1'),
+                                         Name('/BaseFont'): Name('/Helvetica'),
+                                         Name('/Encoding'): Name('/WinAnsiEncoding')})
+        x0, y0, x1, _ = [number(v) for v in self._resolve(page.get('/CropBox') or page['/MediaBox'])]
+        scale = (x1 - x0) / SLIDE_WIDTH_PX
+        size = style.size * scale
+        x = x1 - style.right * scale - len(text) * DIGIT_WIDTH * size
+        y = y0 + style.bottom * scale + 0.2 * size
+
+        resources = dict(self._resolve(page.get('/Resources')) or {})
+        fonts = dict(self._resolve(resources.get('/Font')) or {})
+        fonts[Name(NUMBER_FONT)] = self.number_font
+        resources[Name('/Font')] = fonts
+        page[Name('/Resources')] = resources
+
+        contents = self._resolve(page.get('/Contents'))
+        if contents is None:
+            contents = []
+        elif not isinstance(contents, list):
+            contents = [page['/Contents']]
+        stamp = (b'Q q BT %s %s Tf %s g 1 0 0 1 %s %s Tm (%s) Tj ET Q'
+                 % (NUMBER_FONT.encode(), serialize(round(size, 2)), serialize(style.gray),
+                    serialize(round(x, 2)), serialize(round(y, 2)), text.encode('latin-1')))
+        page[Name('/Contents')] = ([self.add(Stream({}, b'q'))] + list(contents)
+                                   + [self.add(Stream({}, stamp))])
+
+    def _resolve(self, value):
+        while isinstance(value, Ref):
+            value = self.objects[value.num]
+        return value
+
+    def write(self, output_path):
+        self.objects[self.page_tree.num] = {
+            Name('/Type'): Name('/Pages'), Name('/Kids'): self.pages, Name('/Count'): len(self.pages)}
+        catalog = self.add({Name('/Type'): Name('/Catalog'), Name('/Pages'): self.page_tree})
+
+        offsets = []
+        with open(output_path, 'wb') as f:
+            f.write(b'%PDF-1.7\n%\xe2\xe3\xcf\xd3\n')
+            position = f.tell()
+            for num, obj in enumerate(self.objects[1:], 1):
+                offsets.append(position)
+                if isinstance(obj, Stream):
+                    info = dict(obj.info)
+                    info[Name('/Length')] = len(obj.data)
+                    body = serialize(info) + b'\nstream\n' + obj.data + b'\nendstream'
+                else:
+                    body = serialize(obj)
+                chunk = b'%d 0 obj\n%s\nendobj\n' % (num, body)
+                f.write(chunk)
+                position += len(chunk)
+            f.write(b'xref\n0 %d\n0000000000 65535 f \n' % len(self.objects))
+            f.write(b''.join(b'%010d 00000 n \n' % offset for offset in offsets))
+            f.write(b'trailer\n' + serialize({Name('/Size'): len(self.objects), Name('/Root'): catalog})
+                    + b'\nstartxref\n%d\n%%%%EOF\n' % position)
+
+
+def merge_pdfs(parts, output_path, numbers=None, number_style=MARP_NUMBER_STYLE):
+    """
+    Write the pages of `parts` to output_path, in order.
+
+    Each part is a PDF path, or (path, pages) where pages is a range or
+    list of 0-based page indexes to take. numbers (optional) has one entry
+    per output page: the text to write as its page number, or None for no
+    number. Raises ValueError for files that cannot be read. Returns the
+    number of pages written.
+    """
+    merger = _Merger()
+    documents = {}
+    for part in parts:
+        path, pages = part if isinstance(part, tuple) else (part, None)
+        if path not in documents:
+            documents[path] = PdfDocument(path)
+        doc = documents[path]
+        page_nums = doc.pages if pages is None else [doc.pages[i] for i in pages]
+        merger.pages.extend(merger.copy_pages(doc, page_nums))
+
+    if numbers is not None:
+        if len(numbers) != len(merger.pages):
+            raise ValueError(f"{len(numbers)} page numbers for {len(merger.pages)} pages")
+        for page_ref, text in zip(merger.pages, numbers):
+            if text:
+                merger.stamp(page_ref, text, number_style)
+
+    merger.write(output_path)
+    return len(merger.pages)
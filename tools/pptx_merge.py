@@ -0,0 +1,302 @@
+"""
+Joins PowerPoint files made from the same reference document into one deck.
+
+03_convert_pptx.py converts a deck module by module and caches each part
+(see convert_markdown() there); merge_presentations() stitches the cached
+parts back together in order. Only the standard library is used: a .pptx
+is a zip of XML parts linked by relationship (.rels) files.
+
+The first file is copied whole. For every further file its slides are
+appended, each with whatever it links to:
+
+    slide layouts, masters, themes   shared - reused from the first file
+                                     when it has the same part
+    images and other media           copied once; identical files are
+                                     stored only once
+    notes slides and anything else   copied under a fresh name
+
+Slide XML is copied byte for byte; only relationship files, the slide list
+in presentation.xml and [Content_Types].xml are rewritten. The files must
+come from the same reference document (as pandoc output with one
+--reference-doc does), otherwise a ValueError is raised rather than
+writing a deck PowerPoint would need to repair.
+"""
+
+import hashlib
+import posixpath
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+
+REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+CT_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+DOC_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+REL_SLIDE = DOC_REL + '/slide'
+REL_NOTES_MASTER = DOC_REL + '/notesMaster'
+
+CONTENT_TYPES = '[Content_Types].xml'
+PRESENTATION = 'ppt/presentation.xml'
+
+# Parts every file made from one reference document has in common
+SHARED_PREFIXES = ('ppt/slideLayouts/', 'ppt/slideMasters/', 'ppt/notesMasters/',
+                   'ppt/handoutMasters/', 'ppt/theme/')
+
+SLIDE_ID_PATTERN = re.compile(r'<p:sldId\b[^>]*\bid="(\d+)"')
+
+
+def rels_path(part):
+    """Relationship part of a part: ppt/slides/slide1.xml -> ppt/slides/_rels/slide1.xml.rels"""
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, '_rels', name + '.rels')
+
+
+def resolve_target(part, target):
+    """Part name a relationship of `part` points to"""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(part), target))
+
+
+def relative_target(part, target_part):
+    """Relationship target from `part` to `target_part`"""
+    return posixpath.relpath(target_part, posixpath.dirname(part))
+
+
+def parse_rels(data):
+    """[(id, type, target, target_mode)] from a .rels part"""
+    root = ET.fromstring(data)
+    return [(rel.get('Id'), rel.get('Type'), rel.get('Target'), rel.get('TargetMode'))
+            for rel in root.iter(f'{{{REL_NS}}}Relationship')]
+
+
+def _attr(value):
+    return (value.replace('&', '&amp;').replace('"', '&quot;')
+            .replace('<', '&lt;').replace('>', '&gt;'))
+
+
+def build_rels(rels):
+    """Serialise [(id, type, target, target_mode)] as a .rels part"""
+    items = []
+    for rel_id, rel_type, target, mode in rels:
+        extra = f' TargetMode="{_attr(mode)}"' if mode else ''
+        items.append(f'<Relationship Id="{_attr(rel_id)}" Type="{_attr(rel_type)}" '
+                     f'Target="{_attr(target)}"{extra}/>')
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<Relationships xmlns="{REL_NS}">{"".join(items)}</Relationships>').encode('utf-8')
+
+
+def parse_content_types(data):
+    """(defaults {extension: type}, overrides {part: type}) from [Content_Types].xml"""
+    root = ET.fromstring(data)
+    defaults = {item.get('Extension').lower(): item.get('ContentType')
+                for item in root.iter(f'{{{CT_NS}}}Default')}
+    overrides = {item.get('PartName').lstrip('/'): item.get('ContentType')
+                 for item in root.iter(f'{{{CT_NS}}}Override')}
+    return defaults, overrides
+
+
+def build_content_types(defaults, overrides):
+    items = [f'<Default Extension="{_attr(ext)}" ContentType="{_attr(kind)}"/>'
+             for ext, kind in defaults.items()]
+    items += [f'<Override PartName="/{_attr(part)}" ContentType="{_attr(kind)}"/>'
+              for part, kind in overrides.items()]
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<Types xmlns="{CT_NS}">{"".join(items)}</Types>').encode('utf-8')
+
+
+def slide_order(parts):
+    """Slide part names in presentation order"""
+    rels = {rel_id: resolve_target(PRESENTATION, target)
+            for rel_id, rel_type, target, _ in parse_rels(parts[rels_path(PRESENTATION)])
+            if rel_type == REL_SLIDE}
+    presentation = parts[PRESENTATION].decode('utf-8')
+    return [rels[rel_id] for rel_id in re.findall(r'<p:sldId\b[^>]*\br:id="([^"]+)"', presentation)
+            if rel_id in rels]
+
+
+def _read_package(path):
+    """({part name: bytes}, [ZipInfo in file order]) of a .pptx"""
+    with zipfile.ZipFile(path) as package:
+        infos = package.infolist()
+        return {info.filename: package.read(info) for info in infos}, infos
+
+
+def _split_name(part):
+    """ppt/media/image12.png -> ('ppt/media/image', '.png')"""
+    stem, ext = posixpath.splitext(part)
+    return stem.rstrip('0123456789'), ext
+
+
+class _Merger:
+    """Output package being assembled; see merge_presentations()"""
+
+    def __init__(self, parts, infos):
+        self.parts = parts
+        self.order = [info.filename for info in infos]
+        self.compression = {info.filename: info.compress_type for info in infos}
+        self.defaults, self.overrides = parse_content_types(parts[CONTENT_TYPES])
+        self.presentation_rels = parse_rels(parts[rels_path(PRESENTATION)])
+        self.presentation = parts[PRESENTATION].decode('utf-8')
+        self.new_slides = []  # (slide id, relationship id)
+        self.names = set()
+        self.counters = {}
+        for name in parts:
+            self._reserve(name)
+        self.media = {hashlib.sha256(data).hexdigest(): name
+                      for name, data in parts.items() if name.startswith('ppt/media/')}
+        ids = [int(value) for value in SLIDE_ID_PATTERN.findall(self.presentation)]
+        self.next_slide_id = max(ids, default=255) + 1
+
+    def _reserve(self, name):
+        """Mark `name` as used, so fresh_name() never hands it out"""
+        self.names.add(name)
+        stem, ext = _split_name(name)
+        number = posixpath.splitext(name)[0][len(stem):]
+        if number:
+            key = (stem, ext)
+            self.counters[key] = max(self.counters.get(key, 0), int(number))
+
+    def fresh_name(self, part):
+        """Unused part name like `part`: ppt/slides/slide3.xml -> ppt/slides/slide105.xml"""
+        stem, ext = _split_name(part)
+        number = self.counters.get((stem, ext), 0) + 1
+        name = f"{stem}{number}{ext}"
+        while name in self.names:
+            number += 1
+            name = f"{stem}{number}{ext}"
+        self.counters[(stem, ext)] = number
+        return name
+
+    def next_rel_id(self):
+        used = {int(rel_id[3:]) for rel_id, _, _, _ in self.presentation_rels
+                if rel_id.startswith('rId') and rel_id[3:].isdigit()}
+        return f"rId{max(used, default=0) + 1}"
+
+    def add_part(self, name, data, content_type, compression):
+        self.parts[name] = data
+        self.order.append(name)
+        self.compression[name] = compression
+        ext = posixpath.splitext(name)[1].lstrip('.').lower()
+        if self.defaults.get(ext) != content_type:
+            self.overrides[name] = content_type
+
+    def append(self, path):
+        """Append every slide of the .pptx at path"""
+        source, infos = _read_package(path)
+        compression = {info.filename: info.compress_type for info in infos}
+        src_defaults, src_overrides = parse_content_types(source[CONTENT_TYPES])
+        mapped = {}
+
+        def content_type(part):
+            ext = posixpath.splitext(part)[1].lstrip('.').lower()
+            kind = src_overrides.get(part) or src_defaults.get(ext)
+            if kind is None:
+                raise ValueError(f"{path}: no content type for {part}")
+            return kind
+
+        def copy(part):
+            """Name of `part` in the output, copying it (and what it links to) if needed"""
+            if part in mapped:
+                return mapped[part]
+            if part not in source:
+                raise ValueError(f"{path}: missing part {part}")
+            data = source[part]
+
+            if part.startswith(SHARED_PREFIXES) and part in self.parts:
+                if self.parts[part] == data:
+                    mapped[part] = part
+                    return part
+                if not part.startswith('ppt/theme/'):
+                    raise ValueError(f"{path}: {part} differs - were these made from "
+                                     f"the same reference document?")
+                # A theme only a copied notes master uses: copied below
+            if part.startswith('ppt/media/'):
+                digest = hashlib.sha256(data).hexdigest()
+                if digest in self.media:
+                    mapped[part] = self.media[digest]
+                    return mapped[part]
+
+            name = part if part not in self.names else self.fresh_name(part)
+            self._reserve(name)
+            mapped[part] = name
+            if part.startswith('ppt/media/'):
+                self.media[hashlib.sha256(data).hexdigest()] = name
+            if part.startswith('ppt/notesMasters/'):
+                self._register_notes_master(name)
+
+            rels_name = rels_path(part)
+            if rels_name in source:
+                rels = []
+                for rel_id, rel_type, target, mode in parse_rels(source[rels_name]):
+                    if mode != 'External':
+                        target = relative_target(name, copy(resolve_target(part, target)))
+                    rels.append((rel_id, rel_type, target, mode))
+                self.add_part(rels_path(name), build_rels(rels),
+                              content_type(rels_name), compression[rels_name])
+            self.add_part(name, data, content_type(part), compression[part])
+            return name
+
+        for slide in slide_order(source):
+            name = copy(slide)
+            rel_id = self.next_rel_id()
+            self.presentation_rels.append(
+                (rel_id, REL_SLIDE, relative_target(PRESENTATION, name), None))
+            self.new_slides.append((self.next_slide_id, rel_id))
+            self.next_slide_id += 1
+
+    def _register_notes_master(self, name):
+        """Link a notes master copied from a later file into presentation.xml"""
+        rel_id = self.next_rel_id()
+        self.presentation_rels.append(
+            (rel_id, REL_NOTES_MASTER, relative_target(PRESENTATION, name), None))
+        entry = f'<p:notesMasterIdLst><p:notesMasterId r:id="{rel_id}"/></p:notesMasterIdLst>'
+        self.presentation, count = re.subn(r'(</p:sldMasterIdLst>)', r'\1' + entry,
+                                           self.presentation, count=1)
+        if not count:
+            raise ValueError("presentation.xml has no slide master list")
+
+    def write(self, output_path):
+        """Write the merged package"""
+        if self.new_slides:
+            entries = ''.join(f'<p:sldId id="{slide_id}" r:id="{rel_id}"/>'
+                              for slide_id, rel_id in self.new_slides)
+            if '</p:sldIdLst>' in self.presentation:
+                self.presentation = self.presentation.replace('</p:sldIdLst>', entries + '</p:sldIdLst>', 1)
+            elif '<p:sldIdLst/>' in self.presentation:
+                self.presentation = self.presentation.replace('<p:sldIdLst/>', f'<p:sldIdLst>{entries}</p:sldIdLst>', 1)
+            else:
+                # No slides yet: the list goes after the master lists
+                self.presentation, count = re.subn(
+                    r'(</p:sldMasterIdLst>(?:<p:notesMasterIdLst>.*?</p:notesMasterIdLst>)?'
+                    r'(?:<p:handoutMasterIdLst>.*?</p:handoutMasterIdLst>)?)',
+                    lambda m: m.group(1) + f'<p:sldIdLst>{entries}</p:sldIdLst>',
+                    self.presentation, count=1)
+                if not count:
+                    raise ValueError("presentation.xml has no slide master list")
+
+        self.parts[PRESENTATION] = self.presentation.encode('utf-8')
+        self.parts[rels_path(PRESENTATION)] = build_rels(self.presentation_rels)
+        self.parts[CONTENT_TYPES] = build_content_types(self.defaults, self.overrides)
+
+        names = [CONTENT_TYPES] + [name for name in self.order if name != CONTENT_TYPES]
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as package:
+            for name in names:
+                package.writestr(name, self.parts[name],
+                                 compress_type=self.compression.get(name, zipfile.ZIP_DEFLATED))
+
+
+def merge_presentations(paths, output_path):
+    """
+    Write the slides of every .pptx in paths, in order, to output_path.
+
+    Returns the number of slides written. Raises ValueError if the files
+    do not share a reference document, or zipfile.BadZipFile / KeyError
+    for a file that is not a presentation.
+    """
+    if not paths:
+        raise ValueError("nothing to merge")
+    merger = _Merger(*_read_package(paths[0]))
+    for path in paths[1:]:
+        merger.append(path)
+    merger.write(output_path)
+    return len(slide_order(merger.parts))
@@ -0,0 +1,1134 @@
+"""
+Writes PowerPoint files straight from a built deck's markdown, without pandoc.
+
+03_convert_pptx.py uses this as its native engine. The deck is read the way
+Marp reads it: every `---` line starts a new slide, and a heading that
+opens a slide is its title. Supported on a slide:
+
+    headings, paragraphs     **bold**, *italic*, `code`, [links](url), <br>
+    bullet and numbered      nested by indentation
+    lists
+    tables                   e.g. the agenda tables from generate_agenda_slide()
+    images                   PNG, JPEG and GIF, as ![alt](path) or <img src=...>;
+                             Marp's w:/h: size keywords and `bg` backgrounds;
+                             <img style="position: absolute; ..."> logos
+    block quotes, code       plain styled text
+    <!-- _class: lead -->    teal title slide
+
+Everything is styled with the FASTR theme (fastr-theme.css): teal #0f706d
+titles over a lime rule, navy bold, green italics, light-blue table
+headers, Segoe UI. Text is sized to fit: each slide gets the largest body
+size (18pt down to 10pt) at which its estimated height fits, so decks
+need no manual font fixes after conversion. Content is centred
+vertically, as Marp does.
+
+Only the standard library is used: the package is a zip of XML parts.
+The output only depends on the input, so the same deck gives the same
+bytes. A 200-slide deck takes well under a second plus the time to copy
+its images.
+"""
+
+import html
+import os
+import re
+import struct
+import zipfile
+from collections import namedtuple
+from urllib.parse import unquote
+from xml.sax.saxutils import escape
+
+# ═══════════════════════════════════════════════════════════════════════
+# THEME
+# ═══════════════════════════════════════════════════════════════════════
+# Colours from fastr-theme.css; titles use the FASTR teal
+
+TEAL = '0F706D'
+DEEP_GREEN = '09544F'
+GREEN = '1F9A9C'
+LIME = 'D0CB17'
+NAVY = '21568C'
+BLUE = '1A90C0'
+LIGHT_BLUE = 'CAE6E9'
+PURPLE = '7A1F6E'
+GOLD = 'D8A822'
+TEXT = '2C3E50'
+MUTED = '7F8C8D'
+BORDER = 'DEE2E6'
+LIGHT_BG = 'F8F9FA'
+WHITE = 'FFFFFF'
+
+BODY_FONT = 'Segoe UI'
+CODE_FONT = 'Courier New'
+
+# Marp's 1280x720 px slide; 9525 EMU per px (96 dpi), 12700 EMU per point
+EMU_PER_PX = 9525
+EMU_PER_PT = 12700
+SLIDE_WIDTH = 1280 * EMU_PER_PX
+SLIDE_HEIGHT = 720 * EMU_PER_PX
+MARGIN_X = 70 * EMU_PER_PX
+MARGIN_TOP = 40 * EMU_PER_PX
+MARGIN_BOTTOM = 50 * EMU_PER_PX
+CONTENT_WIDTH = SLIDE_WIDTH - 2 * MARGIN_X
+BLOCK_GAP = 12 * EMU_PER_PX
+
+TITLE_SIZES = {1: 32, 2: 28, 3: 24}   # points, by heading level (4+ use 22)
+BODY_SIZES = (18, 17, 16, 15, 14, 13, 12, 11, 10)
+HEADING_SCALE = {1: 1.5, 2: 1.3, 3: 1.15}
+HEADING_COLORS = {1: DEEP_GREEN, 2: NAVY, 3: PURPLE}
+MIN_IMAGE_HEIGHT = 90 * EMU_PER_PX
+
+# Text measurement: average glyph width as a fraction of the font size
+CHAR_WIDTH = 0.5
+BOLD_CHAR_WIDTH = 0.55
+LINE_HEIGHT = 1.2
+
+IMAGE_TYPES = {'png': 'image/png', 'jpeg': 'image/jpeg', 'gif': 'image/gif'}
+
+# ═══════════════════════════════════════════════════════════════════════
+# MARKDOWN → SLIDES
+# ═══════════════════════════════════════════════════════════════════════
+
+# Inline text run; link is a URL or None
+Run = namedtuple('Run', ['text', 'bold', 'italic', 'code', 'link'])
+Run.__new__.__defaults__ = (False, False, False, None)
+
+# One slide: title runs (or None), its heading level, body blocks, lead class
+Slide = namedtuple('Slide', ['title', 'level', 'blocks', 'lead'])
+
+# Body blocks:
+#   ('heading', level, runs)      ('paragraph', runs)      ('quote', runs)
+#   ('list', [(depth, number or None, runs)])              ('code', text)
+#   ('table', header_cells, rows)  - cells are lists of runs
+#   ('image', src, alt, width_px, height_px, position)  - position is a dict
+#                                    of absolute px offsets, 'bg', or None
+
+COMMENT_PATTERN = re.compile(r'<!--(.*?)-->', re.S)
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+LIST_PATTERN = re.compile(r'^(\s*)([-*+]|\d+[.)])\s+(.*)$')
+TABLE_RULE_PATTERN = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+HTML_IMAGE_PATTERN = re.compile(r'<img\b([^>]*)>', re.I)
+ATTRIBUTE_PATTERN = re.compile(r'(\w[\w-]*)\s*=\s*("([^"]*)"|\'([^\']*)\')')
+INLINE_PATTERN = re.compile(
+    r'(?P<escape>\\[\\`*_{}\[\]()#+\-.!|<>])'
+    r'|(?P<code>`+)(?P<code_text>.+?)(?P=code)'
+    r'|(?P<link>\[(?P<link_text>[^\]]+)\]\((?P<url>[^)\s]+)(?:\s+"[^"]*")?\))'
+    r'|(?P<br><br\s*/?>)'
+    r'|(?P<tag></?[a-zA-Z][^>]*>)'
+    r'|(?P<strong>\*\*|__)'
+    r'|(?P<em>\*|_)'
+)
+
+
+def split_slides(markdown):
+    """Slide texts of a deck: frontmatter dropped, split on `---` lines"""
+    lines = markdown.split('\n')
+    if lines and lines[0].strip() == '---':
+        for i in range(1, len(lines)):
+            if lines[i].strip() == '---':
+                lines = lines[i + 1:]
+                break
+
+    slides = [[]]
+    fence = None
+    for line in lines:
+        stripped = line.strip()
+        if fence:
+            if stripped.startswith(fence):
+                fence = None
+        elif stripped.startswith(('```', '~~~')):
+            fence = stripped[:3]
+        elif stripped == '---':
+            slides.append([])
+            continue
+        slides[-1].append(line)
+    return ['\n'.join(slide) for slide in slides if '\n'.join(slide).strip()]
+
+
+def _delimiter_ok(text, start, end):
+    """`_` and `__` only toggle emphasis at word boundaries (not in snake_case)"""
+    before = text[start - 1] if start > 0 else ' '
+    after = text[end] if end < len(text) else ' '
+    return not (before.isalnum() and after.isalnum())
+
+
+def parse_inline(text, link=None):
+    """Runs of a line of markdown text"""
+    tokens = list(INLINE_PATTERN.finditer(text))
+    # An emphasis marker without a partner is literal text
+    counts = {}
+    for match in tokens:
+        kind = match.lastgroup
+        if kind in ('strong', 'em') and (match.group(kind)[0] == '*' or
+                                         _delimiter_ok(text, match.start(), match.end())):
+            counts[match.group(kind)] = counts.get(match.group(kind), 0) + 1
+    unpaired = {marker for marker, count in counts.items() if count % 2}
+
+    runs = []
+    bold = italic = False
+    position = 0
+
+    def add(value, **style):
+        if value:
+            runs.append(Run(html.unescape(value), style.get('bold', bold), style.get('italic', italic),
+                            style.get('code', False), link))
+
+    for match in tokens:
+        kind = match.lastgroup
+        add(text[position:match.start()])
+        position = match.end()
+        if kind == 'escape':
+            add(match.group(kind)[1])
+        elif kind == 'code':
+            add(match.group('code_text'), code=True)
+        elif kind == 'link':
+            for run in parse_inline(match.group('link_text'), link=match.group('url')):
+                runs.append(run._replace(bold=run.bold or bold, italic=run.italic or italic))
+        elif kind == 'br':
+            add('\n')
+        elif kind == 'tag':
+            continue
+        else:
+            marker = match.group(kind)
+            if marker in unpaired or (marker[0] == '_' and
+                                      not _delimiter_ok(text, match.start(), match.end())):
+                add(marker)
+            elif kind == 'strong':
+                bold = not bold
+            else:
+                italic = not italic
+    add(text[position:])
+    return runs
+
+
+def runs_text(runs):
+    return ''.join(run.text for run in runs)
+
+
+def _attributes(tag_body):
+    return {name.lower(): first if first is not None else second
+            for name, _, first, second in ATTRIBUTE_PATTERN.findall(tag_body)}
+
+
+def _px(value):
+    match = re.match(r'\s*(-?[\d.]+)\s*(px)?\s*$', value or '')
+    return float(match.group(1)) if match else None
+
+
+def html_image(tag_body):
+    """('image', ...) block for an <img> tag"""
+    attributes = _attributes(tag_body)
+    style = dict(
+        (key.strip().lower(), value.strip())
+        for key, _, value in (item.partition(':') for item in attributes.get('style', '').split(';'))
+        if key.strip()
+    )
+    width = _px(attributes.get('width')) or _px(style.get('width'))
+    height = _px(attributes.get('height')) or _px(style.get('height'))
+    position = None
+    if style.get('position') == 'absolute':
+        position = {side: _px(style.get(side)) for side in ('top', 'left', 'right', 'bottom')}
+    return ('image', attributes.get('src', ''), attributes.get('alt', ''), width, height, position)
+
+
+def markdown_image(alt, src):
+    """('image', ...) block for ![alt](src), reading Marp's size keywords in alt"""
+    width = height = None
+    position = None
+    words = []
+    for word in alt.split():
+        key, _, value = word.partition(':')
+        if key in ('w', 'width') and _px(value):
+            width = _px(value)
+        elif key in ('h', 'height') and _px(value):
+            height = _px(value)
+        elif word == 'bg':
+            position = 'bg'
+        else:
+            words.append(word)
+    return ('image', src, ' '.join(words), width, height, position)
+
+
+def parse_slide(text):
+    """Slide from the markdown between two slide breaks"""
+    lead = False
+    for comment in COMMENT_PATTERN.findall(text):
+        if re.search(r'\b_?class\s*:\s*.*\blead\b', comment):
+            lead = True
+    lines = COMMENT_PATTERN.sub('', text).split('\n')
+
+    blocks = []
+    paragraph = []
+
+    def flush():
+        if paragraph:
+            joined = ' '.join(line.strip() for line in paragraph)
+            joined = re.sub(r'\s*<br\s*/?>\s*', '<br>', joined)
+            add_text('paragraph', joined)
+            paragraph.clear()
+
+    def add_text(kind, joined):
+        """Paragraph or quote text, with any images in it pulled out as blocks"""
+        images = []
+        for match in HTML_IMAGE_PATTERN.finditer(joined):
+            images.append(html_image(match.group(1)))
+        joined = HTML_IMAGE_PATTERN.sub('', joined)
+        for match in IMAGE_PATTERN.finditer(joined):
+            images.append(markdown_image(match.group(1), match.group(2)))
+        joined = IMAGE_PATTERN.sub('', joined).strip()
+        if joined:
+            blocks.append((kind, parse_inline(joined)))
+        blocks.extend(images)
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if not stripped:
+            flush()
+            i += 1
+            continue
+
+        if stripped.startswith(('```', '~~~')):
+            flush()
+            fence = stripped[:3]
+            code = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith(fence):
+                code.append(lines[i])
+                i += 1
+            blocks.append(('code', '\n'.join(code)))
+            i += 1
+            continue
+
+        heading = HEADING_PATTERN.match(stripped)
+        if heading and not line.startswith('    '):
+            flush()
+            blocks.append(('heading', len(heading.group(1)), parse_inline(heading.group(2))))
+            i += 1
+            continue
+
+        if stripped.startswith('|') and i + 1 < len(lines) and TABLE_RULE_PATTERN.match(lines[i + 1]):
+            flush()
+            header = _table_cells(stripped)
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith('|'):
+                rows.append(_table_cells(lines[i].strip()))
+                i += 1
+            blocks.append(('table', header, rows))
+            continue
+
+        item = LIST_PATTERN.match(line)
+        # Like CommonMark, a list interrupts a paragraph only with a bullet or "1."
+        if item and (not paragraph or item.group(2)[0] in '-*+' or item.group(2)[:-1] == '1'):
+            flush()
+            items, i = _parse_list(lines, i)
+            blocks.append(('list', items))
+            continue
+
+        if stripped.startswith('>'):
+            flush()
+            quote = []
+            while i < len(lines) and lines[i].strip().startswith('>'):
+                quote.append(lines[i].strip()[1:].strip())
+                i += 1
+            add_text('quote', ' '.join(quote))
+            continue
+
+        paragraph.append(line)
+        i += 1
+    flush()
+
+    title, level = None, 0
+    if blocks and blocks[0][0] == 'heading':
+        _, level, title = blocks.pop(0)
+    return Slide(title, level, blocks, lead)
+
+
+def _table_cells(line):
+    cells = line.strip().strip('|').split('|')
+    return [parse_inline(cell.strip()) for cell in cells]
+
+
+def _parse_list(lines, i):
+    """List items from lines[i]; returns (items, index after the list)"""
+    items = []
+    indents = []
+    while i < len(lines):
+        match = LIST_PATTERN.match(lines[i])
+        if match:
+            indent = len(match.group(1).expandtabs(4))
+            while indents and indent < indents[-1]:
+                indents.pop()
+            if not indents or indent > indents[-1]:
+                indents.append(indent)
+            marker = match.group(2)
+            number = int(marker[:-1]) if marker[0].isdigit() else None
+            items.append([len(indents) - 1, number, match.group(3).strip()])
+            i += 1
+        elif lines[i].strip() and lines[i][:1].isspace() and items:
+            items[-1][2] += ' ' + lines[i].strip()   # continuation line
+            i += 1
+        elif not lines[i].strip():
+            # A blank line ends the list unless another item follows
+            j = i
+            while j < len(lines) and not lines[j].strip():
+                j += 1
+            if j < len(lines) and (LIST_PATTERN.match(lines[j]) or lines[j][:1].isspace()):
+                i = j
+            else:
+                break
+        else:
+            break
+    return [(depth, number, parse_inline(text)) for depth, number, text in items], i
+
+
+def parse_deck(markdown):
+    """Slides of a built deck"""
+    return [parse_slide(text) for text in split_slides(markdown)]
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# IMAGES
+# ═══════════════════════════════════════════════════════════════════════
+
+def image_info(data):
+    """(kind, width_px, height_px) of PNG, JPEG or GIF bytes, or None"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and len(data) >= 24:
+        width, height = struct.unpack('>II', data[16:24])
+        return 'png', width, height
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        width, height = struct.unpack('<HH', data[6:10])
+        return 'gif', width, height
+    if data[:2] == b'\xff\xd8':
+        position = 2
+        while position + 9 < len(data):
+            if data[position] != 0xFF:
+                position += 1
+                continue
+            marker = data[position + 1]
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+                position += 1 if marker == 0xFF else 2
+                continue
+            length = struct.unpack('>H', data[position + 2:position + 4])[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>HH', data[position + 5:position + 9])
+                return 'jpeg', width, height
+            position += 2 + length
+    return None
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# LAYOUT
+# ═══════════════════════════════════════════════════════════════════════
+
+def wrapped_lines(text, width, size, bold=False):
+    """Estimated number of lines `text` wraps to in `width` EMU at `size` pt"""
+    char_width = size * EMU_PER_PT * (BOLD_CHAR_WIDTH if bold else CHAR_WIDTH)
+    per_line = max(1, int(width / char_width))
+    lines = 0
+    for part in text.split('\n'):
+        used = 0
+        count = 1
+        for word in part.split():
+            needed = len(word) if used == 0 else used + 1 + len(word)
+            if needed <= per_line:
+                used = needed
+            else:
+                count += 1 + (len(word) - 1) // per_line
+                used = len(word) % per_line or per_line
+        lines += count
+    return lines
+
+
+def line_height(size):
+    return int(size * LINE_HEIGHT * EMU_PER_PT)
+
+
+def _runs_bold(runs):
+    return bool(runs) and all(run.bold for run in runs if run.text.strip())
+
+
+def paragraph_height(kind, size, runs, width, level=0):
+    """Height of one paragraph of a text block, with its spacing"""
+    if kind == 'heading':
+        size = size * HEADING_SCALE.get(level, 1.0)
+        return wrapped_lines(runs_text(runs), width, size, bold=True) * line_height(size) + int(size * 0.4 * EMU_PER_PT)
+    return (wrapped_lines(runs_text(runs), width, size, _runs_bold(runs)) * line_height(size)
+            + int(size * 0.5 * EMU_PER_PT))
+
+
+def text_block_height(block, size, width=CONTENT_WIDTH):
+    kind = block[0]
+    if kind == 'heading':
+        return paragraph_height('heading', size, block[2], width, block[1])
+    if kind == 'list':
+        return sum(paragraph_height('item', size, runs, width - list_indent(depth) - 18 * EMU_PER_PX)
+                   for depth, _, runs in block[1])
+    if kind == 'code':
+        code_size = size * 0.85
+        return (sum(wrapped_lines(line, width, code_size) for line in block[1].split('\n'))
+                * line_height(code_size) + int(size * 0.5 * EMU_PER_PT))
+    return paragraph_height(kind, size, block[1], width - (24 * EMU_PER_PX if kind == 'quote' else 0))
+
+
+def list_indent(depth):
+    return (26 + 30 * depth) * EMU_PER_PX
+
+
+def table_columns(header, rows, width=CONTENT_WIDTH):
+    """Column widths proportional to the longest text in each column"""
+    count = max([len(header)] + [len(row) for row in rows])
+    longest = [1] * count
+    for row in [header] + rows:
+        for i, cell in enumerate(row):
+            longest[i] = max(longest[i], min(60, len(runs_text(cell))))
+    total = sum(longest)
+    shares = [max(0.12, length / total) for length in longest]
+    scale = sum(shares)
+    widths = [int(width * share / scale) for share in shares]
+    widths[-1] += width - sum(widths)
+    return widths
+
+
+CELL_MARGIN_X = 8 * EMU_PER_PX
+CELL_MARGIN_Y = 4 * EMU_PER_PX
+
+
+def table_row_height(cells, widths, size, bold=False):
+    lines = max([wrapped_lines(runs_text(cell), max(1, width - 2 * CELL_MARGIN_X), size,
+                               bold or _runs_bold(cell))
+                 for cell, width in zip(cells, widths)] or [1])
+    return lines * line_height(size) + 2 * CELL_MARGIN_Y
+
+
+def table_size(size):
+    return max(9, size - 2)
+
+
+def table_height(block, size):
+    _, header, rows = block
+    widths = table_columns(header, rows)
+    cell_size = table_size(size)
+    return (table_row_height(header, widths, cell_size, bold=True)
+            + sum(table_row_height(row, widths, cell_size) for row in rows))
+
+
+def title_size(slide):
+    return TITLE_SIZES.get(slide.level, 22)
+
+
+def title_height(slide, size):
+    return wrapped_lines(runs_text(slide.title), CONTENT_WIDTH, size, bold=True) * line_height(size)
+
+
+def group_blocks(blocks):
+    """Consecutive text blocks become one text box; tables and images stand alone"""
+    groups = []
+    for block in blocks:
+        if block[0] in ('table', 'image'):
+            groups.append(block)
+        elif groups and groups[-1][0] == 'text':
+            groups[-1][1].append(block)
+        else:
+            groups.append(('text', [block]))
+    return groups
+
+
+def fit_body(groups, images, available):
+    """
+    Largest body size at which the slide's content fits.
+
+    Returns (size, heights): heights has the height of every group, images
+    sharing the room text and tables leave.
+    """
+    for size in BODY_SIZES:
+        heights = []
+        for group in groups:
+            if group[0] == 'text':
+                heights.append(sum(text_block_height(block, size) for block in group[1]))
+            elif group[0] == 'table':
+                heights.append(table_height(group, size))
+            else:
+                heights.append(None)
+        fixed = sum(height for height in heights if height is not None) + BLOCK_GAP * (len(groups) - 1)
+        room = available - fixed
+        if room >= MIN_IMAGE_HEIGHT * len(images) or size == BODY_SIZES[-1]:
+            break
+
+    share = max(MIN_IMAGE_HEIGHT, room // len(images)) if images else 0
+    for i, group in enumerate(groups):
+        if heights[i] is None:
+            heights[i] = min(share, images[id(group)][1])
+    return size, heights
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# SLIDE XML
+# ═══════════════════════════════════════════════════════════════════════
+
+NAMESPACES = ('xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+              'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+              'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"')
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+GROUP_PROPERTIES = ('<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+                    '<p:grpSpPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/>'
+                    '<a:chOff x="0" y="0"/><a:chExt cx="0" cy="0"/></a:xfrm></p:grpSpPr>')
+
+
+def _fill(color):
+    return f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+
+
+def _xfrm(x, y, cx, cy):
+    return f'<a:xfrm><a:off x="{int(x)}" y="{int(y)}"/><a:ext cx="{int(cx)}" cy="{int(cy)}"/></a:xfrm>'
+
+
+class SlideWriter:
+    """Shapes and relationships of one slide being written"""
+
+    def __init__(self, package, lead=False):
+        self.package = package
+        self.lead = lead
+        self.shapes = []
+        self.rels = [('rId1', REL + '/slideLayout', '../slideLayouts/slideLayout1.xml', None)]
+        self.links = {}
+        self.next_shape_id = 2
+
+    def shape_id(self):
+        self.next_shape_id += 1
+        return self.next_shape_id - 1
+
+    def rel(self, rel_type, target, mode=None):
+        rel_id = f"rId{len(self.rels) + 1}"
+        self.rels.append((rel_id, rel_type, target, mode))
+        return rel_id
+
+    def link_id(self, url):
+        if url not in self.links:
+            self.links[url] = self.rel(REL + '/hyperlink', url, 'External')
+        return self.links[url]
+
+    # Text ---------------------------------------------------------------
+
+    def run_xml(self, run, size, color, bold=False, italic=False):
+        attributes = f' lang="en-US" sz="{int(round(size * 100))}"'
+        if bold or run.bold:
+            attributes += ' b="1"'
+        if italic or run.italic:
+            attributes += ' i="1"'
+        if run.link:
+            attributes += ' u="sng"'
+        if self.lead:
+            run_color = WHITE
+        elif run.link:
+            run_color = BLUE
+        elif run.code:
+            run_color = NAVY
+        elif run.bold and not bold:
+            run_color = NAVY
+        elif run.italic and not italic:
+            run_color = GREEN
+        else:
+            run_color = color
+        properties = f'<a:rPr{attributes} dirty="0">{_fill(run_color)}'
+        if run.code:
+            properties += f'<a:latin typeface="{CODE_FONT}"/>'
+        if run.link:
+            properties += f'<a:hlinkClick r:id="{self.link_id(run.link)}"/>'
+        properties += '</a:rPr>'
+
+        parts = []
+        for i, line in enumerate(run.text.split('\n')):
+            if i:
+                parts.append(f'<a:br><a:rPr lang="en-US" sz="{int(round(size * 100))}"/></a:br>')
+            if line:
+                parts.append(f'<a:r>{properties}<a:t>{escape(line)}</a:t></a:r>')
+        return ''.join(parts)
+
+    def paragraph_xml(self, runs, size, color, properties='', bold=False, italic=False):
+        body = ''.join(self.run_xml(run, size, color, bold, italic) for run in runs)
+        end = f'<a:endParaRPr lang="en-US" sz="{int(round(size * 100))}"/>'
+        return f'<a:p>{properties}{body}{end}</a:p>'
+
+    def text_paragraphs(self, block, size, align):
+        kind = block[0]
+        color = WHITE if self.lead else TEXT
+        spacing = f'<a:spcAft><a:spcPts val="{int(size * 50)}"/></a:spcAft>'
+        if kind == 'heading':
+            level = block[1]
+            heading_size = size * HEADING_SCALE.get(level, 1.0)
+            return self.paragraph_xml(
+                block[2], heading_size, HEADING_COLORS.get(level, TEXT),
+                f'<a:pPr algn="{align}"><a:spcAft><a:spcPts val="{int(size * 40)}"/></a:spcAft></a:pPr>',
+                bold=True)
+        if kind == 'list':
+            paragraphs = []
+            for depth, number, runs in block[1]:
+                indent = list_indent(depth)
+                if number is None:
+                    bullet = (f'<a:buClr><a:srgbClr val="{WHITE if self.lead else LIME}"/></a:buClr>'
+                              '<a:buFont typeface="Arial"/><a:buChar char="&#8226;"/>')
+                else:
+                    bullet = (f'<a:buClr><a:srgbClr val="{WHITE if self.lead else BLUE}"/></a:buClr>'
+                              f'<a:buFont typeface="+mj-lt"/><a:buAutoNum type="arabicPeriod" startAt="{number}"/>')
+                properties = (f'<a:pPr marL="{indent}" indent="-{18 * EMU_PER_PX}">'
+                              f'<a:spcAft><a:spcPts val="{int(size * 50)}"/></a:spcAft>{bullet}</a:pPr>')
+                paragraphs.append(self.paragraph_xml(runs, size, color, properties))
+            return ''.join(paragraphs)
+        if kind == 'code':
+            code_size = size * 0.85
+            runs = [Run(line, code=True) for line in block[1].split('\n')]
+            body = '\n'.join(run.text for run in runs)
+            return self.paragraph_xml([Run(body, code=True)], code_size, NAVY,
+                                      f'<a:pPr>{spacing}</a:pPr>')
+        if kind == 'quote':
+            return self.paragraph_xml(
+                block[1], size, color,
+                f'<a:pPr marL="{24 * EMU_PER_PX}">{spacing}</a:pPr>', italic=True)
+        return self.paragraph_xml(block[1], size, color, f'<a:pPr algn="{align}">{spacing}</a:pPr>')
+
+    def add_text_box(self, blocks, x, y, cx, cy, size, align='l'):
+        shape_id = self.shape_id()
+        paragraphs = ''.join(self.text_paragraphs(block, size, align) for block in blocks)
+        quote = any(block[0] == 'quote' for block in blocks) and len(blocks) == 1
+        fill = f'{_fill("FBF6E9")}<a:ln w="38100">{_fill(GOLD)}</a:ln>' if quote and not self.lead else '<a:noFill/>'
+        self.shapes.append(
+            f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="Text {shape_id}"/>'
+            f'<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr>{_xfrm(x, y, cx, cy)}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>{fill}</p:spPr>'
+            f'<p:txBody><a:bodyPr wrap="square" lIns="0" tIns="0" rIns="0" bIns="0" anchor="t">'
+            f'<a:noAutofit/></a:bodyPr><a:lstStyle/>{paragraphs}</p:txBody></p:sp>')
+
+    def add_title(self, runs, x, y, cx, cy, size, align='l'):
+        shape_id = self.shape_id()
+        color = WHITE if self.lead else TEAL
+        paragraph = self.paragraph_xml(runs, size, color, f'<a:pPr algn="{align}"/>', bold=True)
+        self.shapes.append(
+            f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="Title {shape_id}"/>'
+            f'<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr><p:nvPr><p:ph type="title"/></p:nvPr></p:nvSpPr>'
+            f'<p:spPr>{_xfrm(x, y, cx, cy)}</p:spPr>'
+            f'<p:txBody><a:bodyPr wrap="square" lIns="0" tIns="0" rIns="0" bIns="0" anchor="b">'
+            f'<a:noAutofit/></a:bodyPr><a:lstStyle/>{paragraph}</p:txBody></p:sp>')
+
+    def add_rule(self, x, y, cx, color, weight_px=4):
+        shape_id = self.shape_id()
+        self.shapes.append(
+            f'<p:cxnSp><p:nvCxnSpPr><p:cNvPr id="{shape_id}" name="Rule {shape_id}"/>'
+            f'<p:cNvCxnSpPr/><p:nvPr/></p:nvCxnSpPr>'
+            f'<p:spPr>{_xfrm(x, y, cx, 0)}<a:prstGeom prst="line"><a:avLst/></a:prstGeom>'
+            f'<a:ln w="{weight_px * EMU_PER_PX}">{_fill(color)}</a:ln></p:spPr></p:cxnSp>')
+
+    def add_slide_number(self):
+        shape_id = self.shape_id()
+        size = 10
+        color = WHITE if self.lead else MUTED
+        width = 120 * EMU_PER_PX
+        height = 24 * EMU_PER_PX
+        self.shapes.append(
+            f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="Slide Number {shape_id}"/>'
+            f'<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr>{_xfrm(SLIDE_WIDTH - MARGIN_X - width, SLIDE_HEIGHT - 16 * EMU_PER_PX - height, width, height)}'
+            f'<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+            f'<p:txBody><a:bodyPr wrap="none" lIns="0" tIns="0" rIns="0" bIns="0" anchor="b"><a:noAutofit/></a:bodyPr>'
+            f'<a:lstStyle/><a:p><a:pPr algn="r"/><a:fld id="{{B6F15528-21DE-4FAA-801E-634DDDAF4B2B}}" type="slidenum">'
+            f'<a:rPr lang="en-US" sz="{size * 100}">{_fill(color)}</a:rPr><a:t>‹#›</a:t></a:fld></a:p></p:txBody></p:sp>')
+
+    # Tables -------------------------------------------------------------
+
+    def add_table(self, block, x, y, size):
+        _, header, rows = block
+        widths = table_columns(header, rows)
+        cell_size = table_size(size)
+        count = len(widths)
+        grid = ''.join(f'<a:gridCol w="{width}"/>' for width in widths)
+
+        def cell(runs, width, is_header):
+            color = NAVY if is_header else TEXT
+            paragraph = self.paragraph_xml(runs, cell_size, color, bold=is_header)
+            if is_header:
+                borders = f'<a:lnB w="{2 * EMU_PER_PX}">{_fill(BLUE)}</a:lnB>'
+                fill = _fill(LIGHT_BLUE)
+            else:
+                borders = f'<a:lnB w="{EMU_PER_PX}">{_fill(BORDER)}</a:lnB>'
+                fill = '<a:noFill/>'
+            no_line = '<a:noFill/>'
+            return (f'<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{paragraph}</a:txBody>'
+                    f'<a:tcPr marL="{CELL_MARGIN_X}" marR="{CELL_MARGIN_X}" marT="{CELL_MARGIN_Y}" '
+                    f'marB="{CELL_MARGIN_Y}" anchor="ctr">'
+                    f'<a:lnL w="0">{no_line}</a:lnL><a:lnR w="0">{no_line}</a:lnR>'
+                    f'<a:lnT w="0">{no_line}</a:lnT>{borders}{fill}</a:tcPr></a:tc>')
+
+        def row(cells, is_header):
+            cells = list(cells[:count]) + [[] for _ in range(count - len(cells))]
+            height = table_row_height(cells, widths, cell_size, bold=is_header)
+            return height, (f'<a:tr h="{height}">'
+                            + ''.join(cell(runs, width, is_header) for runs, width in zip(cells, widths))
+                            + '</a:tr>')
+
+        total = 0
+        xml_rows = []
+        for cells, is_header in [(header, True)] + [(cells, False) for cells in rows]:
+            height, xml = row(cells, is_header)
+            total += height
+            xml_rows.append(xml)
+
+        shape_id = self.shape_id()
+        self.shapes.append(
+            f'<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="{shape_id}" name="Table {shape_id}"/>'
+            f'<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/>'
+            f'</p:nvGraphicFramePr><p:xfrm><a:off x="{int(x)}" y="{int(y)}"/>'
+            f'<a:ext cx="{sum(widths)}" cy="{total}"/></p:xfrm>'
+            f'<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+            f'<a:tbl><a:tblPr firstRow="1"/><a:tblGrid>{grid}</a:tblGrid>{"".join(xml_rows)}</a:tbl>'
+            f'</a:graphicData></a:graphic></p:graphicFrame>')
+
+    # Pictures -----------------------------------------------------------
+
+    def add_picture(self, media, x, y, cx, cy, description=''):
+        rel_id = self.rel(REL + '/image', f'../media/{media}')
+        shape_id = self.shape_id()
+        self.shapes.append(
+            f'<p:pic><p:nvPicPr><p:cNvPr id="{shape_id}" name="Picture {shape_id}" '
+            f'descr="{escape(description, {chr(34): "&quot;"})}"/>'
+            f'<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+            f'<p:blipFill><a:blip r:embed="{rel_id}"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+            f'<p:spPr>{_xfrm(x, y, cx, cy)}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>')
+
+    def xml(self):
+        background = ''
+        if self.lead:
+            background = f'<p:bg><p:bgPr>{_fill(TEAL)}<a:effectLst/></p:bgPr></p:bg>'
+        return (f'{XML_HEADER}<p:sld {NAMESPACES}><p:cSld>{background}<p:spTree>{GROUP_PROPERTIES}'
+                f'{"".join(self.shapes)}</p:spTree></p:cSld>'
+                f'<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>')
+
+
+def fit_picture(width_px, height_px, max_width, max_height):
+    """(cx, cy) of an image scaled down, never up, to fit the box"""
+    cx = width_px * EMU_PER_PX
+    cy = height_px * EMU_PER_PX
+    scale = min(1.0, max_width / cx, max_height / cy)
+    return int(cx * scale), int(cy * scale)
+
+
+def layout_slide(slide, package, paginate=True):
+    """SlideWriter for one parsed slide"""
+    writer = SlideWriter(package, lead=slide.lead)
+
+    # Images: load them first, so the layout knows their sizes
+    images = {}
+    floating = []
+    blocks = []
+    for block in slide.blocks:
+        if block[0] != 'image':
+            blocks.append(block)
+            continue
+        media = package.add_image(block[1])
+        if media is None:
+            continue
+        name, width_px, height_px = media
+        _, _, alt, want_width, want_height, position = block
+        if want_width and want_height:
+            width_px, height_px = want_width, want_height
+        elif want_width:
+            width_px, height_px = want_width, height_px * want_width / width_px
+        elif want_height:
+            width_px, height_px = width_px * want_height / height_px, want_height
+        if position:
+            floating.append((name, width_px, height_px, alt, position))
+        else:
+            blocks.append(block)
+            images[id(block)] = (name, fit_picture(width_px, height_px, CONTENT_WIDTH, SLIDE_HEIGHT)[1],
+                                 width_px, height_px, alt)
+
+    for name, width_px, height_px, alt, position in floating:
+        if position == 'bg':
+            writer.add_picture(name, 0, 0, SLIDE_WIDTH, SLIDE_HEIGHT, alt)
+            continue
+        cx, cy = width_px * EMU_PER_PX, height_px * EMU_PER_PX
+        if position.get('left') is not None:
+            x = position['left'] * EMU_PER_PX
+        elif position.get('right') is not None:
+            x = SLIDE_WIDTH - position['right'] * EMU_PER_PX - cx
+        else:
+            x = (SLIDE_WIDTH - cx) / 2
+        if position.get('top') is not None:
+            y = position['top'] * EMU_PER_PX
+        elif position.get('bottom') is not None:
+            y = SLIDE_HEIGHT - position['bottom'] * EMU_PER_PX - cy
+        else:
+            y = (SLIDE_HEIGHT - cy) / 2
+        writer.add_picture(name, x, y, cx, cy, alt)
+
+    # Vertical stack: title, rule, body groups - centred like Marp
+    available = SLIDE_HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
+    heading_size = title_size(slide)
+    heading_height = 0
+    if slide.title:
+        while heading_size > 18 and wrapped_lines(runs_text(slide.title), CONTENT_WIDTH, heading_size, True) > 2:
+            heading_size -= 2
+        heading_height = title_height(slide, heading_size) + 14 * EMU_PER_PX
+        available -= heading_height + BLOCK_GAP
+
+    groups = group_blocks(blocks)
+    size, heights = fit_body(groups, images, available) if groups else (BODY_SIZES[0], [])
+    body_height = sum(heights) + BLOCK_GAP * max(0, len(groups) - 1)
+    total = heading_height + (BLOCK_GAP if slide.title and groups else 0) + body_height
+    y = MARGIN_TOP + max(0, (SLIDE_HEIGHT - MARGIN_TOP - MARGIN_BOTTOM - total) // 2)
+    align = 'ctr' if slide.lead else 'l'
+
+    if slide.title:
+        text_height = heading_height - 14 * EMU_PER_PX
+        writer.add_title(slide.title, MARGIN_X, y, CONTENT_WIDTH, text_height, heading_size, align)
+        rule_color = LIME if slide.level <= 1 or slide.lead else (BLUE if slide.level == 2 else LIGHT_BLUE)
+        writer.add_rule(MARGIN_X, y + text_height + 6 * EMU_PER_PX, CONTENT_WIDTH, rule_color,
+                        4 if slide.level <= 1 else 3)
+        y += heading_height + BLOCK_GAP
+
+    for group, height in zip(groups, heights):
+        if group[0] == 'text':
+            writer.add_text_box(group[1], MARGIN_X, y, CONTENT_WIDTH, height, size, align)
+        elif group[0] == 'table':
+            writer.add_table(group, MARGIN_X, y, size)
+        else:
+            name, _, width_px, height_px, alt = images[id(group)]
+            cx, cy = fit_picture(width_px, height_px, CONTENT_WIDTH, height)
+            writer.add_picture(name, MARGIN_X + (CONTENT_WIDTH - cx) // 2, y, cx, cy, alt)
+            height = cy
+        y += height + BLOCK_GAP
+
+    if paginate:
+        writer.add_slide_number()
+    return writer
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# PACKAGE
+# ═══════════════════════════════════════════════════════════════════════
+
+CT_BASE = 'application/vnd.openxmlformats-officedocument.presentationml'
+# Fixed timestamp so the same deck always gives the same bytes
+ZIP_DATE = (2024, 1, 1, 0, 0, 0)
+
+
+def _rels_xml(rels):
+    items = ''.join(
+        f'<Relationship Id="{rel_id}" Type="{rel_type}" Target="{escape(target, {chr(34): "&quot;"})}"'
+        + (f' TargetMode="{mode}"' if mode else '') + '/>'
+        for rel_id, rel_type, target, mode in rels)
+    return (f'{XML_HEADER}<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'{items}</Relationships>')
+
+
+def theme_xml():
+    colors = (('dk1', TEXT), ('lt1', WHITE), ('dk2', DEEP_GREEN), ('lt2', LIGHT_BG),
+              ('accent1', TEAL), ('accent2', NAVY), ('accent3', LIME), ('accent4', BLUE),
+              ('accent5', GOLD), ('accent6', PURPLE), ('hlink', BLUE), ('folHlink', PURPLE))
+    scheme = ''.join(f'<a:{name}><a:srgbClr val="{value}"/></a:{name}>' for name, value in colors)
+    fonts = f'<a:latin typeface="{BODY_FONT}"/><a:ea typeface=""/><a:cs typeface=""/>'
+    fill = '<a:solidFill><a:schemeClr val="phClr"/></a:solidFill>'
+    line = f'<a:ln w="9525">{fill}</a:ln>'
+    effect = '<a:effectStyle><a:effectLst/></a:effectStyle>'
+    return (f'{XML_HEADER}<a:theme xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" name="FASTR">'
+            f'<a:themeElements><a:clrScheme name="FASTR">{scheme}</a:clrScheme>'
+            f'<a:fontScheme name="FASTR"><a:majorFont>{fonts}</a:majorFont><a:minorFont>{fonts}</a:minorFont></a:fontScheme>'
+            f'<a:fmtScheme name="FASTR"><a:fillStyleLst>{fill * 3}</a:fillStyleLst>'
+            f'<a:lnStyleLst>{line * 3}</a:lnStyleLst><a:effectStyleLst>{effect * 3}</a:effectStyleLst>'
+            f'<a:bgFillStyleLst>{fill * 3}</a:bgFillStyleLst></a:fmtScheme></a:themeElements>'
+            f'<a:objectDefaults/><a:extraClrSchemeLst/></a:theme>')
+
+
+def _level_styles(size, color):
+    return ''.join(
+        f'<a:lvl{level}pPr><a:defRPr sz="{size * 100}">{color}<a:latin typeface="+mn-lt"/></a:defRPr></a:lvl{level}pPr>'
+        for level in range(1, 10))
+
+
+def master_xml():
+    title_color = '<a:solidFill><a:schemeClr val="accent1"/></a:solidFill>'
+    text_color = '<a:solidFill><a:schemeClr val="tx1"/></a:solidFill>'
+    title_box = _xfrm(MARGIN_X, MARGIN_TOP, CONTENT_WIDTH, 60 * EMU_PER_PX)
+    body_box = _xfrm(MARGIN_X, MARGIN_TOP + 80 * EMU_PER_PX, CONTENT_WIDTH,
+                     SLIDE_HEIGHT - MARGIN_TOP - MARGIN_BOTTOM - 80 * EMU_PER_PX)
+    return (f'{XML_HEADER}<p:sldMaster {NAMESPACES}><p:cSld><p:bg><p:bgRef idx="1001"><a:schemeClr val="bg1"/>'
+            f'</p:bgRef></p:bg><p:spTree>{GROUP_PROPERTIES}'
+            f'<p:sp><p:nvSpPr><p:cNvPr id="2" name="Title Placeholder"/><p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+            f'<p:nvPr><p:ph type="title"/></p:nvPr></p:nvSpPr><p:spPr>{title_box}'
+            f'<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr>'
+            f'<p:txBody><a:bodyPr anchor="b"><a:normAutofit/></a:bodyPr><a:lstStyle/><a:p><a:r><a:rPr lang="en-US"/>'
+            f'<a:t>Title</a:t></a:r></a:p></p:txBody></p:sp>'
+            f'<p:sp><p:nvSpPr><p:cNvPr id="3" name="Text Placeholder"/><p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+            f'<p:nvPr><p:ph type="body" idx="1"/></p:nvPr></p:nvSpPr><p:spPr>{body_box}'
+            f'<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr>'
+            f'<p:txBody><a:bodyPr><a:normAutofit/></a:bodyPr><a:lstStyle/><a:p><a:r><a:rPr lang="en-US"/>'
+            f'<a:t>Text</a:t></a:r></a:p></p:txBody></p:sp>'
+            f'</p:spTree></p:cSld>'
+            f'<p:clrMap bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" accent1="accent1" accent2="accent2" '
+            f'accent3="accent3" accent4="accent4" accent5="accent5" accent6="accent6" hlink="hlink" folHlink="folHlink"/>'
+            f'<p:sldLayoutIdLst><p:sldLayoutId id="2147483649" r:id="rId1"/></p:sldLayoutIdLst>'
+            f'<p:txStyles><p:titleStyle>'
+            f'<a:lvl1pPr><a:defRPr sz="{TITLE_SIZES[2] * 100}" b="1">{title_color}<a:latin typeface="+mj-lt"/></a:defRPr></a:lvl1pPr>'
+            f'</p:titleStyle><p:bodyStyle>{_level_styles(BODY_SIZES[0], text_color)}</p:bodyStyle>'
+            f'<p:otherStyle>{_level_styles(BODY_SIZES[0], text_color)}</p:otherStyle></p:txStyles></p:sldMaster>')
+
+
+def layout_xml():
+    return (f'{XML_HEADER}<p:sldLayout {NAMESPACES} type="titleOnly" preserve="1"><p:cSld name="Title Only">'
+            f'<p:spTree>{GROUP_PROPERTIES}'
+            f'<p:sp><p:nvSpPr><p:cNvPr id="2" name="Title"/><p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+            f'<p:nvPr><p:ph type="title"/></p:nvPr></p:nvSpPr><p:spPr/>'
+            f'<p:txBody><a:bodyPr/><a:lstStyle/><a:p><a:endParaRPr lang="en-US"/></a:p></p:txBody></p:sp>'
+            f'</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sldLayout>')
+
+
+class Package:
+    """Media and slides of the presentation being written"""
+
+    def __init__(self, resolve_image=None, missing=None):
+        self.resolve_image = resolve_image or (lambda src: src if os.path.isfile(src) else None)
+        self.missing = [] if missing is None else missing
+        self.media = {}      # src -> (name, width_px, height_px) or None
+        self.by_path = {}    # resolved path -> (name, width_px, height_px)
+        self.files = []      # (name, data)
+
+    def add_image(self, src):
+        """Media name and pixel size for an image source, or None if unusable"""
+        if src in self.media:
+            return self.media[src]
+        media = None
+        path = self.resolve_image(src)
+        if path is None and '%' in src:
+            path = self.resolve_image(unquote(src))
+        if path in self.by_path:
+            media = self.by_path[path]
+        elif path:
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                data = b''
+            info = image_info(data)
+            if info:
+                kind, width, height = info
+                name = f"image{len(self.files) + 1}.{kind}"
+                self.files.append((name, data))
+                media = (name, width, height)
+                self.by_path[path] = media
+        if media is None:
+            self.missing.append(src)
+        self.media[src] = media
+        return media
+
+
+# Result of write_presentation(): slide count, embedded images, image sources skipped
+WriteResult = namedtuple('WriteResult', ['slides', 'images', 'skipped'])
+
+
+def write_presentation(markdown, output_path, resolve_image=None, missing=None, paginate=None):
+    """
+    Write a built deck's markdown to output_path as a .pptx.
+
+    resolve_image(src) returns the file an image reference points to, or
+    None; images that cannot be found or are not PNG, JPEG or GIF (e.g.
+    SVG) are skipped and their sources added to `missing`. Page numbers
+    follow the deck's `paginate:` setting unless paginate is given.
+    Returns a WriteResult.
+    """
+    if paginate is None:
+        paginate = bool(re.match(r'---\s*\n(?:.*\n)*?paginate:\s*true\s*\n', markdown))
+    missing = [] if missing is None else missing
+    package = Package(resolve_image, missing)
+    slides = [layout_slide(slide, package, paginate) for slide in parse_deck(markdown)]
+
+    first_title = next((runs_text(slide.title) for slide in parse_deck(markdown)[:1] if slide.title), '')
+    parts = [('[Content_Types].xml', None)]  # written last, once every part is known
+    overrides = {
+        '/ppt/presentation.xml': f'{CT_BASE}.presentation.main+xml',
+        '/ppt/slideMasters/slideMaster1.xml': f'{CT_BASE}.slideMaster+xml',
+        '/ppt/slideLayouts/slideLayout1.xml': f'{CT_BASE}.slideLayout+xml',
+        '/ppt/theme/theme1.xml': 'application/vnd.openxmlformats-officedocument.theme+xml',
+        '/ppt/presProps.xml': f'{CT_BASE}.presProps+xml',
+        '/ppt/viewProps.xml': f'{CT_BASE}.viewProps+xml',
+        '/ppt/tableStyles.xml': f'{CT_BASE}.tableStyles+xml',
+        '/docProps/core.xml': 'application/vnd.openxmlformats-package.core-properties+xml',
+        '/docProps/app.xml': 'application/vnd.openxmlformats-officedocument.extended-properties+xml',
+    }
+
+    parts.append(('_rels/.rels', _rels_xml([
+        ('rId1', REL + '/officeDocument', 'ppt/presentation.xml', None),
+        ('rId2', 'http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties',
+         'docProps/core.xml', None),
+        ('rId3', REL + '/extended-properties', 'docProps/app.xml', None),
+    ])))
+    parts.append(('docProps/core.xml',
+                  f'{XML_HEADER}<cp:coreProperties '
+                  f'xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+                  f'xmlns:dc="http://purl.org/dc/elements/1.1/">'
+                  f'<dc:title>{escape(first_title)}</dc:title><dc:creator>FASTR</dc:creator></cp:coreProperties>'))
+    parts.append(('docProps/app.xml',
+                  f'{XML_HEADER}<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+                  f'<Application>FASTR</Application><Slides>{len(slides)}</Slides></Properties>'))
+
+    slide_ids = ''.join(f'<p:sldId id="{256 + i}" r:id="rId{i + 2}"/>' for i in range(len(slides)))
+    parts.append(('ppt/presentation.xml',
+                  f'{XML_HEADER}<p:presentation {NAMESPACES} saveSubsetFonts="1">'
+                  f'<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/></p:sldMasterIdLst>'
+                  f'<p:sldIdLst>{slide_ids}</p:sldIdLst>'
+                  f'<p:sldSz cx="{SLIDE_WIDTH}" cy="{SLIDE_HEIGHT}"/><p:notesSz cx="6858000" cy="9144000"/>'
+                  f'</p:presentation>'))
+    count = len(slides)
+    presentation_rels = [('rId1', REL + '/slideMaster', 'slideMasters/slideMaster1.xml', None)]
+    presentation_rels += [(f'rId{i + 2}', REL + '/slide', f'slides/slide{i + 1}.xml', None) for i in range(count)]
+    presentation_rels += [
+        (f'rId{count + 2}', REL + '/presProps', 'presProps.xml', None),
+        (f'rId{count + 3}', REL + '/viewProps', 'viewProps.xml', None),
+        (f'rId{count + 4}', REL + '/theme', 'theme/theme1.xml', None),
+        (f'rId{count + 5}', REL + '/tableStyles', 'tableStyles.xml', None),
+    ]
+    parts.append(('ppt/_rels/presentation.xml.rels', _rels_xml(presentation_rels)))
+    parts.append(('ppt/presProps.xml', f'{XML_HEADER}<p:presentationPr {NAMESPACES}/>'))
+    parts.append(('ppt/viewProps.xml',
+                  f'{XML_HEADER}<p:viewPr {NAMESPACES}><p:normalViewPr/><p:gridSpacing cx="76200" cy="76200"/></p:viewPr>'))
+    parts.append(('ppt/tableStyles.xml',
+                  f'{XML_HEADER}<a:tblStyleLst xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+                  f'def="{{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}}"/>'))
+    parts.append(('ppt/theme/theme1.xml', theme_xml()))
+    parts.append(('ppt/slideMasters/slideMaster1.xml', master_xml()))
+    parts.append(('ppt/slideMasters/_rels/slideMaster1.xml.rels', _rels_xml([
+        ('rId1', REL + '/slideLayout', '../slideLayouts/slideLayout1.xml', None),
+        ('rId2', REL + '/theme', '../theme/theme1.xml', None),
+    ])))
+    parts.append(('ppt/slideLayouts/slideLayout1.xml', layout_xml()))
+    parts.append(('ppt/slideLayouts/_rels/slideLayout1.xml.rels', _rels_xml([
+        ('rId1', REL + '/slideMaster', '../slideMasters/slideMaster1.xml', None),
+    ])))
+    for i, writer in enumerate(slides, 1):
+        parts.append((f'ppt/slides/slide{i}.xml', writer.xml()))
+        parts.append((f'ppt/slides/_rels/slide{i}.xml.rels', _rels_xml(writer.rels)))
+        overrides[f'/ppt/slides/slide{i}.xml'] = f'{CT_BASE}.slide+xml'
+
+    defaults = {'rels': 'application/vnd.openxmlformats-package.relationships+xml', 'xml': 'application/xml'}
+    for name, _ in package.files:
+        kind = name.rsplit('.', 1)[1]
+        defaults[kind] = IMAGE_TYPES[kind]
+    content_types = (f'{XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                     + ''.join(f'<Default Extension="{ext}" ContentType="{kind}"/>' for ext, kind in defaults.items())
+                     + ''.join(f'<Override PartName="{part}" ContentType="{kind}"/>' for part, kind in overrides.items())
+                     + '</Types>')
+    parts[0] = ('[Content_Types].xml', content_types)
+
+    with zipfile.ZipFile(output_path, 'w') as package_zip:
+        for name, text in parts:
+            info = zipfile.ZipInfo(name, ZIP_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            package_zip.writestr(info, text.encode('utf-8'))
+        for name, data in package.files:
+            # Images are compressed already
+            package_zip.writestr(zipfile.ZipInfo(f'ppt/media/{name}', ZIP_DATE), data)
+
+    return WriteResult(len(slides), len(package.files), list(missing))
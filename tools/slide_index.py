@@ -0,0 +1,219 @@
+"""
+Slide index shared by the FASTR tools.
+
+tools/00_extract_slides.py writes core_content/slide_index.json after every
+extraction. The workshop wizard (01) and deck builder (02) load it with a
+single file read instead of walking core_content/ or keeping their own copy
+of the module/topic registry.
+
+Index layout:
+
+    {
+      "version": 2,
+      "modules": {
+        "4": {"folder": "m4_data_quality_assessment", "topics": ["m4_1", ...]}
+      },
+      "slides": {
+        "m4_1": {
+          "module": 4, "topic": 1,
+          "file": "m4_data_quality_assessment/m4_1_approach_to_dqa.md",
+          "source": "04_data_quality_assessment.md", "lines": [1487, 1520],
+          "hash": "<sha256 of the core_content file>",
+          "slide_count": 5, "word_count": 312, "table_count": 1,
+          "images": ["../../resources/..."], "variables": ["COUNTRY"]
+        }
+      }
+    }
+
+`file` is relative to core_content/. `source` and `lines` point back at the
+marker block in methodology/ (both are null if the index was rebuilt from
+core_content/ alone). The counts feed the duration estimates in
+durations.py.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+INDEX_FILENAME = 'slide_index.json'
+INDEX_VERSION = 2
+
+TOPIC_ID_PATTERN = re.compile(r'^m(\d+)_(\d+)$')
+IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\(([^)]+)\)')
+VARIABLE_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.DOTALL)
+WORD_PATTERN = re.compile(r'[^\W_]+(?:[\'’-][^\W_]+)*')
+# Markdown table header separator (|---|:---:|) or an HTML table
+TABLE_PATTERN = re.compile(r'^(?=[^\n]*\|)(?=[^\n]*-{3})[ \t|:-]+$|<table\b', re.MULTILINE | re.IGNORECASE)
+
+RECORD_KEYS = ['file', 'source', 'lines', 'hash',
+               'slide_count', 'word_count', 'table_count', 'images', 'variables']
+
+
+def topic_sort_key(topic_id):
+    """Sort key that orders m6_10 after m6_9."""
+    match = TOPIC_ID_PATTERN.match(topic_id)
+    if match:
+        return (int(match.group(1)), int(match.group(2)), topic_id)
+    return (float('inf'), float('inf'), topic_id)
+
+
+def split_frontmatter(content):
+    """Return (frontmatter, body) for markdown with optional --- frontmatter."""
+    if content.startswith('---'):
+        end = content.find('\n---', 3)
+        if end != -1:
+            body_start = content.find('\n', end + 4)
+            body_start = len(content) if body_start == -1 else body_start + 1
+            return content[:body_start], content[body_start:]
+    return '', content
+
+
+def analyze_slide_content(content):
+    """
+    Compute the per-topic statistics stored in the index.
+
+    Returns a dict with slide_count (number of --- separated slides),
+    word_count (words of visible text), table_count (markdown or HTML
+    tables), images (image paths in order of appearance) and variables
+    (sorted {{VARIABLE}} names).
+    """
+    _, body = split_frontmatter(content)
+
+    separators = sum(1 for line in body.splitlines() if line.strip() == '---')
+    slide_count = separators + 1 if body.strip() else 0
+    if body.rstrip().endswith('---'):
+        slide_count -= 1
+
+    visible = COMMENT_PATTERN.sub(' ', body)
+    visible = IMAGE_PATTERN.sub(' ', visible)
+
+    return {
+        'slide_count': max(slide_count, 0),
+        'word_count': len(WORD_PATTERN.findall(visible)),
+        'table_count': len(TABLE_PATTERN.findall(COMMENT_PATTERN.sub(' ', body))),
+        'images': IMAGE_PATTERN.findall(body),
+        'variables': sorted(set(VARIABLE_PATTERN.findall(body))),
+    }
+
+
+def build_index(slides):
+    """
+    Build an index dict from a mapping of slide ID -> slide record.
+
+    Each record needs at least 'file' (path relative to core_content/); the
+    module registry is derived from the records.
+    """
+    modules = {}
+    ordered = {}
+
+    for topic_id in sorted(slides, key=topic_sort_key):
+        match = TOPIC_ID_PATTERN.match(topic_id)
+        if not match:
+            continue
+        module_num, topic_num = int(match.group(1)), int(match.group(2))
+
+        # Fixed key order keeps the written file stable between runs
+        record = {'module': module_num, 'topic': topic_num}
+        for key in RECORD_KEYS:
+            record[key] = slides[topic_id].get(key)
+        ordered[topic_id] = record
+
+        folder = record['file'].split('/', 1)[0]
+        module = modules.setdefault(str(module_num), {'folder': folder, 'topics': []})
+        module['topics'].append(topic_id)
+
+    sorted_modules = {key: modules[key] for key in sorted(modules, key=int)}
+    return {'version': INDEX_VERSION, 'modules': sorted_modules, 'slides': ordered}
+
+
+def get_index_path(base_dir):
+    """Location of the slide index."""
+    return os.path.join(base_dir, 'core_content', INDEX_FILENAME)
+
+
+def write_index(base_dir, index):
+    """
+    Write the slide index if its content changed.
+
+    Returns True if the file was written.
+    """
+    index_path = get_index_path(base_dir)
+    text = json.dumps(index, indent=2, sort_keys=False, ensure_ascii=False) + '\n'
+
+    if os.path.exists(index_path):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    temp_path = index_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, index_path)
+    return True
+
+
+def scan_core_content(base_dir):
+    """
+    Rebuild an index by walking core_content/.
+
+    Fallback for when slide_index.json is missing or outdated; source and
+    line information is not available this way. If two files share a topic
+    ID, the first in sorted order wins.
+    """
+    core_content_dir = os.path.join(base_dir, 'core_content')
+    slides = {}
+
+    if not os.path.isdir(core_content_dir):
+        return build_index(slides)
+
+    for folder in sorted(os.listdir(core_content_dir)):
+        folder_path = os.path.join(core_content_dir, folder)
+        if not os.path.isdir(folder_path) or not re.match(r'^m\d+_', folder):
+            continue
+        for filename in sorted(os.listdir(folder_path)):
+            match = re.match(r'^(m\d+_\d+)_.*\.md$', filename)
+            if not match or match.group(1) in slides:
+                continue
+            with open(os.path.join(folder_path, filename), 'r', encoding='utf-8') as f:
+                content = f.read()
+            record = {
+                'file': f"{folder}/{filename}",
+                'source': None,
+                'lines': None,
+                'hash': hashlib.sha256(content.encode('utf-8')).hexdigest(),
+            }
+            record.update(analyze_slide_content(content))
+            slides[match.group(1)] = record
+
+    return build_index(slides)
+
+
+def load_slide_index(base_dir):
+    """
+    Load core_content/slide_index.json.
+
+    Falls back to scanning core_content/ (and says so) if the index is
+    missing, unreadable or from a different index version.
+    """
+    try:
+        with open(get_index_path(base_dir), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') == INDEX_VERSION:
+            return index
+    except (OSError, ValueError):
+        pass
+
+    print("   Note: core_content/slide_index.json missing or outdated - scanning core_content/")
+    print("         (run: python3 tools/00_extract_slides.py)")
+    return scan_core_content(base_dir)
+
+
+def module_topics(index, module_num):
+    """Return [(topic_id, file)] for a module, in topic order."""
+    module = index['modules'].get(str(module_num))
+    if not module:
+        return []
+    return [(topic_id, index['slides'][topic_id]['file']) for topic_id in module['topics']]
@@ -0,0 +1,179 @@
+"""
+Lays out the timeline of one workshop day for the agenda.
+
+A day is built from two kinds of input:
+
+    fixed events   Things that happen at a set time: breaks, lunch,
+                   opening ceremony, guest speakers, group photo, the
+                   day wrap-up (Fixed)
+    blocks         Content in teaching order (Block). A splittable block
+                   (a module) may be cut around fixed events. An
+                   unsplittable one (a country presentation) waits for
+                   the next free gap it fits in
+
+layout_day() walks the free gaps between fixed events once, placing
+blocks in order and filling what is left of each gap with exercises
+(except gaps that end by `fill_from`, which stay open).
+Nothing is dropped silently. Content that does not fit before the end of
+the day, and fixed events that overlap, are reported in the result.
+A day takes microseconds to lay out, so the wizard can try as many
+what-if schedules as it likes.
+
+Times are minutes from midnight.
+"""
+
+from collections import namedtuple
+
+# Fixed event: starts at `start`, lasts `duration`; kind 'break' shows in
+# italics on the agenda, anything else is a regular session
+Fixed = namedtuple('Fixed', ['start', 'duration', 'session', 'kind'])
+Fixed.__new__.__defaults__ = ('event',)
+
+# Content block; `module` (e.g. 'm3') is written to the agenda entry
+Block = namedtuple('Block', ['session', 'duration', 'splittable', 'module'])
+Block.__new__.__defaults__ = (True, None)
+
+FILLER_SESSION = 'Practical Exercises'
+LAST_FILLER_SESSION = 'Group Work & Discussion'
+
+
+class Layout(namedtuple('Layout', ['entries', 'unplaced', 'conflicts'])):
+    """
+    Result of layout_day().
+
+    entries    agenda entries in time order ({'time', 'session', 'duration',
+               and 'module' or 'type': 'break' where they apply})
+    unplaced   (session, minutes) of content that did not fit
+    conflicts  messages about fixed events that overlap or run late
+    """
+
+    __slots__ = ()
+
+    @property
+    def feasible(self):
+        return not self.unplaced and not self.conflicts
+
+    @property
+    def overflow(self):
+        """Minutes of content that did not fit"""
+        return sum(minutes for _, minutes in self.unplaced)
+
+    def problems(self):
+        """Human-readable list of everything that makes the day infeasible"""
+        messages = list(self.conflicts)
+        for session, minutes in self.unplaced:
+            messages.append(f"{minutes} min of '{session}' does not fit before the end of the day")
+        return messages
+
+
+def format_time(minutes):
+    """Format minutes from midnight to time string."""
+    hours = minutes // 60
+    mins = minutes % 60
+    period = 'AM' if hours < 12 else 'PM'
+    if hours == 0:
+        hours = 12
+    elif hours > 12:
+        hours -= 12
+    return f"{hours}:{mins:02d} {period}"
+
+
+def _entry(start, duration, session, module=None, kind=None):
+    entry = {
+        'time': f"{format_time(start)} - {format_time(start + duration)}",
+        'session': session,
+    }
+    if module:
+        entry['module'] = module
+    if kind == 'break':
+        entry['type'] = 'break'
+    entry['duration'] = duration
+    return entry
+
+
+def layout_day(blocks, fixed, day_start, day_end,
+               filler=FILLER_SESSION, last_filler=LAST_FILLER_SESSION, fill_from=None):
+    """
+    Place content blocks around fixed events between day_start and day_end.
+
+    Fixed events may lie outside that window (an opening ceremony before
+    the day starts); content is only placed inside it. Blocks keep their
+    order. An unsplittable block that fits in no remaining gap is reported
+    as unplaced and the blocks after it carry on. Time left in a gap that
+    ends at or before fill_from is left open instead of filled.
+
+    Returns a Layout.
+    """
+    events = sorted(fixed, key=lambda event: event.start)
+    conflicts = []
+
+    # One sorted pass: fixed entries, and the free gaps between them
+    segments = []  # (start, end, None) for a gap, (start, end, Fixed) for an event
+    cursor = day_start
+    busy_until, busy_with = None, None
+    for event in events:
+        end = event.start + event.duration
+        if busy_until is not None and event.start < busy_until:
+            conflicts.append(f"'{event.session}' at {format_time(event.start)} overlaps "
+                             f"'{busy_with}' (until {format_time(busy_until)})")
+        if end > day_end and event.start < day_end:
+            conflicts.append(f"'{event.session}' runs past the end of the day ({format_time(day_end)})")
+        if event.start > cursor and cursor < day_end:
+            segments.append((cursor, min(event.start, day_end), None))
+        segments.append((event.start, end, event))
+        if busy_until is None or end > busy_until:
+            busy_until, busy_with = end, event.session
+        cursor = max(cursor, end)
+    if cursor < day_end:
+        segments.append((cursor, day_end, None))
+
+    # Longest gap from each segment on, to spot unsplittable blocks that can never fit
+    longest_after = [0] * (len(segments) + 1)
+    for i in range(len(segments) - 1, -1, -1):
+        start, end, event = segments[i]
+        longest_after[i] = max(longest_after[i + 1], end - start if event is None else 0)
+    last_gap = max((i for i, (_, _, event) in enumerate(segments) if event is None), default=-1)
+
+    entries = []
+    unplaced = []
+    queue = list(blocks)
+    position = 0
+    remaining = queue[0].duration if queue else 0
+
+    for i, (start, end, event) in enumerate(segments):
+        if event is not None:
+            entries.append(_entry(event.start, event.duration, event.session, kind=event.kind))
+            continue
+
+        now = start
+        while position < len(queue) and now < end:
+            block = queue[position]
+            if remaining <= 0:
+                position += 1
+                remaining = queue[position].duration if position < len(queue) else 0
+                continue
+            if not block.splittable and remaining > end - now:
+                if remaining > longest_after[i + 1]:
+                    unplaced.append((block.session, remaining))
+                    position += 1
+                    remaining = queue[position].duration if position < len(queue) else 0
+                    continue
+                break  # Wait for a later gap that is long enough
+            minutes = min(remaining, end - now)
+            entries.append(_entry(now, minutes, block.session, module=block.module))
+            now += minutes
+            remaining -= minutes
+
+        if now < end and (fill_from is None or end > fill_from):
+            entries.append(_entry(now, end - now, last_filler if i == last_gap else filler))
+
+    # Whatever is still queued did not fit before the end of the day
+    if position < len(queue):
+        if remaining > 0:
+            unplaced.append((queue[position].session, remaining))
+        position += 1
+    for block in queue[position:]:
+        if block.duration > 0:
+            unplaced.append((block.session, block.duration))
+
+    return Layout(entries, unplaced, conflicts)
@@ -0,0 +1,407 @@
+"""
+Stage-level tracing and profiling for the FASTR tools.
+
+Every tool accepts:
+
+    --trace out.json    Write a Chrome trace-event file with one span per
+                        stage (config load, validation, per-file transform,
+                        pandoc, ...). Open it in chrome://tracing or
+                        https://ui.perfetto.dev
+    --profile [out.prof]
+                        Run under cProfile, print the top functions by
+                        cumulative time and dump the pstats file
+    --memory-report     Track memory with tracemalloc. At every top-level
+                        stage boundary record live and peak traced memory,
+                        RSS and the allocation sites that grew, then print
+                        a per-stage report with peak RSS at the end
+
+Instrumented code wraps stages in `with span("name"):`. Spans cost next to
+nothing while tracing is off. Worker processes record into their own
+tracer (see worker_init / drain) and send their events back with their
+results so the parent can merge them into one trace and one memory report.
+Spans opened in worker threads are traced on their own thread track;
+memory stages are only taken in the main thread.
+"""
+
+import contextlib
+import cProfile
+import json
+import linecache
+import os
+import pstats
+import sys
+import sysconfig
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_PROFILE_PATH = 'fastr.prof'
+PROFILE_TOP_N = 25
+
+# Spans nested deeper than this are not memory stage boundaries
+# (0 = "total" or a worker's outermost span, 1 = the stages inside it)
+MEMORY_STAGE_DEPTH = 1
+MEMORY_SITES_PER_STAGE = 3
+MEMORY_REPORT_TOP_SITES = 10
+MEMORY_MIN_SITE_BYTES = 1024
+# Frames kept per allocation, so stdlib/library allocations (f.read()
+# decoding, yaml parsing) can be charged to the FASTR line that caused them
+MEMORY_TRACE_FRAMES = 16
+
+_LIBRARY_DIRS = tuple(os.path.join(os.path.abspath(path), '') for path in
+                      {sysconfig.get_paths()[key] for key in ('stdlib', 'platstdlib', 'purelib', 'platlib')})
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# MEMORY
+# ═══════════════════════════════════════════════════════════════════════
+
+def current_rss():
+    """Resident set size of this process in bytes, or None if unknown"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def peak_rss(children=False):
+    """
+    Peak resident set size in bytes of this process, or of the largest
+    finished child process (children=True). None if unknown.
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+
+
+def _allocation_site(traceback):
+    """The innermost frame outside the standard library and installed packages"""
+    for frame in reversed(traceback):  # Innermost frame last
+        filename = frame.filename
+        path = os.path.abspath(filename)
+        if (not filename.startswith('<') and not path.startswith(_LIBRARY_DIRS)
+                and f"{os.sep}site-packages{os.sep}" not in path):
+            return frame
+    return traceback[-1]
+
+
+def format_bytes(size):
+    """Human-readable size, e.g. '12.3 MB'"""
+    if size is None:
+        return "-"
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    if size < 1024:
+        return f"{sign}{size} B"
+    for unit in ('KB', 'MB', 'GB'):
+        size /= 1024
+        if size < 1024 or unit == 'GB':
+            return f"{sign}{size:.1f} {unit}"
+
+
+class MemoryTracker:
+    """
+    Per-stage memory statistics taken at span boundaries.
+
+    For each stage it records the traced memory still live at the end, the
+    traced peak reached inside it (nested stages included), the growth of
+    live memory, RSS, and the source lines whose live allocations grew the
+    most between the start and end of the stage. Temporaries freed before
+    the stage ends (split line lists, a joined deck string) show up in the
+    peak but not among the sites.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.rows = []
+        self._stack = []
+        self._filters = [tracemalloc.Filter(False, tracemalloc.__file__, all_frames=True),
+                         tracemalloc.Filter(False, __file__)]
+
+    def start(self):
+        self.enabled = True
+        self._stack = []
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(MEMORY_TRACE_FRAMES)
+
+    def stop(self):
+        self.enabled = False
+        tracemalloc.stop()
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def _fold_peak(self):
+        """Credit the peak since the last reset to the innermost open stage, then reset it"""
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+        # Python < 3.9 cannot reset the peak; stages then report the run's peak so far
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        return current
+
+    def enter(self):
+        """Open a stage"""
+        current = self._fold_peak()
+        self._stack.append({'start': current, 'peak': current, 'started': time.perf_counter(),
+                            'snapshot': self._snapshot()})
+
+    def exit(self, name, depth):
+        """Close the innermost stage and record its row"""
+        current = self._fold_peak()
+        frame = self._stack.pop()
+        if self._stack:
+            self._stack[-1]['peak'] = max(self._stack[-1]['peak'], frame['peak'])
+
+        growth = {}
+        for stat in self._snapshot().compare_to(frame['snapshot'], 'traceback'):
+            if stat.size_diff:
+                where = _allocation_site(stat.traceback)
+                key = (where.filename, where.lineno)
+                growth[key] = growth.get(key, 0) + stat.size_diff
+        sites = []
+        for (filename, lineno), size in sorted(growth.items(), key=lambda item: -item[1]):
+            if size < MEMORY_MIN_SITE_BYTES or len(sites) == MEMORY_SITES_PER_STAGE:
+                break
+            sites.append({
+                'site': f"{os.path.basename(filename)}:{lineno}",
+                'code': linecache.getline(filename, lineno).strip()[:60],
+                'size': size,
+            })
+
+        self.rows.append({
+            'name': name,
+            'depth': depth,
+            'pid': os.getpid(),
+            'started': frame['started'],
+            'peak': frame['peak'],
+            'delta': current - frame['start'],
+            'rss': current_rss(),
+            'peak_rss': peak_rss(),
+            'sites': sites,
+        })
+
+    def drain(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def report(self):
+        """Print the per-stage table, peak RSS and the top allocation sites"""
+        if not self.rows:
+            return
+        me = os.getpid()
+        # Rows are recorded as stages close; show each process's stages in start order
+        rows = sorted(self.rows, key=lambda row: (row['pid'] != me, row['pid'], row['started']))
+        width = min(48, max(len('Stage'), max(len(row['name']) + 2 * row['depth'] for row in rows)))
+
+        print("\n" + "=" * 70)
+        print("                    MEMORY REPORT")
+        print("=" * 70 + "\n")
+        print(f"   {'Stage'.ljust(width)}  {'Peak':>10}  {'Live +/-':>10}  {'RSS':>10}")
+        print(f"   {'-' * width}  {'-' * 10}  {'-' * 10}  {'-' * 10}")
+        pid = me
+        for row in rows:
+            if row['pid'] != pid:
+                pid = row['pid']
+                print(f"   [worker {pid}]")
+            name = ("  " * row['depth'] + row['name'])[:width]
+            print(f"   {name.ljust(width)}  {format_bytes(row['peak']):>10}  "
+                  f"{format_bytes(row['delta']):>10}  {format_bytes(row['rss']):>10}")
+
+        print(f"\n   Peak RSS: {format_bytes(peak_rss())} (this process)")
+        workers = {}
+        for row in rows:
+            if row['pid'] != me and row['peak_rss']:
+                workers[row['pid']] = max(workers.get(row['pid'], 0), row['peak_rss'])
+        for worker, size in sorted(workers.items()):
+            print(f"             {format_bytes(size)} (worker {worker})")
+        children = peak_rss(children=True)
+        if children:
+            print(f"             {format_bytes(children)} (largest finished child process)")
+
+        # Outermost spans repeat the sites of the stages inside them
+        sites = {}
+        for row in rows:
+            if row['depth'] < MEMORY_STAGE_DEPTH:
+                continue
+            for site in row['sites']:
+                key = (site['site'], row['name'])
+                if site['size'] > sites.get(key, (0, ''))[0]:
+                    sites[key] = (site['size'], site['code'])
+        if not sites:
+            for row in rows:
+                for site in row['sites']:
+                    sites.setdefault((site['site'], row['name']), (site['size'], site['code']))
+        top = sorted(sites.items(), key=lambda item: -item[1][0])[:MEMORY_REPORT_TOP_SITES]
+        if top:
+            print("\n   Top allocation sites (still live at the end of a stage):")
+            for (site, stage), (size, code) in top:
+                print(f"   {format_bytes(size):>10}  {site}  [{stage}]")
+                if code:
+                    print(f"               {code}")
+
+        print("\n   Peak/Live are traced Python allocations; RSS includes tracemalloc's own overhead.")
+        print("=" * 70 + "\n")
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# TRACING
+# ═══════════════════════════════════════════════════════════════════════
+
+class Tracer:
+    """Collects complete ('X') trace events while enabled."""
+
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.memory = MemoryTracker()
+        self._local = threading.local()
+
+    @property
+    def depth(self):
+        """Nesting level of the current thread's open spans"""
+        return getattr(self._local, 'depth', 0)
+
+    @depth.setter
+    def depth(self, value):
+        self._local.depth = value
+
+    @contextlib.contextmanager
+    def span(self, name, category='fastr', **args):
+        """Record the duration of the enclosed block as one event"""
+        if not self.enabled and not self.memory.enabled:
+            yield
+            return
+        depth = self.depth
+        track_memory = (self.memory.enabled and depth <= MEMORY_STAGE_DEPTH
+                        and threading.current_thread() is threading.main_thread())
+        if track_memory:
+            self.memory.enter()
+        self.depth = depth + 1
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.depth = depth
+            if track_memory:
+                self.memory.exit(name, depth)
+            if self.enabled:
+                self._record(name, category, start, end, args)
+
+    def _record(self, name, category, start, end, args):
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': start / 1000,
+            'dur': (end - start) / 1000,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        }
+        if args:
+            event['args'] = {key: str(value) for key, value in args.items()}
+        self.events.append(event)
+
+    def drain(self):
+        """Return and forget what was recorded so far (for worker processes)"""
+        events, self.events = self.events, []
+        return {'events': events, 'memory': self.memory.drain()}
+
+    def merge(self, recorded):
+        """Add what drain() returned in another process"""
+        if self.enabled:
+            self.events.extend(recorded['events'])
+        if self.memory.enabled:
+            self.memory.rows.extend(recorded['memory'])
+
+    def write(self, path):
+        """Write the events in Chrome trace-event JSON format"""
+        events = sorted(self.events, key=lambda event: event['ts'])
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+TRACER = Tracer()
+
+
+def span(name, category='fastr', **args):
+    """Trace a stage: `with span("validation"):`"""
+    return TRACER.span(name, category, **args)
+
+
+def worker_settings():
+    """initargs for worker_init() that match this process"""
+    return TRACER.enabled, TRACER.memory.enabled
+
+
+def worker_init(enabled, memory=False):
+    """Pool initializer: turn tracing / memory tracking on in a worker if the parent has them"""
+    TRACER.enabled = enabled
+    TRACER.events = []
+    TRACER.depth = 0
+    if memory:
+        TRACER.memory.start()
+
+
+def add_tracing_arguments(parser):
+    """Add --trace, --profile and --memory-report to an argparse parser"""
+    parser.add_argument(
+        '--trace',
+        metavar='OUT.json',
+        help='Write stage timings as a Chrome trace-event file'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const=DEFAULT_PROFILE_PATH,
+        metavar='OUT.prof',
+        help=f'Run under cProfile and dump pstats (default file: {DEFAULT_PROFILE_PATH})'
+    )
+    parser.add_argument(
+        '--memory-report',
+        action='store_true',
+        help='Track memory per stage with tracemalloc; report peaks, RSS and top allocation sites'
+    )
+
+
+def run_instrumented(func, trace_path=None, profile_path=None, memory_report=False):
+    """
+    Call func() with tracing, profiling and/or memory tracking enabled as requested.
+
+    Outputs are written even if func() exits with SystemExit, which the
+    tools use to report their exit status.
+    """
+    if trace_path:
+        TRACER.enabled = True
+    if memory_report:
+        TRACER.memory.start()
+    profiler = cProfile.Profile() if profile_path else None
+
+    try:
+        if profiler:
+            profiler.enable()
+        with span("total"):
+            return func()
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+            print(f"\n📈 Profile written: {profile_path}")
+            stats = pstats.Stats(profiler)
+            stats.sort_stats('cumulative').print_stats(PROFILE_TOP_N)
+        if trace_path:
+            TRACER.write(trace_path)
+            print(f"\n📈 Trace written: {trace_path} (open in chrome://tracing or ui.perfetto.dev)")
+        if memory_report:
+            TRACER.memory.report()
+            TRACER.memory.stop()